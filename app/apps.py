@@ -4,3 +4,18 @@ from django.apps import AppConfig
 class AppConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "app"
+
+    def ready(self):
+        from django.contrib.auth import get_user_model
+        from django.db.backends.signals import connection_created
+        from django.db.models.signals import post_delete, post_save
+
+        from .backends import invalidate_cached_user
+        from .instrumentation import install_query_dispatcher
+        from .sqlite import configure_sqlite
+
+        connection_created.connect(install_query_dispatcher)
+        connection_created.connect(configure_sqlite)
+
+        post_save.connect(invalidate_cached_user, sender=get_user_model())
+        post_delete.connect(invalidate_cached_user, sender=get_user_model())
@@ -0,0 +1,82 @@
+from functools import wraps
+
+from django.contrib.auth.decorators import login_required
+from django.shortcuts import aget_object_or_404, render
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition
+
+from .conditional import (
+    aprefetch_event_detail_validators,
+    aprefetch_events_validators,
+    event_detail_etag,
+    event_detail_last_modified,
+    events_etag,
+    events_last_modified,
+)
+from .models import Event
+from .pagination import InvalidCursor, apaginate_events, get_page_size
+from .query_budget import query_budget
+
+# Versiones async de las vistas de solo lectura de views.py, para el despliegue
+# ASGI (ver ASYNC_VIEWS en settings). Ninguna toca el ORM de forma síncrona.
+
+
+def resolve_user_and_validators(prefetch=None):
+    """
+    Resuelve request.user y, opcionalmente, los valores que usa condition()
+    antes de llamar a la vista, porque condition() y los templates los leen
+    de forma síncrona.
+    """
+
+    def decorator(view_func):
+        @wraps(view_func)
+        async def inner(request, *args, **kwargs):
+            request.user = await request.auser()
+            if prefetch is not None:
+                await prefetch(request, *args, **kwargs)
+            return await view_func(request, *args, **kwargs)
+
+        return inner
+
+    return decorator
+
+
+@query_budget(2)
+@resolve_user_and_validators()
+async def home(request):
+    return render(request, "home.html")
+
+
+@query_budget(4)
+@login_required
+@cache_control(private=True, no_cache=True)
+@resolve_user_and_validators(aprefetch_events_validators)
+@condition(etag_func=events_etag, last_modified_func=events_last_modified)
+async def events(request):
+    page_size = get_page_size(request.GET.get("page_size"))
+
+    try:
+        page = await apaginate_events(Event.objects.all(), request.GET.get("cursor"), page_size)
+    except InvalidCursor:
+        page = await apaginate_events(Event.objects.all(), None, page_size)
+
+    return render(
+        request,
+        "app/events.html",
+        {
+            "events": page.items,
+            "page": page,
+            "page_size": page_size,
+            "user_is_organizer": request.user.is_organizer,
+        },
+    )
+
+
+@query_budget(4)
+@login_required
+@cache_control(private=True, no_cache=True)
+@resolve_user_and_validators(aprefetch_event_detail_validators)
+@condition(etag_func=event_detail_etag, last_modified_func=event_detail_last_modified)
+async def event_detail(request, id):
+    event = await aget_object_or_404(Event.objects.select_related("organizer"), pk=id)
+    return render(request, "app/event_detail.html", {"event": event})
@@ -0,0 +1,60 @@
+from django.conf import settings
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import cache
+from django.core.exceptions import PermissionDenied
+
+from .routers import replica_reads
+
+
+def user_cache_key(user_id):
+    return f"auth:user:{user_id}"
+
+
+class CachedModelBackend(ModelBackend):
+    """
+    ModelBackend que guarda en el cache el usuario que carga
+    AuthenticationMiddleware en cada request. La entrada se borra cuando se
+    guarda o se elimina la fila del usuario (invalidate_cached_user); los
+    UPDATE masivos con QuerySet.update() no mandan esas señales. El usuario
+    que se guarda se lee siempre de la primaria.
+    """
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        user = super().authenticate(request, username, password, **kwargs)
+
+        # ModelBackend sigue en AUTHENTICATION_BACKENDS solo por las sesiones viejas;
+        # repetiría la misma verificación con otro hash, así que el rechazo es final
+        if user is None and password is not None:
+            raise PermissionDenied
+
+        return user
+
+    def get_user(self, user_id):
+        key = user_cache_key(user_id)
+        user = cache.get(key)
+
+        if user is None:
+            # De la primaria: una réplica atrasada dejaría en el cache la fila de antes del
+            # cambio (contraseña, rol, is_active) que acaba de invalidarlo
+            with replica_reads(False):
+                user = super().get_user(user_id)
+            if user is not None:
+                cache.set(key, user, getattr(settings, "AUTH_USER_CACHE_TIMEOUT", 5))
+
+        return user
+
+    async def aget_user(self, user_id):
+        key = user_cache_key(user_id)
+        user = await cache.aget(key)
+
+        if user is None:
+            with replica_reads(False):
+                user = await super().aget_user(user_id)
+            if user is not None:
+                await cache.aset(key, user, getattr(settings, "AUTH_USER_CACHE_TIMEOUT", 5))
+
+        return user
+
+
+def invalidate_cached_user(sender, instance, **kwargs):
+    cache.delete(user_cache_key(instance.pk))
@@ -0,0 +1,66 @@
+import datetime
+
+from django.conf import settings
+from django.utils import timezone
+
+from .export import parse_date
+from .models import MAX_ID
+
+
+class InvalidBulkAction(ValueError):
+    pass
+
+
+def parse_ids(values):
+    try:
+        ids = {int(value) for value in values}
+    except (TypeError, ValueError) as e:
+        raise InvalidBulkAction("ids: se esperan números de evento") from e
+
+    # Un id fuera del INTEGER de SQLite hace fallar el pk__in con OverflowError
+    if any(not 1 <= pk <= MAX_ID for pk in ids):
+        raise InvalidBulkAction("ids: se esperan números de evento")
+
+    maximum = getattr(settings, "EVENTS_BULK_MAX_IDS", 1000)
+    if len(ids) > maximum:
+        raise InvalidBulkAction(f"ids: se pueden seleccionar hasta {maximum} eventos")
+
+    return sorted(ids)
+
+
+def parse_delta(data):
+    try:
+        delta = datetime.timedelta(
+            days=int(data.get("days") or 0),
+            hours=int(data.get("hours") or 0),
+            minutes=int(data.get("minutes") or 0),
+        )
+    except (ValueError, OverflowError) as e:
+        raise InvalidBulkAction("days, hours y minutes tienen que ser números enteros") from e
+
+    if not delta:
+        raise InvalidBulkAction("Indicar cuántos días, horas o minutos mover los eventos")
+
+    # Un desplazamiento enorme no entra en la aritmética de fechas de la base
+    max_days = getattr(settings, "EVENTS_BULK_MAX_DELTA_DAYS", 3650)
+    if abs(delta) > datetime.timedelta(days=max_days):
+        raise InvalidBulkAction(f"Se pueden mover los eventos hasta {max_days} días")
+
+    return delta
+
+
+def parse_range(data):
+    """Rango de fechas [from, to] como datetimes; el día de "to" se incluye completo"""
+    start = end = None
+
+    try:
+        if data.get("from"):
+            start = datetime.datetime.combine(parse_date(data["from"], "from"), datetime.time.min)
+            start = timezone.make_aware(start)
+        if data.get("to"):
+            end = datetime.datetime.combine(parse_date(data["to"], "to"), datetime.time.min)
+            end = timezone.make_aware(end + datetime.timedelta(days=1))
+    except (ValueError, OverflowError) as e:
+        raise InvalidBulkAction(str(e)) from e
+
+    return start, end
@@ -0,0 +1,71 @@
+import threading
+import time
+from collections import OrderedDict
+
+from .models import EventsVersion
+
+
+def get_events_version():
+    """
+    Marca de la última escritura de eventos para claves de cache. Sale de
+    EventsVersion, que mantienen los triggers de la base, así que la ve igual
+    cualquier proceso; incluye el momento del cambio para que un flush, que
+    reinicia el contador, no repita una marca anterior.
+    """
+    version, changed_at = EventsVersion.current()
+    return f"{version}-{changed_at.timestamp() if changed_at else 0}"
+
+
+def event_row_cache_key(event, user_is_organizer):
+    # Sin la versión global: una escritura sólo invalida las filas que cambió
+    updated_at = event.updated_at.timestamp() if event.updated_at else ""
+    return f"events:row:{event.id}:{updated_at}:{int(bool(user_is_organizer))}"
+
+
+class LocalLRUCache:
+    """
+    Cache en memoria del proceso, con tamaño máximo y vencimiento. Sirve de
+    primer nivel delante del cache compartido para datos que se leen en cada
+    request; lo que se guarda acá puede quedar desactualizado hasta `timeout`
+    segundos respecto de otros procesos.
+    """
+
+    def __init__(self, maxsize, timeout):
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+
+            if entry is None:
+                return None
+
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + self.timeout)
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
@@ -0,0 +1,124 @@
+import calendar
+import datetime
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from .cache import get_events_version
+from .models import Event
+from .routers import replica_reads
+
+# Días que se pueden mostrar: uno de margen en cada punta para que el comienzo
+# del día en cualquier zona horaria se pueda pasar a UTC sin salirse de datetime
+MIN_DAY = datetime.date.min + datetime.timedelta(days=1)
+MAX_DAY = datetime.date.max - datetime.timedelta(days=1)
+
+
+class InvalidCalendarDate(ValueError):
+    pass
+
+
+def month_in_range(month):
+    """Si la grilla del mes, de lunes a domingo, queda entre MIN_DAY y MAX_DAY"""
+    first = month.toordinal()
+    last = first + calendar.monthrange(month.year, month.month)[1] - 1
+    start = first - month.weekday()
+    end = last + 6 - datetime.date.fromordinal(last).weekday()
+
+    return MIN_DAY.toordinal() <= start and end <= MAX_DAY.toordinal()
+
+
+def parse_month(value):
+    """Primer día del mes de un valor AAAA-MM; sin valor, el mes actual"""
+    if not value:
+        return timezone.localdate().replace(day=1)
+
+    try:
+        month = datetime.date.fromisoformat(f"{value}-01")
+    except ValueError as e:
+        raise InvalidCalendarDate("month: se espera un mes AAAA-MM") from e
+
+    if not month_in_range(month):
+        raise InvalidCalendarDate("month: fuera del rango del calendario")
+
+    return month
+
+
+def parse_day(value):
+    try:
+        day = datetime.date.fromisoformat(value)
+    except ValueError as e:
+        raise InvalidCalendarDate("Se espera una fecha AAAA-MM-DD") from e
+
+    if not MIN_DAY <= day <= MAX_DAY:
+        raise InvalidCalendarDate("Fecha fuera del rango del calendario")
+
+    return day
+
+
+def shift_month(month, months):
+    """Primer día del mes `months` meses después; None si queda fuera del calendario"""
+    index = month.year * 12 + month.month - 1 + months
+    if not datetime.MINYEAR <= index // 12 <= datetime.MAXYEAR:
+        return None
+
+    shifted = datetime.date(index // 12, index % 12 + 1, 1)
+    return shifted if month_in_range(shifted) else None
+
+
+def day_start(day):
+    return timezone.make_aware(datetime.datetime.combine(day, datetime.time.min))
+
+
+def day_counts(start, end):
+    """
+    Eventos por día entre dos fechas (end excluida) con un solo GROUP BY sobre
+    el rango de scheduled_at, que resuelve el índice (scheduled_at, id).
+    """
+    rows = (
+        Event.objects.filter(scheduled_at__gte=day_start(start), scheduled_at__lt=day_start(end))
+        .annotate(day=TruncDate("scheduled_at", tzinfo=timezone.get_current_timezone()))
+        .values("day")
+        .annotate(count=Count("id"))
+        .order_by()
+    )
+    return {row["day"]: row["count"] for row in rows}
+
+
+def month_grid(month):
+    """
+    Semanas del mes como listas de (día, cantidad de eventos, si es del mes).
+    Se guarda en cache por mes y versión de eventos: cualquier escritura
+    cambia la versión y el próximo pedido vuelve a contar. La versión y los
+    conteos se leen de la primaria: lo que queda en el cache lo ven todos, y
+    una réplica atrasada dejaría conteos viejos bajo la versión nueva.
+    """
+    with replica_reads(False):
+        key = f"events:calendar:{get_events_version()}:{month:%Y-%m}"
+        weeks = cache.get(key)
+
+        if weeks is None:
+            days = calendar.Calendar().monthdatescalendar(month.year, month.month)
+            counts = day_counts(days[0][0], days[-1][-1] + datetime.timedelta(days=1))
+            weeks = [
+                [(day, counts.get(day, 0), day.month == month.month) for day in week]
+                for week in days
+            ]
+            cache.set(key, weeks, getattr(settings, "EVENTS_CALENDAR_CACHE_TIMEOUT", 3600))
+
+    return weeks
+
+
+def day_events(day, limit):
+    """Eventos de un día en orden, hasta `limit`; se piden al abrir el día en el calendario"""
+    return list(
+        Event.objects.filter(
+            scheduled_at__gte=day_start(day),
+            scheduled_at__lt=day_start(day + datetime.timedelta(days=1)),
+        )
+        .order_by("scheduled_at", "id")
+        .only("id", "title", "scheduled_at")[:limit]
+    )
@@ -0,0 +1,78 @@
+import hashlib
+
+from .models import Event, EventsVersion
+
+
+def _client_state(request):
+    """
+    Lo que además de los eventos cambia el HTML: el usuario, su rol (los
+    organizadores ven acciones extra) y el secreto CSRF de los formularios.
+    """
+    user = request.user
+    return [str(user.pk), str(int(user.is_organizer)), request.META.get("CSRF_COOKIE", "")]
+
+
+def _make_etag(parts):
+    return hashlib.sha256("|".join(parts).encode()).hexdigest()
+
+
+def _events_version(request):
+    # condition() pide el ETag y el Last-Modified por separado; se consulta una sola vez.
+    # La versión vive en la base, así que un cambio hecho en otro proceso se ve igual.
+    if not hasattr(request, "_events_version"):
+        request._events_version = EventsVersion.current()
+
+    return request._events_version
+
+
+async def aprefetch_events_validators(request):
+    """Versión async: deja leída la versión antes de que condition() la pida"""
+    if not hasattr(request, "_events_version"):
+        request._events_version = await EventsVersion.acurrent()
+
+
+def events_etag(request):
+    version, changed_at = _events_version(request)
+    return _make_etag(
+        [
+            "events",
+            str(version),
+            changed_at.isoformat() if changed_at else "",
+            request.GET.urlencode(),
+            *_client_state(request),
+        ]
+    )
+
+
+def events_last_modified(request):
+    # Los triggers la mueven en altas, ediciones y borrados
+    return _events_version(request)[1]
+
+
+def _event_updated_at(request, id):
+    if not hasattr(request, "_event_updated_at"):
+        request._event_updated_at = (
+            Event.objects.filter(pk=id).values_list("updated_at", flat=True).first()
+        )
+
+    return request._event_updated_at
+
+
+async def aprefetch_event_detail_validators(request, id):
+    if not hasattr(request, "_event_updated_at"):
+        request._event_updated_at = (
+            await Event.objects.filter(pk=id).values_list("updated_at", flat=True).afirst()
+        )
+
+
+def event_detail_etag(request, id):
+    updated_at = _event_updated_at(request, id)
+
+    if updated_at is None:
+        return None
+
+    return _make_etag(["event", str(id), updated_at.isoformat(), *_client_state(request)])
+
+
+def event_detail_last_modified(request, id):
+    return _event_updated_at(request, id)
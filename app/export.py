@@ -0,0 +1,127 @@
+import csv
+import datetime
+import json
+
+from django.conf import settings
+from django.utils import timezone
+
+from .models import Event
+
+EXPORT_FIELDS = (
+    "id",
+    "title",
+    "description",
+    "scheduled_at",
+    "organizer__username",
+    "created_at",
+    "updated_at",
+)
+
+EXPORT_HEADER = (
+    "id",
+    "title",
+    "description",
+    "scheduled_at",
+    "organizer",
+    "created_at",
+    "updated_at",
+)
+
+
+# Fechas que se aceptan como filtro: un día de margen en cada punta, así sumar el
+# día de "to" o pasar el comienzo del día a UTC no se sale del rango de datetime
+MIN_DATE = datetime.date.min + datetime.timedelta(days=1)
+MAX_DATE = datetime.date.max - datetime.timedelta(days=1)
+
+
+class InvalidExportFilter(ValueError):
+    pass
+
+
+def parse_date(value, field):
+    try:
+        date = datetime.date.fromisoformat(value)
+    except ValueError as e:
+        raise InvalidExportFilter(f"{field}: se espera una fecha AAAA-MM-DD") from e
+
+    if not MIN_DATE <= date <= MAX_DATE:
+        raise InvalidExportFilter(f"{field}: fecha fuera de rango")
+
+    return date
+
+
+def export_queryset(organizer=None, date_from=None, date_to=None):
+    queryset = Event.objects.all()
+
+    if organizer:
+        queryset = queryset.filter(organizer__username=organizer)
+
+    if date_from:
+        start = datetime.datetime.combine(parse_date(date_from, "from"), datetime.time.min)
+        queryset = queryset.filter(scheduled_at__gte=timezone.make_aware(start))
+
+    if date_to:
+        # El día de "to" se incluye completo
+        end = datetime.datetime.combine(parse_date(date_to, "to"), datetime.time.min)
+        end += datetime.timedelta(days=1)
+        queryset = queryset.filter(scheduled_at__lt=timezone.make_aware(end))
+
+    return queryset.order_by("scheduled_at", "id")
+
+
+def export_rows(queryset):
+    """
+    Itera las filas como tuplas, de a EVENTS_EXPORT_CHUNK_SIZE por vez, sin
+    instanciar modelos ni cargar el resultado completo en memoria.
+    """
+    chunk_size = getattr(settings, "EVENTS_EXPORT_CHUNK_SIZE", 2000)
+    return queryset.values_list(*EXPORT_FIELDS).iterator(chunk_size=chunk_size)
+
+
+def _isoformat(value):
+    return value.isoformat() if value is not None else None
+
+
+def ndjson_lines(rows):
+    for id, title, description, scheduled_at, organizer, created_at, updated_at in rows:
+        record = {
+            "id": id,
+            "title": title,
+            "description": description,
+            "scheduled_at": _isoformat(scheduled_at),
+            "organizer": organizer,
+            "created_at": _isoformat(created_at),
+            "updated_at": _isoformat(updated_at),
+        }
+        yield json.dumps(record, ensure_ascii=False) + "\n"
+
+
+class Echo:
+    """Buffer que devuelve lo escrito, para que csv.writer genere línea por línea"""
+
+    def write(self, value):
+        return value
+
+
+def csv_lines(rows):
+    writer = csv.writer(Echo())
+    yield writer.writerow(EXPORT_HEADER)
+
+    for id, title, description, scheduled_at, organizer, created_at, updated_at in rows:
+        yield writer.writerow(
+            [
+                id,
+                title,
+                description,
+                _isoformat(scheduled_at),
+                organizer,
+                _isoformat(created_at),
+                _isoformat(updated_at),
+            ]
+        )
+
+
+EXPORT_FORMATS = {
+    "ndjson": (ndjson_lines, "application/x-ndjson; charset=utf-8"),
+    "csv": (csv_lines, "text/csv; charset=utf-8"),
+}
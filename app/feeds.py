@@ -0,0 +1,174 @@
+import datetime
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.urls import reverse
+from django.utils import timezone
+
+from .models import Event, EventsVersion
+
+FEED_FIELDS = (
+    "id",
+    "title",
+    "description",
+    "scheduled_at",
+    "updated_at",
+    "organizer__username",
+)
+
+
+def upcoming_queryset():
+    # Desde el comienzo del día, así el feed cambia a lo sumo una vez por día
+    today = timezone.localtime().replace(hour=0, minute=0, second=0, microsecond=0)
+    return Event.objects.filter(scheduled_at__gte=today)
+
+
+def organizer_queryset(username):
+    return Event.objects.filter(organizer__username=username, organizer__is_organizer=True)
+
+
+def feed_version(request, name):
+    """
+    Versión del feed: cambia con cualquier escritura de eventos (la versión
+    que llevan los triggers de la base) o con el cambio de día. Incluye el
+    esquema y host porque las URLs del feed son absolutas. Se calcula una vez
+    por request.
+    """
+    if not hasattr(request, "_feed_version"):
+        version, changed_at = EventsVersion.current()
+        parts = [
+            name,
+            request.build_absolute_uri("/"),
+            str(version),
+            changed_at.isoformat() if changed_at else "",
+            timezone.localdate().isoformat(),
+        ]
+        today = timezone.localtime().replace(hour=0, minute=0, second=0, microsecond=0)
+        last_modified = max(filter(None, [changed_at, today]))
+        request._feed_version = (
+            hashlib.sha256("|".join(parts).encode()).hexdigest(),
+            last_modified,
+        )
+
+    return request._feed_version
+
+
+def escape_text(value):
+    return (
+        (value or "")
+        .replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def fold(line):
+    """Corta las líneas en 75 octetos como pide RFC 5545"""
+    encoded = line.encode()
+    if len(encoded) <= 75:
+        return line + "\r\n"
+
+    parts = []
+    while encoded:
+        limit = 75 if not parts else 74
+        # No cortar en medio de un caracter UTF-8
+        while limit < len(encoded) and (encoded[limit] & 0xC0) == 0x80:
+            limit -= 1
+        parts.append(encoded[:limit].decode())
+        encoded = encoded[limit:]
+
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def format_datetime(value):
+    return value.astimezone(datetime.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def ics_lines(rows, name, event_url, organizer_url):
+    yield fold("BEGIN:VCALENDAR")
+    yield fold("VERSION:2.0")
+    yield fold("PRODID:-//EventHub//EventHub//ES")
+    yield fold("CALSCALE:GREGORIAN")
+    yield fold(f"X-WR-CALNAME:{escape_text(name)}")
+
+    # El feed es público: el ORGANIZER lleva el username y la URL de su feed, nunca
+    # el email. El CN va entre comillas; los usernames de Django no pueden tenerlas.
+    for id, title, description, scheduled_at, updated_at, organizer in rows:
+        lines = [
+            "BEGIN:VEVENT",
+            f"UID:event-{id}@eventhub",
+            f"DTSTAMP:{format_datetime(updated_at)}",
+            f"LAST-MODIFIED:{format_datetime(updated_at)}",
+            f"DTSTART:{format_datetime(scheduled_at)}",
+            f"SUMMARY:{escape_text(title)}",
+            f"DESCRIPTION:{escape_text(description)}",
+            f'ORGANIZER;CN="{organizer}":{organizer_url(organizer)}',
+            f"URL:{event_url(id)}",
+            "END:VEVENT",
+        ]
+
+        yield "".join(fold(line) for line in lines)
+
+    yield fold("END:VCALENDAR")
+
+
+def feed_chunks(request, name, queryset, version):
+    """
+    Devuelve el feed desde la cache si ya se generó para esta versión; si no,
+    lo genera fila por fila y lo guarda en la cache al terminar. Solo se
+    acumula hasta EVENTS_FEED_CACHE_MAX_SIZE caracteres: un feed más grande
+    se sirve en streaming sin guardarse, para no tenerlo entero en memoria.
+    """
+    key = f"feeds:{version}"
+    cached = cache.get(key)
+
+    if cached is not None:
+        yield cached
+        return
+
+    rows = (
+        queryset.order_by("scheduled_at", "id")
+        .values_list(*FEED_FIELDS)
+        .iterator(chunk_size=getattr(settings, "EVENTS_EXPORT_CHUNK_SIZE", 2000))
+    )
+
+    max_size = getattr(settings, "EVENTS_FEED_CACHE_MAX_SIZE", 1024 * 1024)
+    parts = []
+    size = 0
+
+    def event_url(id):
+        return request.build_absolute_uri(reverse("event_detail", args=[id]))
+
+    def organizer_url(username):
+        return request.build_absolute_uri(reverse("organizer_feed", args=[username]))
+
+    for chunk in ics_lines(rows, name, event_url, organizer_url):
+        if parts is not None:
+            size += len(chunk)
+            if size <= max_size:
+                parts.append(chunk)
+            else:
+                parts = None
+        yield chunk
+
+    if parts is not None:
+        cache.set(key, "".join(parts), getattr(settings, "EVENTS_FEED_CACHE_TIMEOUT", 60 * 60))
+
+
+def upcoming_feed_etag(request):
+    return feed_version(request, "upcoming")[0]
+
+
+def upcoming_feed_last_modified(request):
+    return feed_version(request, "upcoming")[1]
+
+
+def organizer_feed_etag(request, username):
+    return feed_version(request, f"organizer:{username}")[0]
+
+
+def organizer_feed_last_modified(request, username):
+    return feed_version(request, f"organizer:{username}")[1]
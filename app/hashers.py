@@ -0,0 +1,17 @@
+from django.conf import settings
+from django.contrib.auth import hashers
+
+
+class PBKDF2PasswordHasher(hashers.PBKDF2PasswordHasher):
+    """
+    PBKDF2 con las iteraciones de PASSWORD_HASHER_ITERATIONS. Mantiene el mismo
+    algoritmo que el de Django, así que los hashes existentes siguen validando;
+    si el valor cambia, must_update() da verdadero y el próximo login correcto
+    vuelve a guardar la contraseña con las iteraciones nuevas.
+    """
+
+    @property
+    def iterations(self):
+        return getattr(
+            settings, "PASSWORD_HASHER_ITERATIONS", hashers.PBKDF2PasswordHasher.iterations
+        )
@@ -0,0 +1,31 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import partial
+
+# Observadores de consultas del request en curso. Se guardan en una ContextVar y
+# no con connection.execute_wrapper() porque las conexiones son por thread: en
+# ASGI el middleware corre en el event loop y el ORM en otro thread, pero la
+# ContextVar viaja con sync_to_async.
+current_query_observers = ContextVar("current_query_observers", default=())
+
+
+def dispatch_execute(execute, sql, params, many, context):
+    for observer in reversed(current_query_observers.get()):
+        execute = partial(observer, execute)
+
+    return execute(sql, params, many, context)
+
+
+def install_query_dispatcher(sender, connection, **kwargs):
+    if dispatch_execute not in connection.execute_wrappers:
+        connection.execute_wrappers.append(dispatch_execute)
+
+
+@contextmanager
+def observe_queries(observer):
+    """Llama a observer(execute, sql, params, many, context) en cada consulta del bloque"""
+    token = current_query_observers.set(current_query_observers.get() + (observer,))
+    try:
+        yield observer
+    finally:
+        current_query_observers.reset(token)
@@ -0,0 +1,88 @@
+import statistics
+import time
+
+from django.conf import settings
+from django.contrib.auth.hashers import get_hasher
+from django.core.management.base import BaseCommand, CommandError
+
+ENV_VARIABLE = "EVENTHUB_PASSWORD_HASHER_ITERATIONS"
+
+# Iteraciones con las que se mide: alcanza para que el tiempo no sea ruido
+PROBE_ITERATIONS = 100_000
+
+
+def measure_hash_time(hasher, iterations, samples):
+    """Mediana en segundos de `samples` hashes con la cantidad de iteraciones dada"""
+    salt = hasher.salt()
+    durations = []
+
+    for _ in range(samples):
+        start = time.perf_counter()
+        hasher.encode("calibration-password", salt, iterations)
+        durations.append(time.perf_counter() - start)
+
+    return statistics.median(durations)
+
+
+def recommend_iterations(seconds_per_iteration, target_ms, minimum):
+    iterations = target_ms / 1000 / seconds_per_iteration
+    # Redondeado a decenas de miles para que el valor no cambie por ruido
+    return max(minimum, round(iterations / 10_000) * 10_000)
+
+
+class Command(BaseCommand):
+    help = (
+        "Mide cuánto tarda el hash de contraseñas en esta máquina y recomienda las "
+        "iteraciones de PBKDF2 para llegar a PASSWORD_HASHER_TARGET_MS."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--target-ms",
+            type=float,
+            default=getattr(settings, "PASSWORD_HASHER_TARGET_MS", 100),
+        )
+        parser.add_argument("--samples", type=int, default=5)
+        parser.add_argument(
+            "--min-iterations",
+            type=int,
+            default=600_000,
+            help="Piso de seguridad (600.000 es lo que recomienda OWASP para PBKDF2-SHA256)",
+        )
+
+    def handle(self, *args, **options):
+        hasher = get_hasher("default")
+
+        if not hasattr(hasher, "iterations"):
+            raise CommandError(f"El hasher {hasher.algorithm} no usa iteraciones")
+        if options["target_ms"] <= 0 or options["samples"] < 1:
+            raise CommandError("--target-ms y --samples tienen que ser mayores a 0")
+
+        probe = measure_hash_time(hasher, PROBE_ITERATIONS, options["samples"])
+        recommended = recommend_iterations(
+            probe / PROBE_ITERATIONS, options["target_ms"], options["min_iterations"]
+        )
+        current = measure_hash_time(hasher, hasher.iterations, 1)
+        expected = measure_hash_time(hasher, recommended, 1)
+
+        self.stdout.write(
+            f"{hasher.algorithm}: {hasher.iterations} iteraciones tardan {current * 1000:.0f} ms"
+        )
+        self.stdout.write(
+            f"Recomendado para {options['target_ms']:.0f} ms: {recommended} iteraciones "
+            f"({expected * 1000:.0f} ms)"
+        )
+
+        if recommended == options["min_iterations"]:
+            self.stdout.write(
+                self.style.WARNING(
+                    "El objetivo queda por debajo del mínimo de iteraciones; se usa el mínimo"
+                )
+            )
+
+        # settings.py lee la variable del entorno del proceso; se deja lista para copiar
+        self.stdout.write(
+            "Para usarlo, definir en el entorno del servidor (las contraseñas se vuelven a "
+            "hashear en el próximo login de cada usuario):"
+        )
+        self.stdout.write(self.style.SUCCESS(f"export {ENV_VARIABLE}={recommended}"))
@@ -0,0 +1,257 @@
+import csv
+import datetime
+import json
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from app.models import MAX_ID, Event, User
+
+FORMATS = ("csv", "json", "ndjson")
+
+
+def iter_json_array(stream, chunk_size=64 * 1024):
+    """
+    Lee un array JSON elemento por elemento sin cargar el archivo completo.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    started = False
+
+    while True:
+        chunk = stream.read(chunk_size)
+        buffer += chunk
+        pos = 0
+
+        while True:
+            while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+                pos += 1
+
+            if not started:
+                if pos == len(buffer):
+                    break
+                if buffer[pos] != "[":
+                    raise CommandError("Se esperaba un array JSON")
+                started = True
+                pos += 1
+                continue
+
+            if pos < len(buffer) and buffer[pos] == "]":
+                return
+
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if not chunk:
+                    raise CommandError("JSON incompleto")
+                break
+
+            yield item
+            pos = end
+
+        buffer = buffer[pos:]
+
+        if not chunk:
+            if buffer.strip():
+                raise CommandError("JSON incompleto")
+            return
+
+
+def iter_records(stream, format):
+    if format == "csv":
+        yield from csv.DictReader(stream)
+    elif format == "ndjson":
+        for line in stream:
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                # Se rechaza solo esta línea, no la importación entera
+                yield line.rstrip("\n")
+    else:
+        yield from iter_json_array(stream)
+
+
+def normalize_record(record):
+    # Acepta también el formato de fixtures de Django (fixtures/events.json)
+    if "fields" in record and isinstance(record["fields"], dict):
+        return record["fields"]
+    return record
+
+
+class Command(BaseCommand):
+    help = (
+        "Importa eventos desde CSV, JSON o NDJSON con inserts por lotes. Las filas "
+        "inválidas se escriben en el archivo de errores sin cortar la importación."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Archivo a importar, o - para leer de stdin")
+        parser.add_argument("--format", choices=FORMATS, help="Por defecto, según la extensión")
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--errors", help="Archivo NDJSON donde se escriben las filas rechazadas"
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        format = options["format"] or path.rsplit(".", 1)[-1].lower()
+        if format not in FORMATS:
+            raise CommandError("No se reconoce el formato, indicarlo con --format")
+
+        batch_size = options["batch_size"]
+        if batch_size < 1:
+            raise CommandError("--batch-size tiene que ser mayor a 0")
+
+        self.verbosity = options["verbosity"]
+        self.organizers = {}
+        self.imported = 0
+        self.rejected = 0
+
+        # utf-8-sig descarta el BOM que agrega Excel: si no, el primer encabezado
+        # del CSV sería "\ufefftitle" y se rechazarían todas las filas
+        try:
+            stream = sys.stdin if path == "-" else open(path, newline="", encoding="utf-8-sig")
+        except OSError as e:
+            raise CommandError(f"No se pudo abrir el archivo: {e}") from e
+
+        try:
+            self.errors_file = (
+                open(options["errors"], "w", encoding="utf-8") if options["errors"] else None
+            )
+        except OSError as e:
+            if stream is not sys.stdin:
+                stream.close()
+            raise CommandError(f"No se pudo crear el archivo de errores: {e}") from e
+
+        start = time.perf_counter()
+
+        try:
+            batch = []
+            for number, record in enumerate(iter_records(stream, format), start=1):
+                batch.append((number, record))
+                if len(batch) >= batch_size:
+                    self.import_batch(batch)
+                    batch = []
+            if batch:
+                self.import_batch(batch)
+        except (json.JSONDecodeError, csv.Error) as e:
+            raise CommandError(f"No se pudo leer el archivo: {e}") from e
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+            if self.errors_file:
+                self.errors_file.close()
+
+        elapsed = time.perf_counter() - start
+        rate = self.imported / elapsed if elapsed > 0 else 0
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{self.imported} eventos importados, {self.rejected} rechazados "
+                f"en {elapsed:.2f}s ({rate:.0f} filas/s)"
+            )
+        )
+
+    def resolve_organizers(self, records):
+        keys = {
+            str(normalize_record(r).get("organizer", "")) for _, r in records if isinstance(r, dict)
+        }
+        missing = keys - self.organizers.keys()
+        if not missing:
+            return
+
+        # isdigit() acepta dígitos no ASCII como "²" que int() no convierte
+        ids = [int(key) for key in missing if key.isascii() and key.isdigit()]
+        ids = [pk for pk in ids if pk <= MAX_ID]
+        users = User.objects.filter(Q(username__in=missing) | Q(pk__in=ids), is_organizer=True)
+
+        for user in users:
+            self.organizers[user.username] = user
+            self.organizers[str(user.pk)] = user
+
+        for key in missing:
+            self.organizers.setdefault(key, None)
+
+    def build_event(self, record):
+        if not isinstance(record, dict):
+            return None, {"row": "Se esperaba un objeto JSON"}
+
+        record = normalize_record(record)
+        title = record.get("title") or ""
+        description = record.get("description") or ""
+        scheduled_at = record.get("scheduled_at") or ""
+
+        errors = Event.validate(title, description, scheduled_at)
+
+        # En JSON la fecha puede venir como número u objeto: parse_datetime lanza TypeError
+        try:
+            scheduled_at = parse_datetime(scheduled_at)
+        except (TypeError, ValueError):
+            scheduled_at = None
+        if scheduled_at is None:
+            errors["scheduled_at"] = "Fecha inválida, se espera ISO 8601"
+        else:
+            if timezone.is_naive(scheduled_at):
+                scheduled_at = timezone.make_aware(scheduled_at)
+            # La base guarda la fecha en UTC: cerca de los extremos la conversión se sale de rango
+            try:
+                scheduled_at.astimezone(datetime.timezone.utc)
+            except OverflowError:
+                errors["scheduled_at"] = "Fecha fuera de rango"
+
+        organizer = self.organizers.get(str(record.get("organizer", "")))
+        if organizer is None:
+            errors["organizer"] = "No existe un organizador con ese username o id"
+
+        if errors:
+            return None, errors
+
+        return {
+            "title": title,
+            "description": description,
+            "scheduled_at": scheduled_at,
+            "organizer": organizer,
+        }, None
+
+    def import_batch(self, batch):
+        self.resolve_organizers(batch)
+
+        valid = []
+        for number, record in batch:
+            item, errors = self.build_event(record)
+            if errors:
+                self.reject(number, record, errors)
+            else:
+                valid.append((number, record, item))
+
+        if not valid:
+            return
+
+        try:
+            events, errors = Event.new_many([item for _, _, item in valid])
+        except DatabaseError as e:
+            for number, record, _ in valid:
+                self.reject(number, record, {"database": str(e)})
+            return
+
+        for index, item_errors in errors.items():
+            number, record, _ = valid[index]
+            self.reject(number, record, item_errors)
+
+        self.imported += len(events)
+        if self.verbosity >= 2:
+            self.stdout.write(f"{self.imported} eventos importados")
+
+    def reject(self, number, record, errors):
+        self.rejected += 1
+        if self.errors_file:
+            self.errors_file.write(
+                json.dumps({"record": number, "row": record, "errors": errors}, ensure_ascii=False)
+                + "\n"
+            )
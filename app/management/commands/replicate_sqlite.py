@@ -0,0 +1,57 @@
+import sqlite3
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+def copy_database(source, target_path):
+    """Copia consistente de `source` (conexión sqlite3) en `target_path` con la API de backup"""
+    target = sqlite3.connect(target_path)
+    try:
+        source.backup(target)
+    finally:
+        target.close()
+
+
+class Command(BaseCommand):
+    help = (
+        "Copia la base principal en cada alias de DATABASE_REPLICAS. Reemplaza a la "
+        "replicación para probar el router de réplicas con SQLite en local."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=0,
+            help="Segundos entre copias; con 0 copia una sola vez",
+        )
+
+    def handle(self, *args, **options):
+        replicas = getattr(settings, "DATABASE_REPLICAS", [])
+
+        if not replicas:
+            raise CommandError("No hay réplicas configuradas (EVENTHUB_REPLICA_DB)")
+        if connections[DEFAULT_DB_ALIAS].vendor != "sqlite":
+            raise CommandError("La copia solo funciona con SQLite")
+
+        while True:
+            self.replicate(replicas, options["verbosity"])
+
+            if not options["interval"]:
+                break
+            time.sleep(options["interval"])
+
+    def replicate(self, replicas, verbosity=1):
+        primary = connections[DEFAULT_DB_ALIAS]
+        primary.ensure_connection()
+
+        for alias in replicas:
+            start = time.perf_counter()
+            copy_database(primary.connection, connections[alias].settings_dict["NAME"])
+            # Con --interval se copia cada pocos segundos: el detalle solo con -v 2
+            if verbosity >= 2:
+                elapsed = (time.perf_counter() - start) * 1000
+                self.stdout.write(f"{alias}: copiada en {elapsed:.0f} ms")
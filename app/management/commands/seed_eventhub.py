@@ -0,0 +1,223 @@
+import datetime
+import itertools
+import random
+import time
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from app.models import Event, User, deferred_version_bump
+from app.search import deferred_fts_sync
+
+USERNAME_PREFIX = "seed_"
+
+EVENT_TYPES = ["Concierto", "Festival", "Recital", "Obra", "Charla", "Taller", "Feria", "Muestra"]
+GENRES = [
+    "Jazz",
+    "Rock",
+    "Tango",
+    "Folklore",
+    "Cumbia",
+    "Música Clásica",
+    "Teatro Independiente",
+    "Stand Up",
+    "Cine Nacional",
+    "Arte Digital",
+    "Programación",
+    "Gastronomía",
+]
+VENUES = [
+    "en el Teatro Argentino",
+    "en el Estadio",
+    "en Plaza Moreno",
+    "en el Pasaje Dardo Rocha",
+    "",
+]
+WORDS = (
+    "una noche inolvidable con artistas invitados entradas limitadas apertura de puertas "
+    "show en vivo para toda la familia sonido luces escenario propuesta cultural ciudad "
+    "público especial edición homenaje estreno gira nacional invitados sorpresa"
+).split()
+
+# Día por defecto alrededor del cual se reparten los eventos. Es fijo para que la
+# misma --seed genere los mismos datos sin importar el día en que se corre
+DEFAULT_START_DATE = datetime.date(2025, 6, 1)
+
+# Horarios típicos de eventos: la mayoría a la tarde y a la noche
+HOURS = [10, 12, 15, 17, 18, 19, 20, 21, 22, 23]
+HOUR_WEIGHTS = [2, 2, 3, 4, 8, 10, 14, 14, 10, 5]
+# Más eventos viernes y sábados (lunes = 0)
+WEEKDAY_WEIGHTS = [4, 4, 5, 6, 12, 14, 8]
+
+
+def batched(iterable, size):
+    iterator = iter(iterable)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
+
+
+class Command(BaseCommand):
+    help = (
+        "Genera un dataset sintético y determinístico de usuarios y eventos para "
+        "pruebas de escala, con inserts por lotes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=1000)
+        parser.add_argument("--events", type=int, default=10000)
+        parser.add_argument("--organizer-ratio", type=float, default=0.1)
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument("--password", default="password123")
+        parser.add_argument(
+            "--start-date",
+            type=datetime.date.fromisoformat,
+            default=DEFAULT_START_DATE,
+            help=f"Día alrededor del cual se reparten los eventos (por defecto, {DEFAULT_START_DATE})",
+        )
+        parser.add_argument(
+            "--clear",
+            action="store_true",
+            help=f"Borra antes los usuarios generados (username {USERNAME_PREFIX}*) y sus eventos",
+        )
+
+    def handle(self, *args, **options):
+        users = options["users"]
+        events = options["events"]
+        ratio = options["organizer_ratio"]
+        batch_size = options["batch_size"]
+
+        if not 0 < ratio <= 1:
+            raise CommandError("--organizer-ratio tiene que estar entre 0 y 1")
+        if users < 1 or batch_size < 1:
+            raise CommandError("--users y --batch-size tienen que ser mayores a 0")
+        if events < 0:
+            raise CommandError("--events no puede ser negativo")
+
+        self.verbosity = options["verbosity"]
+        rng = random.Random(options["seed"])
+        start_date = options["start_date"]
+        start = time.perf_counter()
+
+        # Los triggers de EventsVersion se suspenden y la versión se mueve una sola vez
+        with transaction.atomic(), deferred_version_bump():
+            if options["clear"]:
+                # Primero los eventos, que se borran con un solo DELETE
+                Event.objects.filter(organizer__username__startswith=USERNAME_PREFIX).delete()
+                User.objects.filter(username__startswith=USERNAME_PREFIX).delete()
+            elif User.objects.filter(username__startswith=USERNAME_PREFIX).exists():
+                raise CommandError("Ya hay datos generados, usar --clear para reemplazarlos")
+
+            organizer_ids = self.create_users(users, ratio, options["password"], batch_size)
+            self.create_events(rng, events, organizer_ids, start_date, batch_size)
+
+        elapsed = time.perf_counter() - start
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{users} usuarios ({len(organizer_ids)} organizadores) y {events} eventos "
+                f"generados en {elapsed:.2f}s"
+            )
+        )
+
+    def create_users(self, count, ratio, password, batch_size):
+        # Un solo hash para todos: calcular PBKDF2 por usuario llevaría minutos
+        password_hash = make_password(password)
+        organizers = max(1, round(count * ratio))
+        step = count / organizers
+
+        # Organizadores repartidos de forma pareja, determinístico sin usar rng
+        organizer_positions = {int(i * step) for i in range(organizers)}
+
+        users = (
+            User(
+                username=f"{USERNAME_PREFIX}user{i}",
+                email=f"{USERNAME_PREFIX}user{i}@example.com",
+                password=password_hash,
+                is_organizer=i in organizer_positions,
+            )
+            for i in range(count)
+        )
+
+        for batch in batched(users, batch_size):
+            User.objects.bulk_create(batch)
+            self.report("usuarios", len(batch))
+
+        return list(
+            User.objects.filter(username__startswith=USERNAME_PREFIX, is_organizer=True)
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+
+    def create_events(self, rng, count, organizer_ids, start_date, batch_size):
+        # Pocos organizadores concentran la mayoría de los eventos (Zipf)
+        organizer_weights = list(
+            itertools.accumulate(1 / (rank + 1) for rank in range(len(organizer_ids)))
+        )
+
+        # Todos los horarios posibles con su peso, ya convertidos al formato de la
+        # base: se eligen por lote en vez de armar un datetime por fila
+        start = timezone.make_aware(datetime.datetime.combine(start_date, datetime.time.min))
+        slots, slot_weights = [], []
+        for day in range(-180, 366):
+            weekday_weight = WEEKDAY_WEIGHTS[(start_date.weekday() + day) % 7]
+            for hour, hour_weight in zip(HOURS, HOUR_WEIGHTS):
+                for minute in (0, 15, 30, 45):
+                    scheduled_at = start + datetime.timedelta(days=day, hours=hour, minutes=minute)
+                    slots.append(connection.ops.adapt_datetimefield_value(scheduled_at))
+                    slot_weights.append(weekday_weight * hour_weight)
+        slot_weights = list(itertools.accumulate(slot_weights))
+
+        titles = [
+            f"{event_type} de {genre} {venue}".strip()
+            for event_type in EVENT_TYPES
+            for genre in GENRES
+            for venue in VENUES
+        ]
+
+        # Largo de descripción con cola larga: la mayoría cortas, algunas muy largas.
+        # Se arma un conjunto fijo y se elige de ahí para no generar texto por fila.
+        descriptions = []
+        for _ in range(min(count, 10000)):
+            length = min(400, max(3, int(rng.lognormvariate(3, 0.8))))
+            descriptions.append(" ".join(rng.choices(WORDS, k=length)).capitalize() + ".")
+
+        # INSERT directo con executemany: construir instancias y compilar el
+        # bulk_create cuesta más que la propia escritura en SQLite
+        columns = [
+            "title",
+            "description",
+            "scheduled_at",
+            "organizer_id",
+            "created_at",
+            "updated_at",
+        ]
+        sql = (
+            f"INSERT INTO {connection.ops.quote_name(Event._meta.db_table)} "
+            f"({', '.join(connection.ops.quote_name(c) for c in columns)}) "
+            f"VALUES ({', '.join(['%s'] * len(columns))})"
+        )
+        now = connection.ops.adapt_datetimefield_value(timezone.now())
+
+        remaining = count
+        with deferred_fts_sync(), connection.cursor() as cursor:
+            while remaining > 0:
+                n = min(batch_size, remaining)
+                cursor.executemany(
+                    sql,
+                    zip(
+                        rng.choices(titles, k=n),
+                        rng.choices(descriptions, k=n),
+                        rng.choices(slots, cum_weights=slot_weights, k=n),
+                        rng.choices(organizer_ids, cum_weights=organizer_weights, k=n),
+                        itertools.repeat(now, n),
+                        itertools.repeat(now, n),
+                    ),
+                )
+                remaining -= n
+                self.report("eventos", n)
+
+    def report(self, name, count):
+        if self.verbosity >= 2:
+            self.stdout.write(f"{count} {name} insertados")
@@ -0,0 +1,238 @@
+import bisect
+import threading
+import time
+import weakref
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+from django.template.backends.django import DjangoTemplates, Template
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+METRICS = {
+    "eventhub_http_requests_total": ("counter", "Requests atendidos por vista, método y status"),
+    "eventhub_http_request_duration_seconds": ("histogram", "Duración de los requests por vista"),
+    "eventhub_db_queries_total": ("counter", "Consultas a la base de datos por vista"),
+    "eventhub_db_query_duration_seconds_total": ("counter", "Tiempo en la base de datos por vista"),
+    "eventhub_template_render_duration_seconds": (
+        "histogram",
+        "Duración del renderizado de templates por vista",
+    ),
+    "eventhub_login_throttled_total": (
+        "counter",
+        "Intentos de login rechazados por throttling, por IP o por username",
+    ),
+    "eventhub_db_write_retries_total": (
+        "counter",
+        "Escrituras reintentadas porque la base estaba bloqueada, por operación",
+    ),
+}
+
+# El método lo elige el cliente: los que no están acá se cuentan como "other" para
+# que no se pueda crear una serie nueva por request
+HTTP_METHODS = frozenset({"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"})
+
+# Observación del request en curso, para que el backend de templates sepa a qué vista sumar
+current_observation = ContextVar("current_observation", default=None)
+
+
+class RequestObservation:
+    def __init__(self):
+        self.queries = 0
+        self.query_time = 0.0
+        self.render_times = []
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.query_time += time.perf_counter() - start
+
+
+class _ShardHolder:
+    # threading.local no admite weakrefs a un tuple; este objeto muere con el thread
+    __slots__ = ("shard", "__weakref__")
+
+    def __init__(self, shard):
+        self.shard = shard
+
+
+def _merge_shard(counters, histograms, shard):
+    shard_counters, shard_histograms = shard
+
+    # dict.copy() es atómico bajo el GIL aunque el thread dueño siga escribiendo
+    for key, value in shard_counters.copy().items():
+        counters[key] = counters.get(key, 0) + value
+
+    for key, values in shard_histograms.copy().items():
+        merged = histograms.setdefault(key, [0] * len(values))
+        for i, value in enumerate(list(values)):
+            merged[i] += value
+
+
+class MetricsRegistry:
+    """
+    Cada thread escribe en su propio shard sin locks; el lock solo se toma la
+    primera vez que un thread registra su shard, al recolectar y cuando el
+    thread termina y su shard se suma al shard base, para que los threads que
+    van y vienen no hagan crecer la memoria.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._local = threading.local()
+        self._base = ({}, {})
+        self._shards = []
+        self._lock = threading.Lock()
+
+    def _shard(self):
+        holder = getattr(self._local, "holder", None)
+
+        if holder is None:
+            holder = _ShardHolder(({}, {}))
+            with self._lock:
+                self._shards.append(holder.shard)
+            # Al terminar el thread se libera su threading.local y con él el holder
+            weakref.finalize(holder, self._retire, holder.shard)
+            self._local.holder = holder
+
+        return holder.shard
+
+    def _retire(self, shard):
+        with self._lock:
+            # Por identidad: dos shards con el mismo contenido son iguales para list.remove
+            for i, registered in enumerate(self._shards):
+                if registered is shard:
+                    del self._shards[i]
+                    break
+            _merge_shard(*self._base, shard)
+
+    def inc(self, name, labels, value=1):
+        counters, _ = self._shard()
+        key = (name, tuple(sorted(labels.items())))
+        counters[key] = counters.get(key, 0) + value
+
+    def observe(self, name, labels, value):
+        _, histograms = self._shard()
+        key = (name, tuple(sorted(labels.items())))
+
+        histogram = histograms.get(key)
+        if histogram is None:
+            # Un contador por bucket más +Inf, la suma y la cantidad
+            histogram = histograms[key] = [0] * (len(self.buckets) + 1) + [0.0, 0]
+
+        histogram[bisect.bisect_left(self.buckets, value)] += 1
+        histogram[-2] += value
+        histogram[-1] += 1
+
+    def collect(self):
+        counters, histograms = {}, {}
+
+        # El shard base solo cambia con el lock tomado, así que se suma adentro
+        with self._lock:
+            shards = list(self._shards)
+            _merge_shard(counters, histograms, self._base)
+
+        for shard in shards:
+            _merge_shard(counters, histograms, shard)
+
+        return counters, histograms
+
+    def reset(self):
+        with self._lock:
+            for counters, histograms in [self._base, *self._shards]:
+                counters.clear()
+                histograms.clear()
+
+    def record_request(self, view, method, status, duration, observation):
+        self.inc("eventhub_http_requests_total", {"view": view, "method": method, "status": status})
+        self.observe("eventhub_http_request_duration_seconds", {"view": view}, duration)
+        self.inc("eventhub_db_queries_total", {"view": view}, observation.queries)
+        self.inc("eventhub_db_query_duration_seconds_total", {"view": view}, observation.query_time)
+
+        for render_time in observation.render_times:
+            self.observe("eventhub_template_render_duration_seconds", {"view": view}, render_time)
+
+    def render(self):
+        counters, histograms = self.collect()
+        lines = []
+
+        for name, (kind, help_text) in METRICS.items():
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+            if kind == "counter":
+                for (metric, labels), value in sorted(counters.items()):
+                    if metric == name:
+                        lines.append(f"{name}{format_labels(labels)} {format_value(value)}")
+                continue
+
+            for (metric, labels), values in sorted(histograms.items()):
+                if metric != name:
+                    continue
+
+                cumulative = 0
+                for bound, count in zip(self.buckets + (float("inf"),), values):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else format_value(bound)
+                    bucket_labels = labels + (("le", le),)
+                    lines.append(f"{name}_bucket{format_labels(bucket_labels)} {cumulative}")
+
+                lines.append(f"{name}_sum{format_labels(labels)} {format_value(values[-2])}")
+                lines.append(f"{name}_count{format_labels(labels)} {values[-1]}")
+
+        return "\n".join(lines) + "\n"
+
+
+def format_labels(labels):
+    if not labels:
+        return ""
+
+    def escape(value):
+        return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    return "{" + ",".join(f'{key}="{escape(value)}"' for key, value in labels) + "}"
+
+
+def format_value(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+registry = MetricsRegistry(getattr(settings, "METRICS_LATENCY_BUCKETS", DEFAULT_BUCKETS))
+
+
+def metrics_view(request):
+    allowed_ips = getattr(settings, "METRICS_ALLOWED_IPS", None)
+
+    if allowed_ips is not None and request.META.get("REMOTE_ADDR") not in allowed_ips:
+        return HttpResponseForbidden()
+
+    return HttpResponse(registry.render(), content_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+class InstrumentedTemplate(Template):
+    def render(self, context=None, request=None):
+        observation = current_observation.get()
+
+        if observation is None:
+            return super().render(context, request)
+
+        start = time.perf_counter()
+        try:
+            return super().render(context, request)
+        finally:
+            observation.render_times.append(time.perf_counter() - start)
+
+
+class InstrumentedDjangoTemplates(DjangoTemplates):
+    """Backend de templates de Django que mide el tiempo de cada render"""
+
+    def from_string(self, template_code):
+        return InstrumentedTemplate(self.engine.from_string(template_code), self)
+
+    def get_template(self, template_name):
+        template = super().get_template(template_name)
+        return InstrumentedTemplate(template.template, self)
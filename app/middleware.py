@@ -0,0 +1,169 @@
+import time
+from abc import ABC, abstractmethod
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+from .instrumentation import observe_queries
+from .metrics import (
+    HTTP_METHODS,
+    RequestObservation,
+    current_observation,
+    metrics_view,
+    registry,
+)
+from .query_budget import QueryBudgetExceeded, QueryCounter, get_query_budget, logger
+from .routers import replica_aliases, replica_reads, stick_to_primary, sticks_to_primary
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+class SyncAndAsyncMiddleware(ABC):
+    """
+    Base para los middlewares del proyecto: atienden requests síncronos y
+    asíncronos para que las vistas async no pasen por sync_to_async. Las
+    subclases implementan handle() y __acall__().
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return self.handle(request)
+
+    @abstractmethod
+    async def __acall__(self, request): ...
+
+    @abstractmethod
+    def handle(self, request): ...
+
+
+class QueryBudgetMiddleware(SyncAndAsyncMiddleware):
+    """
+    Cuenta las consultas de cada request y, según QUERY_BUDGET_MODE, registra
+    ("log") o lanza QueryBudgetExceeded ("raise") cuando la vista supera su
+    presupuesto o repite la misma consulta más de QUERY_BUDGET_MAX_REPEATS veces.
+    """
+
+    def handle(self, request):
+        if getattr(settings, "QUERY_BUDGET_MODE", "off") == "off":
+            return self.get_response(request)
+
+        with observe_queries(QueryCounter()) as counter:
+            response = self.get_response(request)
+
+        self.check(request, counter)
+        return response
+
+    async def __acall__(self, request):
+        if getattr(settings, "QUERY_BUDGET_MODE", "off") == "off":
+            return await self.get_response(request)
+
+        with observe_queries(QueryCounter()) as counter:
+            response = await self.get_response(request)
+
+        self.check(request, counter)
+        return response
+
+    def check(self, request, counter):
+        match = request.resolver_match
+        budget = get_query_budget(match.func, match.url_name) if match else None
+        problems = counter.problems(budget, getattr(settings, "QUERY_BUDGET_MAX_REPEATS", 3))
+
+        if problems:
+            message = f"{request.method} {request.path}: " + "; ".join(problems)
+            if settings.QUERY_BUDGET_MODE == "raise":
+                raise QueryBudgetExceeded(message)
+            logger.warning(message)
+
+
+class MetricsMiddleware(SyncAndAsyncMiddleware):
+    """
+    Registra cantidad de requests, latencia, consultas y tiempo de templates por
+    nombre de URL. Va primero en MIDDLEWARE para que METRICS_PATH se sirva sin
+    pasar por sesión ni autenticación.
+    """
+
+    def handle(self, request):
+        if request.path == getattr(settings, "METRICS_PATH", "/metrics"):
+            return metrics_view(request)
+
+        observation = RequestObservation()
+        token = current_observation.set(observation)
+        start = time.perf_counter()
+
+        try:
+            with observe_queries(observation):
+                response = self.get_response(request)
+        finally:
+            current_observation.reset(token)
+
+        self.record(request, response, time.perf_counter() - start, observation)
+        return response
+
+    async def __acall__(self, request):
+        if request.path == getattr(settings, "METRICS_PATH", "/metrics"):
+            return metrics_view(request)
+
+        observation = RequestObservation()
+        token = current_observation.set(observation)
+        start = time.perf_counter()
+
+        try:
+            with observe_queries(observation):
+                response = await self.get_response(request)
+        finally:
+            current_observation.reset(token)
+
+        self.record(request, response, time.perf_counter() - start, observation)
+        return response
+
+    def record(self, request, response, duration, observation):
+        # Las URLs que no resuelven se agrupan para no crear una serie por path
+        match = request.resolver_match
+        view = (match.url_name or match.view_name) if match else "unmatched"
+
+        method = request.method if request.method in HTTP_METHODS else "other"
+
+        registry.record_request(view, method, response.status_code, duration, observation)
+
+
+class ReplicaRoutingMiddleware(SyncAndAsyncMiddleware):
+    """
+    Habilita la lectura desde las réplicas en los GET. Después de un request
+    que escribe, el navegador lee de la primaria REPLICA_STICKY_SECONDS para
+    ver lo que acaba de escribir aunque la réplica todavía no lo tenga.
+    """
+
+    def handle(self, request):
+        if not replica_aliases():
+            return self.get_response(request)
+
+        with replica_reads(self.can_read_from_replicas(request)):
+            response = self.get_response(request)
+
+        return self.stick(request, response)
+
+    async def __acall__(self, request):
+        if not replica_aliases():
+            return await self.get_response(request)
+
+        with replica_reads(self.can_read_from_replicas(request)):
+            response = await self.get_response(request)
+
+        return self.stick(request, response)
+
+    def can_read_from_replicas(self, request):
+        return request.method in SAFE_METHODS and not sticks_to_primary(request)
+
+    def stick(self, request, response):
+        if request.method not in SAFE_METHODS:
+            stick_to_primary(response)
+        return response
@@ -0,0 +1,26 @@
+# Generated by Django 5.2 on 2026-10-18 05:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("app", "0003_rename_date_event_scheduled_at"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(fields=["scheduled_at", "id"], name="event_scheduled_at_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                fields=["organizer", "scheduled_at"], name="event_organizer_sched_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(fields=["updated_at"], name="event_updated_at_idx"),
+        ),
+    ]
@@ -0,0 +1,51 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("app", "0004_event_indexes"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=[
+                """
+                CREATE VIRTUAL TABLE app_event_fts USING fts5(
+                    title,
+                    description,
+                    content='app_event',
+                    content_rowid='id',
+                    tokenize='unicode61 remove_diacritics 2'
+                )
+                """,
+                """
+                CREATE TRIGGER app_event_fts_ai AFTER INSERT ON app_event BEGIN
+                    INSERT INTO app_event_fts(rowid, title, description)
+                    VALUES (new.id, new.title, new.description);
+                END
+                """,
+                """
+                CREATE TRIGGER app_event_fts_ad AFTER DELETE ON app_event BEGIN
+                    INSERT INTO app_event_fts(app_event_fts, rowid, title, description)
+                    VALUES ('delete', old.id, old.title, old.description);
+                END
+                """,
+                """
+                CREATE TRIGGER app_event_fts_au AFTER UPDATE OF title, description ON app_event
+                BEGIN
+                    INSERT INTO app_event_fts(app_event_fts, rowid, title, description)
+                    VALUES ('delete', old.id, old.title, old.description);
+                    INSERT INTO app_event_fts(rowid, title, description)
+                    VALUES (new.id, new.title, new.description);
+                END
+                """,
+                "INSERT INTO app_event_fts(app_event_fts) VALUES ('rebuild')",
+            ],
+            reverse_sql=[
+                "DROP TRIGGER IF EXISTS app_event_fts_au",
+                "DROP TRIGGER IF EXISTS app_event_fts_ad",
+                "DROP TRIGGER IF EXISTS app_event_fts_ai",
+                "DROP TABLE IF EXISTS app_event_fts",
+            ],
+        ),
+    ]
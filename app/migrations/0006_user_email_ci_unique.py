@@ -0,0 +1,61 @@
+# Generated by Django 5.2 on 2026-10-18 06:36
+
+import django.db.models.functions.text
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import Lower
+
+
+def check_duplicate_emails(apps, schema_editor):
+    """
+    Antes de crear la restricción, busca emails que solo difieren en
+    mayúsculas. No se eligen ganadores automáticamente (borrar o cambiar el
+    email de una cuenta real la dejaría sin recuperar la contraseña): se
+    listan las cuentas en conflicto para resolverlas a mano y se corta.
+    """
+    User = apps.get_model("app", "User")
+    users = User.objects.using(schema_editor.connection.alias).exclude(email="")
+
+    duplicates = (
+        users.annotate(email_lower=Lower("email"))
+        .values("email_lower")
+        .annotate(count=Count("id"))
+        .filter(count__gt=1)
+        .values_list("email_lower", flat=True)
+    )
+    conflicts = {}
+    for id, username, email in (
+        users.annotate(email_lower=Lower("email"))
+        .filter(email_lower__in=list(duplicates))
+        .order_by("id")
+        .values_list("id", "username", "email")
+    ):
+        conflicts.setdefault(email.lower(), []).append(f"{username} (id {id})")
+
+    if conflicts:
+        lines = "\n".join(
+            f"  {email}: {', '.join(accounts)}" for email, accounts in conflicts.items()
+        )
+        raise RuntimeError(
+            "Hay usuarios con el mismo email salvo mayúsculas; cambiar o vaciar el email "
+            f"de los repetidos antes de migrar:\n{lines}"
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("app", "0005_event_fts"),
+        ("auth", "0012_alter_user_first_name_max_length"),
+    ]
+
+    operations = [
+        migrations.RunPython(check_duplicate_emails, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="user",
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.text.Lower("email"),
+                condition=models.Q(("email", ""), _negated=True),
+                name="user_email_ci_unique",
+            ),
+        ),
+    ]
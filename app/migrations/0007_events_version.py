@@ -0,0 +1,50 @@
+# Generated by Django 5.2 on 2026-10-18 07:42
+
+from django.db import migrations, models
+
+# Cualquier escritura en app_event (ORM, SQL crudo, admin) mueve la versión. El
+# UPSERT recrea la fila si se borró, por ejemplo con flush.
+BUMP_SQL = """
+    INSERT INTO app_eventsversion (id, version, changed_at)
+    VALUES (1, 1, strftime('%Y-%m-%d %H:%M:%f', 'now'))
+    ON CONFLICT (id) DO UPDATE SET
+        version = version + 1,
+        changed_at = excluded.changed_at;
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("app", "0006_user_email_ci_unique"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EventsVersion",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("version", models.PositiveBigIntegerField(default=0)),
+                ("changed_at", models.DateTimeField(null=True)),
+            ],
+        ),
+        migrations.RunSQL(
+            sql=[
+                *(
+                    f"CREATE TRIGGER app_event_version_{suffix} AFTER {action} ON app_event "
+                    f"BEGIN {BUMP_SQL} END"
+                    for suffix, action in (("ai", "INSERT"), ("ad", "DELETE"), ("au", "UPDATE"))
+                ),
+                BUMP_SQL,
+            ],
+            reverse_sql=[
+                "DROP TRIGGER IF EXISTS app_event_version_au",
+                "DROP TRIGGER IF EXISTS app_event_version_ad",
+                "DROP TRIGGER IF EXISTS app_event_version_ai",
+            ],
+        ),
+    ]
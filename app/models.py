@@ -1,23 +1,104 @@
+import datetime
+import re
+from contextlib import contextmanager
+
+from django.conf import settings
 from django.contrib.auth.models import AbstractUser
-from django.db import models
+from django.db import connection, models
+from django.db.models import F, Q, Value
+from django.db.models.functions import Lower
+from django.utils import timezone
+
+from .signals import events_changed
+from .sqlite import write_transaction
+
+EMAIL_UNIQUE_CONSTRAINT = "user_email_ci_unique"
+
+MIN_DATETIME = datetime.datetime.min.replace(tzinfo=datetime.timezone.utc)
+MAX_DATETIME = datetime.datetime.max.replace(tzinfo=datetime.timezone.utc)
+
+# Mayor id que entra en un INTEGER de SQLite (entero de 64 bits con signo)
+MAX_ID = 2**63 - 1
+
+# Triggers de la migración 0007 que mueven EventsVersion en cada fila de app_event
+EVENTS_VERSION_TRIGGERS = ("app_event_version_ai", "app_event_version_ad", "app_event_version_au")
+
+EVENTS_VERSION_BUMP_SQL = """
+    INSERT INTO app_eventsversion (id, version, changed_at)
+    VALUES (1, 1, strftime('%Y-%m-%d %H:%M:%f', 'now'))
+    ON CONFLICT (id) DO UPDATE SET
+        version = version + 1,
+        changed_at = excluded.changed_at
+"""
+
+# SQLite no da el nombre de la restricción aparte: viene en el mensaje como
+# "index 'nombre'" (índices sobre expresiones) o "tabla.columna"
+SQLITE_UNIQUE_FAILED = re.compile(
+    r"UNIQUE constraint failed: (?:index '(?P<index>[^']+)'|(?P<columns>.+))"
+)
+
+UNIQUE_ERRORS = {
+    "email": "Ya existe un usuario con este email",
+    "username": "Ya existe un usuario con este nombre de usuario",
+}
+
+
+def unique_constraint_name(error):
+    """
+    Nombre de la restricción UNIQUE que violó un IntegrityError, o None. Usa
+    el dato estructurado del driver si lo tiene (diag.constraint_name en
+    psycopg) y si no el formato fijo del error de SQLite.
+    """
+    diag = getattr(error.__cause__, "diag", None)
+    if getattr(diag, "constraint_name", None):
+        return diag.constraint_name
+
+    match = SQLITE_UNIQUE_FAILED.fullmatch(str(error))
+    if match is None:
+        return None
+
+    return match["index"] or match["columns"]
 
 
 class User(AbstractUser):
     is_organizer = models.BooleanField(default=False)
 
+    class Meta(AbstractUser.Meta):
+        constraints = [
+            # Sin distinguir mayúsculas; los usuarios sin email (creados por consola) quedan afuera
+            models.UniqueConstraint(
+                Lower("email"), condition=~Q(email=""), name=EMAIL_UNIQUE_CONSTRAINT
+            ),
+        ]
+
     @classmethod
     def validate_new_user(cls, email, username, password, password_confirm):
         errors = {}
 
+        # Email y username se verifican con una sola consulta
+        lookups = Q()
+        if email is not None:
+            lookups |= Q(~Q(email=""), email_lower=Lower(Value(email)))
+        if username is not None:
+            lookups |= Q(username=username)
+
+        taken = []
+        if lookups:
+            taken = list(
+                User.objects.alias(email_lower=Lower("email"))
+                .filter(lookups)
+                .values_list("email", "username")
+            )
+
         if email is None:
             errors["email"] = "El email es requerido"
-        elif User.objects.filter(email=email).exists():
-            errors["email"] = "Ya existe un usuario con este email"
+        elif any(taken_email.lower() == email.lower() for taken_email, _ in taken):
+            errors["email"] = UNIQUE_ERRORS["email"]
 
         if username is None:
             errors["username"] = "El username es requerido"
-        elif User.objects.filter(username=username).exists():
-            errors["username"] = "Ya existe un usuario con este nombre de usuario"
+        elif any(taken_username == username for _, taken_username in taken):
+            errors["username"] = UNIQUE_ERRORS["username"]
 
         if password is None or password_confirm is None:
             errors["password"] = "Las contraseñas son requeridas"
@@ -26,6 +107,24 @@ class User(AbstractUser):
 
         return errors
 
+    @classmethod
+    def integrity_errors(cls, error):
+        """
+        Traduce el IntegrityError de un registro concurrente que pasó la
+        validación al mismo dict de errores por campo. Devuelve None si la
+        violación no es de email ni de username.
+        """
+        constraint = unique_constraint_name(error)
+        table = cls._meta.db_table
+
+        if constraint == EMAIL_UNIQUE_CONSTRAINT:
+            return {"email": UNIQUE_ERRORS["email"]}
+        # En SQLite la columna; en PostgreSQL el nombre que le da Django al UNIQUE
+        if constraint in (f"{table}.username", f"{table}_username_key"):
+            return {"username": UNIQUE_ERRORS["username"]}
+
+        return None
+
 
 class Event(models.Model):
     title = models.CharField(max_length=200)
@@ -35,6 +134,13 @@ class Event(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["scheduled_at", "id"], name="event_scheduled_at_id_idx"),
+            models.Index(fields=["organizer", "scheduled_at"], name="event_organizer_sched_idx"),
+            models.Index(fields=["updated_at"], name="event_updated_at_idx"),
+        ]
+
     def __str__(self):
         return self.title
 
@@ -52,24 +158,264 @@ class Event(models.Model):
 
     @classmethod
     def new(cls, title, description, scheduled_at, organizer):
-        errors = Event.validate(title, description, scheduled_at)
+        _, errors = Event.new_many(
+            [
+                {
+                    "title": title,
+                    "description": description,
+                    "scheduled_at": scheduled_at,
+                    "organizer": organizer,
+                }
+            ]
+        )
+
+        if errors:
+            return False, errors[0]
+
+        return True, None
+
+    @classmethod
+    def new_many(cls, items):
+        """
+        Crea varios eventos con un solo bulk_create. `items` son dicts con title,
+        description, scheduled_at y organizer; los inválidos se saltean y sus
+        errores se devuelven por posición. Devuelve (eventos creados, errores),
+        con los ids ya asignados, y manda events_changed una sola vez para todo
+        el lote.
+        """
+        events = []
+        errors = {}
+
+        for index, item in enumerate(items):
+            item_errors = Event.validate(
+                item.get("title") or "", item.get("description") or "", item.get("scheduled_at")
+            )
+            if item.get("scheduled_at") is None:
+                item_errors["scheduled_at"] = "Por favor ingrese una fecha"
+            if item.get("organizer") is None:
+                item_errors["organizer"] = "El evento necesita un organizador"
+
+            if item_errors:
+                errors[index] = item_errors
+                continue
+
+            events.append(
+                Event(
+                    title=item["title"],
+                    description=item["description"],
+                    scheduled_at=item["scheduled_at"],
+                    organizer=item["organizer"],
+                )
+            )
+
+        if not events:
+            return [], errors
+
+        # En SQLite 3.35+ el INSERT usa RETURNING y cada instancia recibe su id.
+        # Si hace falta más de un INSERT, quedan todos en la misma transacción.
+        write_transaction(bulk_version_bump(Event.objects.bulk_create, len(events)), events)
+
+        for event in events:
+            event._snapshot()
+
+        events_changed.send(sender=cls, action="created", events=events, count=len(events))
+
+        return events, errors
 
-        if len(errors.keys()) > 0:
-            return False, errors
+    # Campo -> atributo que se compara para saber si cambió desde que se leyó
+    TRACKED_FIELDS = {
+        "title": "title",
+        "description": "description",
+        "scheduled_at": "scheduled_at",
+        "organizer": "organizer_id",
+    }
 
-        Event.objects.create(
-            title=title,
-            description=description,
-            scheduled_at=scheduled_at,
-            organizer=organizer,
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._snapshot()
+        return instance
+
+    def _snapshot(self, fields=None):
+        # Solo los campos cargados: leer uno diferido haría otra consulta
+        loaded = self.__dict__.setdefault("_loaded_values", {})
+        for name, attname in self.TRACKED_FIELDS.items():
+            if (fields is None or name in fields or attname in fields) and attname in self.__dict__:
+                loaded[attname] = self.__dict__[attname]
+
+    def changed_fields(self):
+        """Campos que cambiaron desde que se leyó o guardó la fila (todos si es nueva)"""
+        loaded = self.__dict__.get("_loaded_values")
+
+        if loaded is None or self._state.adding:
+            return list(self.TRACKED_FIELDS)
+
+        return [
+            name
+            for name, attname in self.TRACKED_FIELDS.items()
+            if attname in self.__dict__
+            and (attname not in loaded or self.__dict__[attname] != loaded[attname])
+        ]
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self._snapshot(kwargs.get("update_fields"))
+
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        super().refresh_from_db(using, fields, from_queryset)
+        self._snapshot(fields)
+
+    @classmethod
+    def delete_many(cls, organizer, ids):
+        """
+        Borra los eventos del organizador con un solo DELETE ... WHERE id IN (...)
+        AND organizer_id = %s: los ids de otros organizadores no se tocan.
+        Devuelve cuántos se borraron.
+        """
+        # Event no tiene relaciones en cascada ni receptores de delete, así
+        # que QuerySet.delete() borra sin leer las filas antes
+        events = cls.objects.filter(pk__in=ids, organizer=organizer)
+        deleted, _ = write_transaction(bulk_version_bump(events.delete, len(ids)))
+
+        if deleted:
+            events_changed.send(sender=cls, action="deleted", events=None, count=deleted)
+
+        return deleted
+
+    @classmethod
+    def reschedule_many(cls, organizer, delta, ids=None, start=None, end=None):
+        """
+        Mueve `delta` la fecha de los eventos del organizador que cumplen los
+        filtros (ids y/o rango [start, end)) con un solo
+        UPDATE ... SET scheduled_at = scheduled_at + %s WHERE organizer_id = %s ...
+        Devuelve cuántos se movieron.
+        """
+        events = cls.objects.filter(organizer=organizer)
+        if ids is not None:
+            events = events.filter(pk__in=ids)
+        if start is not None:
+            events = events.filter(scheduled_at__gte=start)
+        if end is not None:
+            events = events.filter(scheduled_at__lt=end)
+        # Los eventos que quedarían fuera del rango de datetime no se mueven
+        if delta > datetime.timedelta(0):
+            events = events.filter(scheduled_at__lte=MAX_DATETIME - delta)
+        else:
+            events = events.filter(scheduled_at__gte=MIN_DATETIME - delta)
+
+        # Por rango no se sabe cuántos son: contarlos es más barato que un trigger por fila
+        rows = len(ids) if ids is not None else events.count()
+        updated = write_transaction(
+            bulk_version_bump(events.update, rows),
+            scheduled_at=F("scheduled_at") + delta,
+            updated_at=timezone.now(),
         )
 
-        return True, None
+        if updated:
+            events_changed.send(sender=cls, action="rescheduled", events=None, count=updated)
+
+        return updated
 
-    def update(self, title, description, scheduled_at, organizer):
+    def update(self, title, description, scheduled_at, organizer=None):
+        """
+        Escribe solo las columnas que cambiaron y no toca la base si no cambió
+        ninguna. El organizador se conserva salvo que se pase uno explícitamente.
+        Devuelve si hubo que guardar.
+        """
         self.title = title or self.title
         self.description = description or self.description
         self.scheduled_at = scheduled_at or self.scheduled_at
-        self.organizer = organizer or self.organizer
+        if organizer is not None:
+            self.organizer = organizer
+
+        changed = self.changed_fields()
+        if not changed:
+            return False
+
+        write_transaction(self.save, update_fields=[*changed, "updated_at"])
 
-        self.save()
+        return True
+
+    @classmethod
+    def update_by_id(cls, id, title, description, scheduled_at):
+        """
+        Edición del formulario en un solo UPDATE ... WHERE id = %s, sin leer la
+        fila antes. Los valores vacíos no se modifican, como en update(), y si
+        nada cambió la fila no se reescribe. Devuelve False si el evento no existe.
+        """
+        values = {
+            name: value
+            for name, value in (
+                ("title", title),
+                ("description", description),
+                ("scheduled_at", scheduled_at),
+            )
+            if value
+        }
+        events = cls.objects.filter(pk=id)
+
+        if values and write_transaction(
+            events.exclude(**values).update, **values, updated_at=timezone.now()
+        ):
+            return True
+
+        # Cero filas: o no existe o ya tenía esos valores
+        return events.exists()
+
+
+@contextmanager
+def deferred_version_bump():
+    """
+    Para escrituras masivas: suspende los triggers que mueven EventsVersion en
+    cada fila y la mueve una sola vez al final. Se usa dentro de una transacción
+    (write_transaction o transaction.atomic()): los demás procesos nunca ven la
+    tabla sin triggers y un error deshace también el DROP.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name IN (%s, %s, %s)",
+            EVENTS_VERSION_TRIGGERS,
+        )
+        triggers = [sql for (sql,) in cursor.fetchall()]
+        for name in EVENTS_VERSION_TRIGGERS:
+            cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+
+    yield
+
+    with connection.cursor() as cursor:
+        for sql in triggers:
+            cursor.execute(sql)
+        cursor.execute(EVENTS_VERSION_BUMP_SQL)
+
+
+def bulk_version_bump(func, rows):
+    """
+    func con los triggers de EventsVersion suspendidos si escribe al menos
+    EVENTS_VERSION_DEFER_MIN_ROWS filas. Con menos, el DROP y CREATE de los
+    triggers cuesta más que mover la versión en cada fila. Como decorador,
+    deferred_version_bump conserva el nombre de func para la métrica de reintentos.
+    """
+    if rows < getattr(settings, "EVENTS_VERSION_DEFER_MIN_ROWS", 100):
+        return func
+    return deferred_version_bump()(func)
+
+
+class EventsVersion(models.Model):
+    """
+    Fila única (id 1) que los triggers de app_event actualizan en cada INSERT,
+    UPDATE o DELETE (ver la migración 0007). Vive en la base, así que todos los
+    procesos ven la misma versión sin depender del cache local de cada uno.
+    """
+
+    version = models.PositiveBigIntegerField(default=0)
+    changed_at = models.DateTimeField(null=True)
+
+    @classmethod
+    def current(cls):
+        """(versión, momento del último cambio); (0, None) si no hubo escrituras"""
+        return cls.objects.filter(pk=1).values_list("version", "changed_at").first() or (0, None)
+
+    @classmethod
+    async def acurrent(cls):
+        row = await cls.objects.filter(pk=1).values_list("version", "changed_at").afirst()
+        return row or (0, None)
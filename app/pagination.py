@@ -0,0 +1,126 @@
+import base64
+import binascii
+import datetime
+import json
+
+from django.conf import settings
+from django.db.models import Q
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(direction, scheduled_at, pk):
+    payload = json.dumps([direction, scheduled_at.isoformat(), pk], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor):
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        direction, scheduled_at, pk = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        scheduled_at = datetime.datetime.fromisoformat(scheduled_at)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise InvalidCursor(cursor) from e
+
+    if direction not in ("n", "p") or not isinstance(pk, int):
+        raise InvalidCursor(cursor)
+
+    return direction, scheduled_at, pk
+
+
+def get_page_size(value):
+    default = getattr(settings, "EVENTS_PAGE_SIZE", 20)
+    maximum = getattr(settings, "EVENTS_MAX_PAGE_SIZE", 100)
+
+    try:
+        page_size = int(value)
+    except (TypeError, ValueError):
+        return default
+
+    return max(1, min(page_size, maximum))
+
+
+class KeysetPage:
+    def __init__(self, items, next_cursor, previous_cursor):
+        self.items = items
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+    @property
+    def has_next(self):
+        return self.next_cursor is not None
+
+    @property
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+
+def _page_queryset(queryset, cursor, page_size):
+    direction = "n"
+
+    if cursor:
+        direction, scheduled_at, pk = decode_cursor(cursor)
+        if direction == "n":
+            queryset = queryset.filter(
+                Q(scheduled_at__gt=scheduled_at) | Q(scheduled_at=scheduled_at, id__gt=pk),
+                scheduled_at__gte=scheduled_at,
+            )
+        else:
+            queryset = queryset.filter(
+                Q(scheduled_at__lt=scheduled_at) | Q(scheduled_at=scheduled_at, id__lt=pk),
+                scheduled_at__lte=scheduled_at,
+            )
+
+    if direction == "n":
+        queryset = queryset.order_by("scheduled_at", "id")
+    else:
+        queryset = queryset.order_by("-scheduled_at", "-id")
+
+    # Se pide una fila de más para saber si hay otra página sin hacer COUNT(*)
+    return queryset[: page_size + 1], direction
+
+
+def _build_page(rows, direction, cursor, page_size):
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+
+    if direction == "p":
+        rows.reverse()
+
+    if not rows:
+        return KeysetPage([], None, None)
+
+    first, last = rows[0], rows[-1]
+
+    # Si venimos desde un cursor, del otro lado de la página siempre hay filas
+    if direction == "n":
+        has_next, has_previous = has_more, cursor is not None
+    else:
+        has_next, has_previous = True, has_more
+
+    next_cursor = encode_cursor("n", last.scheduled_at, last.id) if has_next else None
+    previous_cursor = encode_cursor("p", first.scheduled_at, first.id) if has_previous else None
+
+    return KeysetPage(rows, next_cursor, previous_cursor)
+
+
+def paginate_events(queryset, cursor=None, page_size=20):
+    """
+    Pagina por (scheduled_at, id) sin OFFSET ni COUNT(*): cada página es un
+    rango sobre el índice, así que la página N cuesta lo mismo que la primera.
+    """
+    queryset, direction = _page_queryset(queryset, cursor, page_size)
+    return _build_page(list(queryset), direction, cursor, page_size)
+
+
+async def apaginate_events(queryset, cursor=None, page_size=20):
+    queryset, direction = _page_queryset(queryset, cursor, page_size)
+    return _build_page([event async for event in queryset], direction, cursor, page_size)
@@ -0,0 +1,81 @@
+import logging
+import re
+from collections import Counter
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# Sentencias de control de transacción que no cuentan como consultas de la vista
+TRANSACTION_STATEMENTS = (
+    "SAVEPOINT",
+    "RELEASE SAVEPOINT",
+    "ROLLBACK TO SAVEPOINT",
+    "BEGIN",
+    "COMMIT",
+)
+
+IN_PARAMS_RE = re.compile(r"\((?:%s, )*%s\)")
+
+
+class QueryBudgetExceeded(Exception):
+    pass
+
+
+def query_budget(max_queries):
+    """
+    Declara la cantidad máxima de consultas que puede hacer una vista,
+    contando también las de sesión y autenticación.
+    """
+
+    def decorator(view_func):
+        view_func.query_budget = max_queries
+        return view_func
+
+    return decorator
+
+
+def get_query_budget(view_func, url_name):
+    budget = getattr(view_func, "query_budget", None)
+
+    if budget is None:
+        budget = getattr(settings, "QUERY_BUDGETS", {}).get(url_name)
+
+    return budget
+
+
+def normalize_sql(sql):
+    # Un IN con distinta cantidad de parámetros sigue siendo la misma consulta
+    return IN_PARAMS_RE.sub("(%s, ...)", " ".join(sql.split()))
+
+
+class QueryCounter:
+    """
+    execute_wrapper que registra cada consulta normalizada, sin sus parámetros.
+    """
+
+    def __init__(self):
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        if not sql.lstrip().upper().startswith(TRANSACTION_STATEMENTS):
+            self.queries.append(normalize_sql(sql))
+
+        return execute(sql, params, many, context)
+
+    def __len__(self):
+        return len(self.queries)
+
+    def repeated(self, max_repeats):
+        return [(sql, count) for sql, count in Counter(self.queries).items() if count > max_repeats]
+
+    def problems(self, budget, max_repeats):
+        problems = []
+
+        if budget is not None and len(self) > budget:
+            problems.append(f"{len(self)} consultas, el máximo es {budget}")
+
+        for sql, count in self.repeated(max_repeats):
+            problems.append(f"la consulta se repitió {count} veces (posible N+1): {sql}")
+
+        return problems
@@ -0,0 +1,85 @@
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+# Modelos que se leen de las réplicas; el resto (sesiones, permisos) va siempre a la primaria.
+# EventsVersion va con Event para que los validadores coincidan con lo que se lee.
+REPLICATED_MODELS = {"app.Event", "app.EventsVersion", "app.User"}
+
+# Cookie con el momento (time.time()) hasta el que el navegador lee de la primaria
+PRIMARY_COOKIE = "eventhub_primary"
+
+# Si el request en curso puede leer de las réplicas. Fuera de un request
+# (comandos, shell, tareas) todo se lee de la primaria.
+read_from_replicas = ContextVar("read_from_replicas", default=False)
+
+
+def replica_aliases():
+    return getattr(settings, "DATABASE_REPLICAS", [])
+
+
+@contextmanager
+def replica_reads(enabled=True):
+    token = read_from_replicas.set(enabled)
+    try:
+        yield
+    finally:
+        read_from_replicas.reset(token)
+
+
+def sticks_to_primary(request, now=None):
+    """Si el navegador escribió hace menos de REPLICA_STICKY_SECONDS"""
+    try:
+        until = float(request.COOKIES.get(PRIMARY_COOKIE, 0))
+    except ValueError:
+        return False
+
+    return until > (time.time() if now is None else now)
+
+
+def stick_to_primary(response):
+    seconds = getattr(settings, "REPLICA_STICKY_SECONDS", 10)
+    response.set_cookie(
+        PRIMARY_COOKIE,
+        f"{time.time() + seconds:.3f}",
+        max_age=seconds,
+        httponly=True,
+        samesite="Lax",
+    )
+
+
+class ReplicaRouter:
+    """
+    Lee Event y User de una réplica elegida al azar cuando el request lo
+    permite (ver ReplicaRoutingMiddleware) y escribe siempre en la primaria.
+    """
+
+    def db_for_read(self, model, **hints):
+        replicas = replica_aliases()
+
+        if not replicas or model._meta.label not in REPLICATED_MODELS:
+            return None
+        if not read_from_replicas.get():
+            return DEFAULT_DB_ALIAS
+
+        return random.choice(replicas)
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Las réplicas son copias de la primaria: los objetos se pueden relacionar
+        databases = {DEFAULT_DB_ALIAS, *replica_aliases()}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Las réplicas reciben el esquema con la copia, no con migrate
+        if db in replica_aliases():
+            return False
+        return None
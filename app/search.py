@@ -0,0 +1,90 @@
+import re
+from contextlib import contextmanager
+
+from django.db import connection
+from django.utils.html import escape
+from django.utils.safestring import mark_safe
+
+from .models import Event
+
+# Marcadores que FTS5 inserta alrededor de cada coincidencia. Se reemplazan por
+# <mark> después de escapar el texto, así el contenido del evento nunca se
+# interpreta como HTML.
+HIGHLIGHT_START = "\x02"
+HIGHLIGHT_END = "\x03"
+
+FTS_INSERT_TRIGGER = "app_event_fts_ai"
+
+SEARCH_SQL = f"""
+    SELECT
+        app_event.*,
+        highlight(app_event_fts, 0, '{HIGHLIGHT_START}', '{HIGHLIGHT_END}') AS title_highlight,
+        snippet(app_event_fts, 1, '{HIGHLIGHT_START}', '{HIGHLIGHT_END}', '…', 16)
+            AS description_snippet
+    FROM app_event_fts
+    JOIN app_event ON app_event.id = app_event_fts.rowid
+    WHERE app_event_fts MATCH %s
+    ORDER BY bm25(app_event_fts, 10.0, 1.0)
+    LIMIT %s
+"""
+
+
+def build_match_query(text):
+    """
+    Convierte lo que escribió el usuario en una consulta FTS5 segura: cada
+    palabra va entre comillas (sin operadores) y la última admite prefijo.
+    """
+    terms = re.findall(r"\w+", text or "")
+
+    if not terms:
+        return None
+
+    quoted = [f'"{term}"' for term in terms]
+    quoted[-1] += "*"
+
+    return " ".join(quoted)
+
+
+def render_highlight(text):
+    html = escape(text or "")
+    html = html.replace(HIGHLIGHT_START, "<mark>").replace(HIGHLIGHT_END, "</mark>")
+    return mark_safe(html)
+
+
+def search_events(text, limit=20):
+    match = build_match_query(text)
+
+    if match is None:
+        return []
+
+    results = list(Event.objects.raw(SEARCH_SQL, [match, limit]))
+
+    for event in results:
+        event.title_highlight = render_highlight(event.title_highlight)
+        event.description_snippet = render_highlight(event.description_snippet)
+
+    return results
+
+
+@contextmanager
+def deferred_fts_sync():
+    """
+    Para cargas masivas: suspende el trigger que indexa cada INSERT y al final
+    reconstruye el índice de una vez, que es varias veces más rápido. Se usa
+    dentro de transaction.atomic() para que un error deshaga también el DROP.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = %s",
+            [FTS_INSERT_TRIGGER],
+        )
+        row = cursor.fetchone()
+        if row:
+            cursor.execute(f"DROP TRIGGER {FTS_INSERT_TRIGGER}")
+
+    yield
+
+    with connection.cursor() as cursor:
+        if row:
+            cursor.execute(row[0])
+        cursor.execute("INSERT INTO app_event_fts(app_event_fts) VALUES ('rebuild')")
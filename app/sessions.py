@@ -0,0 +1,96 @@
+from django.conf import settings
+from django.contrib.sessions.backends.cached_db import SessionStore as CachedDBStore
+from django.core.cache.backends.locmem import LocMemCache
+
+from .cache import LocalLRUCache
+
+# Sesiones leídas hace poco por este proceso. Se actualizan al guardar o borrar
+# desde acá; un logout hecho en otro proceso se nota después del timeout, siempre
+# que el cache compartido no guarde más tiempo su propia copia (ver _ShortLivedCache).
+local_sessions = LocalLRUCache(
+    getattr(settings, "SESSION_LOCAL_CACHE_SIZE", 10000),
+    getattr(settings, "SESSION_LOCAL_CACHE_TIMEOUT", 5),
+)
+
+
+class _ShortLivedCache:
+    """
+    Cache de sesiones que no guarda nada por más de `timeout` segundos. Con un
+    LocMemCache cada proceso tiene su copia, y un logout en otro proceso no la
+    borra: dejarla por toda la vida de la sesión la mantendría abierta ahí.
+    """
+
+    def __init__(self, cache, timeout):
+        self._cache = cache
+        self.timeout = timeout
+
+    def _cap(self, timeout):
+        return self.timeout if timeout is None else min(timeout, self.timeout)
+
+    def set(self, key, value, timeout, version=None):
+        self._cache.set(key, value, self._cap(timeout), version)
+
+    async def aset(self, key, value, timeout, version=None):
+        await self._cache.aset(key, value, self._cap(timeout), version)
+
+    def __contains__(self, key):
+        return key in self._cache
+
+    def __getattr__(self, name):
+        return getattr(self._cache, name)
+
+
+class SessionStore(CachedDBStore):
+    """
+    Sesiones de cached_db con un LRU en memoria delante del cache compartido:
+    un request autenticado no consulta ni la base ni el cache para la sesión.
+    Se guarda y se devuelve una copia para que lo que cambie un request no se
+    filtre a otros hasta que se llame a save().
+    """
+
+    def __init__(self, session_key=None):
+        super().__init__(session_key)
+        if isinstance(self._cache, LocMemCache):
+            self._cache = _ShortLivedCache(self._cache, local_sessions.timeout)
+
+    def load(self):
+        key = self.cache_key
+        data = local_sessions.get(key)
+
+        if data is None:
+            data = super().load()
+            if data:
+                local_sessions.set(key, dict(data))
+
+        return dict(data)
+
+    async def aload(self):
+        key = await self.acache_key()
+        data = local_sessions.get(key)
+
+        if data is None:
+            data = await super().aload()
+            if data:
+                local_sessions.set(key, dict(data))
+
+        return dict(data)
+
+    def save(self, must_create=False):
+        super().save(must_create)
+        local_sessions.set(self.cache_key, dict(self._session))
+
+    async def asave(self, must_create=False):
+        await super().asave(must_create)
+        local_sessions.set(await self.acache_key(), dict(self._session))
+
+    def delete(self, session_key=None):
+        session_key = session_key or self.session_key
+        super().delete(session_key)
+        if session_key:
+            local_sessions.delete(self.cache_key_prefix + session_key)
+
+    async def adelete(self, session_key=None):
+        session_key = session_key or self.session_key
+        await super().adelete(session_key)
+        if session_key:
+            local_sessions.delete(self.cache_key_prefix + session_key)
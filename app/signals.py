@@ -0,0 +1,6 @@
+from django.dispatch import Signal
+
+# Se envía una sola vez por operación en lote sobre eventos, con sender=Event,
+# action ("created", "deleted" o "rescheduled"), count y events: las instancias
+# creadas, o None en las operaciones que modifican filas sin leerlas.
+events_changed = Signal()
@@ -0,0 +1,105 @@
+import itertools
+import random
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, OperationalError, connections, transaction
+
+from .metrics import registry
+
+# Perfil para producción: WAL deja leer mientras otro escribe y con
+# synchronous=NORMAL el commit no espera el fsync (solo el checkpoint lo hace).
+# busy_timeout va primero para que el cambio a WAL espere si la base está ocupada.
+DEFAULT_SQLITE_PRAGMAS = {
+    "busy_timeout": 5000,
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "mmap_size": 256 * 1024 * 1024,
+    "cache_size": -64000,
+    "temp_store": "MEMORY",
+}
+
+# Errores de SQLite que se resuelven esperando a que termine la otra escritura
+LOCKED_ERRORS = ("database is locked", "database table is locked", "database is busy")
+
+
+def sqlite_pragmas():
+    return getattr(settings, "SQLITE_PRAGMAS", DEFAULT_SQLITE_PRAGMAS)
+
+
+def configure_sqlite(sender, connection, **kwargs):
+    """Aplica SQLITE_PRAGMAS a cada conexión nueva de SQLite"""
+    if connection.vendor != "sqlite":
+        return
+
+    # Directo sobre la conexión de sqlite3: no pasa por los execute_wrappers, así
+    # que no cuenta como consulta del request que abrió la conexión
+    for name, value in sqlite_pragmas().items():
+        connection.connection.execute(f"PRAGMA {name} = {value}")
+
+
+def is_locked_error(error):
+    return isinstance(error, OperationalError) and str(error).startswith(LOCKED_ERRORS)
+
+
+def backoff_delay(attempt):
+    """Backoff exponencial con jitter completo: entre 0 y base * 2^intento, con tope"""
+    base = getattr(settings, "DB_WRITE_RETRY_BASE_DELAY", 0.005)
+    cap = getattr(settings, "DB_WRITE_RETRY_MAX_DELAY", 0.5)
+    return random.uniform(0, min(cap, base * 2**attempt))
+
+
+@contextmanager
+def immediate_atomic(connection):
+    """transaction.atomic() que en SQLite arranca con BEGIN IMMEDIATE"""
+    if connection.vendor != "sqlite":
+        with transaction.atomic(using=connection.alias):
+            yield
+        return
+
+    connection.ensure_connection()
+    mode = connection.transaction_mode
+    connection.transaction_mode = "IMMEDIATE"
+    try:
+        with transaction.atomic(using=connection.alias):
+            # El BEGIN ya se mandó: lo que venga adentro son savepoints
+            connection.transaction_mode = mode
+            yield
+    finally:
+        connection.transaction_mode = mode
+
+
+def write_transaction(func, *args, savepoint=False, **kwargs):
+    """
+    Ejecuta func(*args, **kwargs) en una transacción que toma el lock de
+    escritura al empezar (BEGIN IMMEDIATE): con BEGIN a secas dos escrituras
+    pueden quedar esperándose y SQLite corta una sin respetar busy_timeout.
+    Si la base sigue bloqueada, reintenta todo func con backoff exponencial con
+    jitter hasta DB_WRITE_RETRY_DEADLINE segundos y cuenta cada reintento.
+
+    Dentro de otra transacción corre sin reintentos: el lock y el reintento le
+    corresponden a la más externa. `savepoint=True` aísla un error esperado
+    (por ejemplo IntegrityError) sin romper la transacción externa.
+    """
+    connection = connections[DEFAULT_DB_ALIAS]
+
+    if connection.in_atomic_block:
+        with transaction.atomic(savepoint=savepoint):
+            return func(*args, **kwargs)
+
+    deadline = time.monotonic() + getattr(settings, "DB_WRITE_RETRY_DEADLINE", 10)
+
+    for attempt in itertools.count():
+        try:
+            with immediate_atomic(connection):
+                return func(*args, **kwargs)
+        except OperationalError as e:
+            remaining = deadline - time.monotonic()
+            if not is_locked_error(e) or remaining <= 0:
+                raise
+
+        registry.inc(
+            "eventhub_db_write_retries_total", {"operation": getattr(func, "__name__", "write")}
+        )
+        time.sleep(min(remaining, backoff_delay(attempt)))
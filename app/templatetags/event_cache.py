@@ -0,0 +1,51 @@
+from django import template
+from django.conf import settings
+from django.core.cache import caches
+
+from app.cache import event_row_cache_key
+
+register = template.Library()
+
+# El token CSRF es distinto para cada sesión, así que el fragmento se guarda con
+# este marcador y el token real se inserta al servirlo.
+CSRF_PLACEHOLDER = "__event_row_csrf_token__"
+
+
+class EventRowCacheNode(template.Node):
+    def __init__(self, nodelist, event, user_is_organizer):
+        self.nodelist = nodelist
+        self.event = event
+        self.user_is_organizer = user_is_organizer
+
+    def render(self, context):
+        event = self.event.resolve(context)
+        key = event_row_cache_key(event, self.user_is_organizer.resolve(context))
+
+        cache = caches[getattr(settings, "EVENTS_ROW_CACHE_ALIAS", "default")]
+        html = cache.get(key)
+        if html is None:
+            with context.push(csrf_token=CSRF_PLACEHOLDER):
+                html = self.nodelist.render(context)
+            cache.set(key, html, getattr(settings, "EVENTS_ROW_CACHE_TIMEOUT", 3600))
+
+        if CSRF_PLACEHOLDER in html:
+            html = html.replace(CSRF_PLACEHOLDER, str(context.get("csrf_token", "")))
+
+        return html
+
+
+@register.tag
+def cache_event_row(parser, token):
+    """
+    {% cache_event_row event user_is_organizer %} ... {% endcache_event_row %}
+    """
+    bits = token.split_contents()
+    if len(bits) != 3:
+        raise template.TemplateSyntaxError(
+            f"'{bits[0]}' recibe dos argumentos: event y user_is_organizer"
+        )
+
+    nodelist = parser.parse(("endcache_event_row",))
+    parser.delete_first_token()
+
+    return EventRowCacheNode(nodelist, *[parser.compile_filter(bit) for bit in bits[1:]])
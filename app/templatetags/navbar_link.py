@@ -1,19 +1,23 @@
+import functools
+
 from django import template
 from django.utils.html import format_html
-from django.urls import reverse
+from django.utils.safestring import mark_safe
 
+from app.url_cache import cached_reverse
 
 register = template.Library()
 
 
-@register.simple_tag(takes_context=True)
-def navbar_link(context, url_name, label):
-    path = reverse(url_name)
-    is_active = path in context.request.path
-
+@functools.lru_cache(maxsize=128)
+def render_link(path, label, is_active):
     css_class = "nav-link active" if is_active else "nav-link"
-    aria = 'aria-current="page"' if is_active else ""
+    aria = mark_safe('aria-current="page"') if is_active else ""
 
-    html = f"<a href='{path}' class='{css_class}' {aria}>{label}</a>"
+    return format_html("<a href='{}' class='{}' {}>{}</a>", path, css_class, aria, label)
 
-    return format_html(html)
+
+@register.simple_tag(takes_context=True)
+def navbar_link(context, url_name, label):
+    path = cached_reverse(url_name)
+    return render_link(path, label, path in context.request.path)
@@ -0,0 +1,11 @@
+from django import template
+
+from app.url_cache import cached_reverse
+
+register = template.Library()
+
+
+@register.simple_tag
+def cached_url(url_name, *args):
+    """Como {% url %}, pero resuelve cada patrón una sola vez: {% cached_url 'event_detail' event.id %}"""
+    return cached_reverse(url_name, args)
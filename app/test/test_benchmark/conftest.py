@@ -0,0 +1,64 @@
+import os
+
+import pytest
+from django.core.management import call_command
+from django.db import connections
+
+from app.models import Event, User
+
+from .report import load_results, write_results
+
+SIZES = [int(size) for size in os.environ.get("BENCHMARK_SIZES", "1000,100000,1000000").split(",")]
+
+
+@pytest.fixture(scope="session")
+def django_db_modify_db_settings(tmp_path_factory):
+    # Base de test en disco: los números de una base en memoria no representan al despliegue
+    test_settings = connections["default"].settings_dict["TEST"]
+    test_settings["NAME"] = str(tmp_path_factory.mktemp("benchmark") / "db.sqlite3")
+
+
+@pytest.fixture(scope="session")
+def benchmark_results():
+    """Junta los resultados de todos los escenarios y los escribe al terminar la sesión"""
+    results = {}
+    yield results
+
+    if results:
+        write_results(os.environ.get("BENCHMARK_OUTPUT", "benchmark-results.json"), results)
+
+
+@pytest.fixture(scope="session")
+def benchmark_baseline():
+    return load_results(os.environ.get("BENCHMARK_BASELINE"))
+
+
+@pytest.fixture(scope="session", params=SIZES, ids=lambda size: f"{size}")
+def dataset(request, django_db_setup, django_db_blocker):
+    """
+    Carga el dataset sintético de seed_eventhub con la cantidad de eventos del
+    parámetro. Es de sesión y parametrizado, así pytest agrupa los tests por
+    tamaño y cada carga se hace una sola vez.
+    """
+    size = request.param
+    users = max(100, min(10000, size // 100))
+
+    with django_db_blocker.unblock():
+        call_command(
+            "seed_eventhub",
+            "--users",
+            str(users),
+            "--events",
+            str(size),
+            "--start-date",
+            "2025-06-01",
+            "--clear",
+            verbosity=0,
+        )
+
+        # seed_user0 es el organizador con más eventos; seed_user1 no es organizador
+        organizer = User.objects.get(username="seed_user0")
+        attendee = User.objects.get(username="seed_user1")
+        event_id = Event.objects.order_by("id").values_list("id", flat=True)[size // 2]
+
+    return {"size": size, "organizer": organizer, "attendee": attendee, "event_id": event_id}
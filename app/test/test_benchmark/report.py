@@ -0,0 +1,89 @@
+import json
+import math
+import platform
+import sys
+
+import django
+
+
+def percentile(values, p):
+    """Percentil con interpolación lineal entre los dos valores más cercanos"""
+    values = sorted(values)
+
+    if not values:
+        return None
+
+    rank = (len(values) - 1) * p / 100
+    low, high = math.floor(rank), math.ceil(rank)
+    return values[low] + (values[high] - values[low]) * (rank - low)
+
+
+def summarize(durations, queries, peak_memory):
+    """Resume las mediciones de un escenario; las latencias quedan en milisegundos"""
+    milliseconds = [duration * 1000 for duration in durations]
+
+    return {
+        "requests": len(durations),
+        "latency_ms": {
+            "p50": percentile(milliseconds, 50),
+            "p95": percentile(milliseconds, 95),
+            "p99": percentile(milliseconds, 99),
+            "mean": sum(milliseconds) / len(milliseconds),
+            "max": max(milliseconds),
+        },
+        "queries_per_request": max(queries),
+        "peak_memory_bytes": peak_memory,
+    }
+
+
+def find_regressions(result, baseline, threshold):
+    """
+    Compara un escenario contra la corrida de referencia. La latencia (p95) y la
+    memoria pueden empeorar hasta `threshold` (0.25 = 25%) por el ruido de la
+    máquina; las consultas por request son exactas y no pueden aumentar.
+    """
+    if baseline is None:
+        return []
+
+    regressions = []
+
+    current_p95 = result["latency_ms"]["p95"]
+    baseline_p95 = baseline["latency_ms"]["p95"]
+    if current_p95 > baseline_p95 * (1 + threshold):
+        regressions.append(f"p95 {current_p95:.1f}ms > {baseline_p95:.1f}ms (+{threshold:.0%})")
+
+    if result["queries_per_request"] > baseline["queries_per_request"]:
+        regressions.append(
+            f"{result['queries_per_request']} consultas por request > "
+            f"{baseline['queries_per_request']}"
+        )
+
+    current_memory = result["peak_memory_bytes"]
+    baseline_memory = baseline["peak_memory_bytes"]
+    if current_memory > baseline_memory * (1 + threshold):
+        regressions.append(f"memoria pico {current_memory} B > {baseline_memory} B")
+
+    return regressions
+
+
+def load_results(path):
+    if not path:
+        return {}
+
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["results"]
+
+
+def write_results(path, results):
+    payload = {
+        "environment": {
+            "python": sys.version.split()[0],
+            "django": django.get_version(),
+            "platform": platform.platform(),
+        },
+        "results": dict(sorted(results.items())),
+    }
+
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2)
+        f.write("\n")
@@ -0,0 +1,127 @@
+import asyncio
+import datetime
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient, Client, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from app.instrumentation import observe_queries
+from app.metrics import RequestObservation
+from app.models import Event, User
+
+from .report import find_regressions, summarize
+
+# Los clientes corren en threads y en el event loop: los datos tienen que estar commiteados
+pytestmark = [pytest.mark.benchmark, pytest.mark.django_db(transaction=True)]
+
+REQUESTS = int(os.environ.get("BENCHMARK_REQUESTS", 200))
+CONCURRENCY = int(os.environ.get("BENCHMARK_CONCURRENCY", 20))
+THRESHOLD = float(os.environ.get("BENCHMARK_THRESHOLD", 0.25))
+
+
+@pytest.fixture
+def urls():
+    organizer = User.objects.create_user(
+        username="organizador",
+        email="organizador@test.com",
+        password="password123",
+        is_organizer=True,
+    )
+    Event.objects.bulk_create(
+        Event(
+            title=f"Evento {i}",
+            description=f"Descripción del evento {i}",
+            scheduled_at=timezone.now() + datetime.timedelta(hours=i),
+            organizer=organizer,
+        )
+        for i in range(100)
+    )
+    event_id = Event.objects.order_by("id").values_list("id", flat=True).first()
+
+    return {
+        "events": reverse("events"),
+        "event_detail": reverse("event_detail", args=[event_id]),
+    }
+
+
+def run_wsgi(url):
+    clients = []
+    for _ in range(CONCURRENCY):
+        client = Client()
+        client.login(username="organizador", password="password123")
+        clients.append(client)
+
+    def worker(i):
+        observation = RequestObservation()
+        with observe_queries(observation):
+            started = time.perf_counter()
+            response = clients[i % CONCURRENCY].get(url)
+            duration = time.perf_counter() - started
+        return response.status_code, duration, observation.queries
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(CONCURRENCY) as executor:
+        measurements = list(executor.map(worker, range(REQUESTS)))
+    return measurements, time.perf_counter() - start
+
+
+def run_asgi(url):
+    async def main():
+        clients = []
+        for _ in range(CONCURRENCY):
+            client = AsyncClient()
+            await client.alogin(username="organizador", password="password123")
+            clients.append(client)
+
+        semaphore = asyncio.Semaphore(CONCURRENCY)
+
+        async def worker(i):
+            async with semaphore:
+                observation = RequestObservation()
+                with observe_queries(observation):
+                    started = time.perf_counter()
+                    response = await clients[i % CONCURRENCY].get(url)
+                    duration = time.perf_counter() - started
+                return response.status_code, duration, observation.queries
+
+        start = time.perf_counter()
+        measurements = await asyncio.gather(*(worker(i) for i in range(REQUESTS)))
+        return measurements, time.perf_counter() - start
+
+    return async_to_sync(main)()
+
+
+def record(benchmark_results, benchmark_baseline, key, measurements, elapsed):
+    statuses, durations, queries = zip(*measurements)
+    assert set(statuses) == {200}
+
+    result = summarize(durations, queries, 0)
+    result["concurrency"] = CONCURRENCY
+    result["requests_per_second"] = REQUESTS / elapsed
+    benchmark_results[key] = result
+
+    return find_regressions(result, benchmark_baseline.get(key), THRESHOLD)
+
+
+@override_settings(QUERY_BUDGET_MODE="off")
+def test_throughput(urls, benchmark_results, benchmark_baseline):
+    """Compara req/s, latencia y consultas de las vistas de lectura por WSGI y por ASGI"""
+    regressions = {}
+
+    for name, url in urls.items():
+        key = f"throughput_wsgi_{name}"
+        measurements, elapsed = run_wsgi(url)
+        regressions[key] = record(benchmark_results, benchmark_baseline, key, measurements, elapsed)
+
+        with override_settings(ROOT_URLCONF="app.test.test_integration.urls_async"):
+            measurements, elapsed = run_asgi(url)
+        key = f"throughput_asgi_{name}"
+        regressions[key] = record(benchmark_results, benchmark_baseline, key, measurements, elapsed)
+
+    failures = [f"{key}: " + "; ".join(found) for key, found in regressions.items() if found]
+    assert not failures, "\n".join(failures)
@@ -0,0 +1,166 @@
+import itertools
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+import pytest
+from django.db import DEFAULT_DB_ALIAS, connection, connections
+from django.test import Client, override_settings
+from django.urls import reverse
+
+from app.instrumentation import observe_queries
+from app.metrics import RequestObservation
+from app.sqlite import DEFAULT_SQLITE_PRAGMAS
+
+from .report import find_regressions, summarize
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.django_db]
+
+READERS = int(os.environ.get("BENCHMARK_READERS", 4))
+SECONDS = float(os.environ.get("BENCHMARK_CONCURRENCY_SECONDS", 5))
+THRESHOLD = float(os.environ.get("BENCHMARK_THRESHOLD", 0.25))
+
+# El perfil por defecto de SQLite (rollback journal) contra el de producción
+PROFILES = {
+    "rollback": {"busy_timeout": 5000, "journal_mode": "DELETE", "synchronous": "FULL"},
+    "wal": DEFAULT_SQLITE_PRAGMAS,
+}
+
+unique = itertools.count()
+
+
+class Workload:
+    """Lectores de /events/ y un escritor de event_form corriendo a la vez, cada uno en su thread"""
+
+    def __init__(self, dataset):
+        self.organizer = dataset["organizer"]
+        self.start = threading.Barrier(READERS + 2)
+        self.stop = threading.Event()
+        self.lock = threading.Lock()
+        self.login_lock = threading.Lock()
+        self.durations, self.queries, self.errors = [], [], []
+        self.writes = 0
+
+    def client(self):
+        client = Client()
+        # force_login guarda la sesión fuera de write_transaction: con el rollback journal
+        # las transacciones diferidas de varios threads a la vez se bloquean entre sí
+        with self.login_lock:
+            client.force_login(self.organizer)
+        return client
+
+    def reader(self):
+        client = self.client()
+        url = reverse("events")
+        self.start.wait()
+
+        while not self.stop.is_set():
+            observation = RequestObservation()
+            with observe_queries(observation):
+                started = time.perf_counter()
+                response = client.get(url)
+                duration = time.perf_counter() - started
+
+            assert response.status_code == 200
+            with self.lock:
+                self.durations.append(duration)
+                self.queries.append(observation.queries)
+
+    def writer(self):
+        client = self.client()
+        url = reverse("event_form")
+        self.start.wait()
+
+        while not self.stop.is_set():
+            response = client.post(
+                url,
+                {
+                    "title": f"Evento concurrente {next(unique)}",
+                    "description": "Descripción del evento concurrente",
+                    "date": "2025-09-01",
+                    "time": "20:00",
+                },
+            )
+            assert response.status_code == 302
+            self.writes += 1
+
+    def thread(self, target):
+        def run():
+            try:
+                target()
+            except BaseException as e:
+                self.errors.append(repr(e))
+                self.stop.set()
+                self.start.abort()
+            finally:
+                connections.close_all()
+
+        return threading.Thread(target=run)
+
+    def run(self):
+        threads = [self.thread(self.reader) for _ in range(READERS)]
+        threads.append(self.thread(self.writer))
+        for thread in threads:
+            thread.start()
+
+        started = time.perf_counter()
+        try:
+            self.start.wait()
+            started = time.perf_counter()
+            self.stop.wait(SECONDS)
+        except threading.BrokenBarrierError:
+            # Algún thread falló antes de arrancar: el error queda en self.errors
+            pass
+        self.stop.set()
+        for thread in threads:
+            thread.join()
+
+        return time.perf_counter() - started
+
+
+@contextmanager
+def dataset_copy(path):
+    """
+    Copia la base del dataset a `path` y hace que las conexiones nuevas (las de
+    los threads) usen la copia: así se puede cambiar journal_mode, que queda
+    guardado en el archivo, y lo que escriben no se suma a los otros benchmarks.
+    """
+    target = sqlite3.connect(path)
+    try:
+        connection.connection.backup(target)
+    finally:
+        target.close()
+
+    settings_dict = connections.settings[DEFAULT_DB_ALIAS]
+    original = settings_dict["NAME"]
+    settings_dict["NAME"] = str(path)
+    try:
+        yield
+    finally:
+        settings_dict["NAME"] = original
+
+
+@override_settings(QUERY_BUDGET_MODE="off")
+@pytest.mark.parametrize("profile", PROFILES)
+def test_readers_during_writes(profile, dataset, tmp_path, benchmark_results, benchmark_baseline):
+    """Benchmark de throughput de lectura de /events/ mientras otro thread crea eventos"""
+    with (
+        dataset_copy(tmp_path / "db.sqlite3"),
+        override_settings(SQLITE_PRAGMAS=PROFILES[profile]),
+    ):
+        workload = Workload(dataset)
+        elapsed = workload.run()
+
+    assert not workload.errors, workload.errors
+
+    result = summarize(workload.durations, workload.queries, 0)
+    result["reads_per_second"] = len(workload.durations) / elapsed
+    result["writes_per_second"] = workload.writes / elapsed
+
+    key = f"concurrency_{profile}[{dataset['size']}]"
+    benchmark_results[key] = result
+
+    regressions = find_regressions(result, benchmark_baseline.get(key), THRESHOLD)
+    assert not regressions, f"{key}: " + "; ".join(regressions)
@@ -0,0 +1,146 @@
+import itertools
+import os
+import time
+import tracemalloc
+
+import pytest
+from django.test import Client, override_settings
+from django.urls import reverse
+
+from app.instrumentation import observe_queries
+from app.metrics import RequestObservation
+
+from .report import find_regressions, summarize
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.django_db]
+
+ITERATIONS = int(os.environ.get("BENCHMARK_ITERATIONS", 50))
+# El hash de contraseñas domina login y register: alcanzan menos repeticiones
+PASSWORD_ITERATIONS = int(os.environ.get("BENCHMARK_PASSWORD_ITERATIONS", 10))
+MEMORY_ITERATIONS = int(os.environ.get("BENCHMARK_MEMORY_ITERATIONS", 5))
+WARMUP = int(os.environ.get("BENCHMARK_WARMUP", 3))
+THRESHOLD = float(os.environ.get("BENCHMARK_THRESHOLD", 0.25))
+
+unique = itertools.count()
+
+
+def organizer_client(dataset):
+    client = Client()
+    client.force_login(dataset["organizer"])
+    return client
+
+
+def events_list(dataset):
+    client = organizer_client(dataset)
+    return lambda: client.get(reverse("events"))
+
+
+def event_detail(dataset):
+    client = organizer_client(dataset)
+    url = reverse("event_detail", args=[dataset["event_id"]])
+    return lambda: client.get(url)
+
+
+def event_form_get(dataset):
+    client = organizer_client(dataset)
+    return lambda: client.get(reverse("event_form"))
+
+
+def event_form_post(dataset):
+    client = organizer_client(dataset)
+
+    def send():
+        return client.post(
+            reverse("event_form"),
+            {
+                "title": f"Evento de benchmark {next(unique)}",
+                "description": "Descripción del evento de benchmark",
+                "date": "2025-09-01",
+                "time": "20:00",
+            },
+        )
+
+    return send
+
+
+def login_view(dataset):
+    username = dataset["attendee"].username
+
+    def send():
+        return Client().post(reverse("login"), {"username": username, "password": "password123"})
+
+    return send
+
+
+def register(dataset):
+    def send():
+        username = f"bench_{next(unique)}"
+        return Client().post(
+            reverse("register"),
+            {
+                "email": f"{username}@example.com",
+                "username": username,
+                "password": "password123",
+                "password-confirm": "password123",
+            },
+        )
+
+    return send
+
+
+# Nombre del escenario -> (armado del request, status esperado, repeticiones)
+SCENARIOS = {
+    "events": (events_list, 200, ITERATIONS),
+    "event_detail": (event_detail, 200, ITERATIONS),
+    "event_form_get": (event_form_get, 200, ITERATIONS),
+    "event_form_post": (event_form_post, 302, ITERATIONS),
+    "login_view": (login_view, 302, PASSWORD_ITERATIONS),
+    "register": (register, 302, PASSWORD_ITERATIONS),
+}
+
+
+def measure(send, expected_status, iterations):
+    for _ in range(WARMUP):
+        assert send().status_code == expected_status
+
+    durations, queries = [], []
+    for _ in range(iterations):
+        observation = RequestObservation()
+        with observe_queries(observation):
+            start = time.perf_counter()
+            response = send()
+            durations.append(time.perf_counter() - start)
+
+        assert response.status_code == expected_status
+        queries.append(observation.queries)
+
+    # La memoria se mide aparte porque tracemalloc hace más lento cada request
+    peak_memory = 0
+    tracemalloc.start()
+    try:
+        for _ in range(MEMORY_ITERATIONS):
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+            send()
+            _, peak = tracemalloc.get_traced_memory()
+            peak_memory = max(peak_memory, peak - baseline)
+    finally:
+        tracemalloc.stop()
+
+    return summarize(durations, queries, peak_memory)
+
+
+# Sin throttling: el benchmark repite el login del mismo usuario desde la misma IP
+@override_settings(QUERY_BUDGET_MODE="off", LOGIN_THROTTLE_RATES={})
+@pytest.mark.parametrize("scenario", SCENARIOS)
+def test_view_performance(scenario, dataset, benchmark_results, benchmark_baseline):
+    """Benchmark de latencia, consultas y memoria de una vista con el dataset del tamaño dado"""
+    build, expected_status, iterations = SCENARIOS[scenario]
+
+    result = measure(build(dataset), expected_status, iterations)
+
+    key = f"{scenario}[{dataset['size']}]"
+    benchmark_results[key] = result
+
+    regressions = find_regressions(result, benchmark_baseline.get(key), THRESHOLD)
+    assert not regressions, f"{key}: " + "; ".join(regressions)
@@ -1,9 +1,11 @@
 import os
 
 from django.contrib.staticfiles.testing import StaticLiveServerTestCase
+from django.core.cache import cache
 from playwright.sync_api import sync_playwright
 
 from app.models import User
+from app.throttle import clear_local_blocks
 
 os.environ["DJANGO_ALLOW_ASYNC_UNSAFE"] = "true"
 headless = os.environ.get("HEADLESS", 1) == 1
@@ -26,6 +28,10 @@ class BaseE2ETest(StaticLiveServerTestCase):
         super().tearDownClass()
 
     def setUp(self):
+        # Los logins de los tests anteriores no cuentan para el throttling
+        cache.clear()
+        clear_local_blocks()
+
         # Crear un contexto y página de Playwright
         self.context = self.browser.new_context()
         self.page = self.context.new_page()
@@ -0,0 +1,35 @@
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.urls import resolve
+
+from app.instrumentation import observe_queries
+from app.query_budget import QueryCounter, get_query_budget
+
+
+class QueryBudgetTestMixin:
+    """Métodos auxiliares para verificar el presupuesto de consultas de las vistas"""
+
+    @contextmanager
+    def assertMaxQueries(self, max_queries, max_repeats=None):
+        """Falla si el bloque hace más de max_queries consultas o repite una consulta"""
+        if max_repeats is None:
+            max_repeats = getattr(settings, "QUERY_BUDGET_MAX_REPEATS", 3)
+
+        with observe_queries(QueryCounter()) as counter:
+            yield counter
+
+        problems = counter.problems(max_queries, max_repeats)
+        if problems:
+            self.fail("; ".join(problems) + "\n" + "\n".join(counter.queries))
+
+    def assertWithinQueryBudget(self, method, path, data=None, **extra):
+        """Hace el request y verifica que respete el presupuesto declarado por la vista"""
+        match = resolve(path)
+        budget = get_query_budget(match.func, match.url_name)
+        self.assertIsNotNone(budget, f"La vista {match.url_name} no declara presupuesto")
+
+        with self.assertMaxQueries(budget):
+            response = getattr(self.client, method)(path, data or {}, **extra)
+
+        return response
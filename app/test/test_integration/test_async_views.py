@@ -0,0 +1,104 @@
+import datetime
+
+from asgiref.sync import iscoroutinefunction
+from django.test import AsyncClient, TestCase, override_settings
+from django.urls import resolve, reverse
+from django.utils import timezone
+
+from app.metrics import registry
+from app.models import Event, User
+
+
+@override_settings(ROOT_URLCONF="app.test.test_integration.urls_async")
+class AsyncViewsTest(TestCase):
+    """Tests para las vistas async de solo lectura"""
+
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username="organizador",
+            email="organizador@test.com",
+            password="password123",
+            is_organizer=True,
+        )
+        self.event1 = Event.objects.create(
+            title="Evento 1",
+            description="Descripción del evento 1",
+            scheduled_at=timezone.now() + datetime.timedelta(days=1),
+            organizer=self.organizer,
+        )
+        self.event2 = Event.objects.create(
+            title="Evento 2",
+            description="Descripción del evento 2",
+            scheduled_at=timezone.now() + datetime.timedelta(days=2),
+            organizer=self.organizer,
+        )
+        self.async_client = AsyncClient()
+
+    def test_views_are_async(self):
+        """Test que verifica que las rutas resuelven a las vistas async"""
+        for url in ("/", "/events/", f"/events/{self.event1.id}/"):
+            self.assertTrue(iscoroutinefunction(resolve(url).func), url)
+
+    async def test_home_anonymous(self):
+        """Test que verifica que home funciona sin usuario logueado"""
+        response = await self.async_client.get(reverse("home"))
+
+        self.assertEqual(response.status_code, 200)
+
+    async def test_events_with_login(self):
+        """Test que verifica el listado async con el usuario logueado"""
+        await self.async_client.alogin(username="organizador", password="password123")
+
+        response = await self.async_client.get(reverse("events"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [e.id for e in response.context["events"]], [self.event1.id, self.event2.id]
+        )
+        self.assertTrue(response.context["user_is_organizer"])
+
+    async def test_events_without_login(self):
+        """Test que verifica que el listado async redirige a login sin usuario"""
+        response = await self.async_client.get(reverse("events"))
+
+        self.assertEqual(response.status_code, 302)
+        self.assertTrue(response.url.startswith("/accounts/login/"))
+
+    async def test_events_not_modified(self):
+        """Test que verifica que el listado async responde 304 con el mismo ETag"""
+        await self.async_client.alogin(username="organizador", password="password123")
+        await self.async_client.get(reverse("events"))
+        response = await self.async_client.get(reverse("events"))
+
+        response = await self.async_client.get(
+            reverse("events"), headers={"if-none-match": response["ETag"]}
+        )
+
+        self.assertEqual(response.status_code, 304)
+
+    async def test_event_detail_with_login(self):
+        """Test que verifica el detalle async con el organizador precargado"""
+        await self.async_client.alogin(username="organizador", password="password123")
+
+        response = await self.async_client.get(reverse("event_detail", args=[self.event1.id]))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "organizador")
+
+    async def test_event_detail_not_found(self):
+        """Test que verifica que el detalle async devuelve 404 si el evento no existe"""
+        await self.async_client.alogin(username="organizador", password="password123")
+
+        response = await self.async_client.get(reverse("event_detail", args=[999]))
+
+        self.assertEqual(response.status_code, 404)
+
+    async def test_events_queries_observed(self):
+        """Test que verifica que las consultas hechas desde el ORM async se cuentan por vista"""
+        registry.reset()
+        await self.async_client.alogin(username="organizador", password="password123")
+
+        await self.async_client.get(reverse("events"))
+
+        counters, _ = registry.collect()
+        self.assertGreater(counters[("eventhub_db_queries_total", (("view", "events"),))], 0)
@@ -0,0 +1,122 @@
+import datetime
+from unittest import mock
+
+from django.contrib.auth import BACKEND_SESSION_KEY, authenticate
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from app.backends import user_cache_key
+from app.models import Event, User
+from app.sessions import SessionStore, local_sessions
+
+
+class CachedAuthenticationTest(TestCase):
+    """Tests para la sesión y el usuario cacheados en los requests autenticados"""
+
+    def setUp(self):
+        cache.clear()
+        local_sessions.clear()
+        self.organizer = User.objects.create_user(
+            username="organizador",
+            email="organizador@test.com",
+            password="password123",
+            is_organizer=True,
+        )
+        self.event = Event.objects.create(
+            title="Evento de prueba",
+            description="Descripción del evento",
+            scheduled_at=timezone.now() + datetime.timedelta(days=1),
+            organizer=self.organizer,
+        )
+        self.client.login(username="organizador", password="password123")
+
+    def get(self, url):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        return response, [query["sql"] for query in context.captured_queries]
+
+    def test_warm_request_skips_session_and_user(self):
+        """Test que verifica que con el cache caliente no se consultan sesión ni usuario"""
+        self.client.get(reverse("events"))
+
+        response, queries = self.get(reverse("event_detail", args=[self.event.id]))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["user"], self.organizer)
+        for sql in queries:
+            self.assertNotIn("django_session", sql)
+            self.assertNotIn('FROM "app_user"', sql)
+
+    def test_session_from_model_backend(self):
+        """Test que verifica que las sesiones iniciadas con ModelBackend siguen logueadas"""
+        self.client.logout()
+        self.client.force_login(self.organizer, backend="django.contrib.auth.backends.ModelBackend")
+
+        response = self.client.get(reverse("events"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["user"], self.organizer)
+
+    def test_login_uses_cached_backend(self):
+        """Test que verifica que los logins nuevos quedan con el backend cacheado"""
+        self.assertEqual(
+            self.client.session[BACKEND_SESSION_KEY], "app.backends.CachedModelBackend"
+        )
+
+    def test_failed_login_checks_password_once(self):
+        """Test que verifica que un login fallido no se repite en ModelBackend"""
+        with mock.patch.object(
+            ModelBackend, "authenticate", autospec=True, return_value=None
+        ) as model_authenticate:
+            user = authenticate(username="organizador", password="incorrecta")
+
+        self.assertIsNone(user)
+        self.assertEqual(model_authenticate.call_count, 1)
+
+    def test_home_without_queries(self):
+        """Test que verifica que una página sin datos propios no hace consultas"""
+        self.client.get(reverse("home"))
+
+        response, queries = self.get(reverse("home"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(queries, [])
+
+    def test_user_change_invalidates_cache(self):
+        """Test que verifica que al guardar el usuario se lee de nuevo en el próximo request"""
+        self.client.get(reverse("events"))
+        self.assertIsNotNone(cache.get(user_cache_key(self.organizer.pk)))
+
+        self.organizer.is_organizer = False
+        self.organizer.save()
+        self.assertIsNone(cache.get(user_cache_key(self.organizer.pk)))
+
+        # Un usuario que dejó de ser organizador ya no puede crear eventos
+        response = self.client.get(reverse("event_form"))
+        self.assertRedirects(response, reverse("events"), fetch_redirect_response=False)
+
+    def test_password_change_logs_out(self):
+        """Test que verifica que cambiar la contraseña invalida la sesión cacheada"""
+        self.client.get(reverse("events"))
+
+        self.organizer.set_password("otra_password")
+        self.organizer.save()
+
+        response = self.client.get(reverse("events"))
+        self.assertEqual(response.status_code, 302)
+
+    def test_logout_clears_session(self):
+        """Test que verifica que el logout borra la sesión de todos los niveles de cache"""
+        self.client.get(reverse("events"))
+        session_key = self.client.session.session_key
+
+        self.client.post(reverse("logout"))
+
+        self.assertIsNone(local_sessions.get(SessionStore.cache_key_prefix + session_key))
+        response = self.client.get(reverse("events"))
+        self.assertEqual(response.status_code, 302)
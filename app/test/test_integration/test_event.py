@@ -1,10 +1,17 @@
+import csv
 import datetime
+import io
+import json
 import time
 
-from django.test import Client, TestCase
+from django.core.cache import cache
+from django.db import connection
+from django.test import Client, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 
+from app.metrics import registry
 from app.models import Event, User
 
 
@@ -248,6 +255,42 @@ class EventFormSubmissionTest(BaseEventTestCase):
         self.assertEqual(self.event1.scheduled_at.hour, 16)
         self.assertEqual(self.event1.scheduled_at.minute, 45)
 
+    def test_event_form_post_edit_keeps_organizer(self):
+        """Test que verifica que editar un evento no cambia su organizador"""
+        other = User.objects.create_user(
+            username="otro_organizador",
+            email="otro@example.com",
+            password="password123",
+            is_organizer=True,
+        )
+        self.client.force_login(other)
+
+        response = self.client.post(
+            reverse("event_edit", args=[self.event1.id]),
+            {"title": "Título editado", "description": "", "date": "2025-06-15", "time": "16:45"},
+        )
+
+        self.assertEqual(response.status_code, 302)
+        self.event1.refresh_from_db()
+        self.assertEqual(self.event1.title, "Título editado")
+        self.assertEqual(self.event1.organizer, self.organizer)
+
+    def test_event_form_post_edit_missing_event(self):
+        """Test que verifica que editar un evento inexistente devuelve 404"""
+        self.client.login(username="organizador", password="password123")
+
+        response = self.client.post(
+            reverse("event_edit", args=[9999]),
+            {
+                "title": "Título",
+                "description": "Descripción",
+                "date": "2025-06-15",
+                "time": "16:45",
+            },
+        )
+
+        self.assertEqual(response.status_code, 404)
+
 
 class EventDeleteViewTest(BaseEventTestCase):
     """Tests para la eliminación de eventos"""
@@ -331,3 +374,715 @@ class EventDeleteViewTest(BaseEventTestCase):
 
         # Verificar que el evento sigue existiendo
         self.assertTrue(Event.objects.filter(pk=self.event1.id).exists())
+
+
+class EventBulkViewTest(BaseEventTestCase):
+    """Tests para las acciones en lote de los organizadores"""
+
+    def setUp(self):
+        super().setUp()
+        self.other = User.objects.create_user(
+            username="otro", email="otro@test.com", password="password123", is_organizer=True
+        )
+        self.foreign = Event.objects.create(
+            title="Evento de otro",
+            description="Descripción",
+            scheduled_at=self.event1.scheduled_at,
+            organizer=self.other,
+        )
+
+    def test_bulk_delete(self):
+        """Test que verifica que se borran solo los eventos propios seleccionados"""
+        self.client.login(username="organizador", password="password123")
+
+        response = self.client.post(
+            reverse("event_bulk_delete"),
+            {"ids": [self.event1.id, self.event2.id, self.foreign.id]},
+        )
+
+        self.assertRedirects(response, reverse("events"))
+        self.assertEqual(list(Event.objects.values_list("id", flat=True)), [self.foreign.id])
+
+    def test_bulk_delete_with_regular_user(self):
+        """Test que verifica que un usuario regular no puede borrar en lote"""
+        self.client.login(username="regular", password="password123")
+
+        response = self.client.post(reverse("event_bulk_delete"), {"ids": [self.event1.id]})
+
+        self.assertRedirects(response, reverse("events"))
+        self.assertTrue(Event.objects.filter(pk=self.event1.id).exists())
+
+    def test_bulk_delete_invalid_ids(self):
+        """Test que verifica que ids inválidos o demasiados dan 400"""
+        self.client.login(username="organizador", password="password123")
+
+        response = self.client.post(reverse("event_bulk_delete"), {"ids": ["uno"]})
+        self.assertEqual(response.status_code, 400)
+
+        response = self.client.post(reverse("event_bulk_delete"), {"ids": [str(2**100)]})
+        self.assertEqual(response.status_code, 400)
+
+        response = self.client.post(reverse("event_bulk_delete"), {"ids": ["0"]})
+        self.assertEqual(response.status_code, 400)
+
+        with self.settings(EVENTS_BULK_MAX_IDS=1):
+            response = self.client.post(
+                reverse("event_bulk_delete"), {"ids": [self.event1.id, self.event2.id]}
+            )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(Event.objects.count(), 3)
+
+    def test_bulk_reschedule_by_ids(self):
+        """Test que verifica que se mueven solo los eventos propios seleccionados"""
+        self.client.login(username="organizador", password="password123")
+        before = self.event1.scheduled_at
+
+        response = self.client.post(
+            reverse("event_bulk_reschedule"),
+            {"ids": [self.event1.id, self.foreign.id], "days": "3", "hours": "-1"},
+        )
+
+        self.assertRedirects(response, reverse("events"))
+        self.event1.refresh_from_db()
+        self.event2.refresh_from_db()
+        self.foreign.refresh_from_db()
+        self.assertEqual(self.event1.scheduled_at, before + datetime.timedelta(days=3, hours=-1))
+        self.assertEqual(self.foreign.scheduled_at, before)
+
+    def test_bulk_reschedule_by_range(self):
+        """Test que verifica que sin ids se mueven los eventos propios del rango de fechas"""
+        self.client.login(username="organizador", password="password123")
+        day = timezone.localdate(self.event2.scheduled_at).isoformat()
+        before = self.event2.scheduled_at
+
+        response = self.client.post(
+            reverse("event_bulk_reschedule"), {"from": day, "to": day, "days": "1"}
+        )
+
+        self.assertRedirects(response, reverse("events"))
+        self.event2.refresh_from_db()
+        self.assertEqual(self.event2.scheduled_at, before + datetime.timedelta(days=1))
+        self.assertEqual(
+            Event.objects.get(pk=self.event1.id).scheduled_at, self.event1.scheduled_at
+        )
+
+    def test_bulk_reschedule_invalid(self):
+        """Test que verifica que faltando el desplazamiento o los filtros se responde 400"""
+        self.client.login(username="organizador", password="password123")
+        url = reverse("event_bulk_reschedule")
+
+        self.assertEqual(self.client.post(url, {"ids": [self.event1.id]}).status_code, 400)
+        self.assertEqual(self.client.post(url, {"days": "1"}).status_code, 400)
+        self.assertEqual(self.client.post(url, {"from": "ayer", "days": "1"}).status_code, 400)
+        self.assertEqual(
+            self.client.post(url, {"ids": [str(2**100)], "days": "1"}).status_code, 400
+        )
+
+    def test_bulk_reschedule_out_of_range(self):
+        """Test que verifica que fechas en el extremo o desplazamientos enormes dan 400"""
+        self.client.login(username="organizador", password="password123")
+        url = reverse("event_bulk_reschedule")
+
+        response = self.client.post(url, {"to": "9999-12-31", "days": "1"})
+        self.assertEqual(response.status_code, 400)
+
+        response = self.client.post(url, {"ids": [self.event1.id], "days": "3000000"})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            Event.objects.get(pk=self.event1.id).scheduled_at, self.event1.scheduled_at
+        )
+
+    def test_bulk_reschedule_keeps_events_in_range(self):
+        """Test que verifica que un evento que se saldría del rango de fechas no se mueve"""
+        last = datetime.datetime(9999, 12, 30, tzinfo=datetime.timezone.utc)
+        Event.objects.filter(pk=self.event1.id).update(scheduled_at=last)
+
+        moved = Event.reschedule_many(
+            self.organizer, datetime.timedelta(days=3), ids=[self.event1.id, self.event2.id]
+        )
+
+        self.assertEqual(moved, 1)
+        self.assertEqual(Event.objects.get(pk=self.event1.id).scheduled_at, last)
+
+    def test_events_list_bulk_form(self):
+        """Test que verifica que el listado muestra la selección solo a organizadores"""
+        self.client.login(username="organizador", password="password123")
+        response = self.client.get(reverse("events"))
+        self.assertContains(response, 'form="bulk-actions"')
+        self.assertContains(response, reverse("event_bulk_reschedule"))
+
+        self.client.login(username="regular", password="password123")
+        response = self.client.get(reverse("events"))
+        self.assertNotContains(response, "bulk-actions")
+
+
+class EventsCalendarViewTest(BaseEventTestCase):
+    """Tests para el calendario mensual de eventos"""
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.client.login(username="regular", password="password123")
+
+    def test_calendar_current_month(self):
+        """Test que verifica que el calendario muestra la cantidad de eventos por día"""
+        day = timezone.localdate(self.event1.scheduled_at)
+
+        response = self.client.get(reverse("events_calendar"), {"month": f"{day:%Y-%m}"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, "app/events_calendar.html")
+        self.assertContains(response, reverse("events_calendar_day", args=[day.isoformat()]))
+        self.assertNotContains(response, "Evento 1")
+
+    def test_calendar_invalid_month(self):
+        """Test que verifica que un mes inválido da 400"""
+        response = self.client.get(reverse("events_calendar"), {"month": "junio"})
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_calendar_range_edges(self):
+        """Test que verifica que los meses y días fuera de rango dan 400 y no 500"""
+        for month in ("0001-01", "9999-12"):
+            response = self.client.get(reverse("events_calendar"), {"month": month})
+            self.assertEqual(response.status_code, 400)
+
+        response = self.client.get(reverse("events_calendar_day", args=["9999-12-31"]))
+        self.assertEqual(response.status_code, 400)
+
+    def test_calendar_last_month_without_next(self):
+        """Test que verifica que el último mes del calendario no enlaza al siguiente"""
+        response = self.client.get(reverse("events_calendar"), {"month": "9999-11"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(response.context["next_month"])
+        self.assertContains(response, "?month=9999-10")
+
+    def test_calendar_day(self):
+        """Test que verifica que los eventos de un día se cargan aparte"""
+        day = timezone.localdate(self.event1.scheduled_at)
+
+        response = self.client.get(reverse("events_calendar_day", args=[day.isoformat()]))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Evento 1")
+        self.assertContains(response, reverse("event_detail", args=[self.event1.id]))
+        self.assertNotContains(response, "Evento 2")
+
+    @override_settings(EVENTS_CALENDAR_DAY_LIMIT=1)
+    def test_calendar_day_limit(self):
+        """Test que verifica que un día con más eventos que el límite lo avisa"""
+        Event.objects.create(
+            title="Evento 3",
+            description="Descripción del evento 3",
+            scheduled_at=self.event1.scheduled_at,
+            organizer=self.organizer,
+        )
+        day = timezone.localdate(self.event1.scheduled_at)
+
+        response = self.client.get(reverse("events_calendar_day", args=[day.isoformat()]))
+
+        self.assertEqual(len(response.context["events"]), 1)
+        self.assertTrue(response.context["has_more"])
+
+    def test_calendar_without_login(self):
+        """Test que verifica que el calendario requiere iniciar sesión"""
+        self.client.logout()
+
+        response = self.client.get(reverse("events_calendar"))
+
+        self.assertEqual(response.status_code, 302)
+        self.assertTrue(response.url.startswith("/accounts/login/"))
+
+
+@override_settings(EVENTS_PAGE_SIZE=2)
+class EventsPaginationViewTest(BaseEventTestCase):
+    """Tests para la paginación por cursor del listado de eventos"""
+
+    def setUp(self):
+        super().setUp()
+        self.event3 = Event.objects.create(
+            title="Evento 3",
+            description="Descripción del evento 3",
+            scheduled_at=timezone.now() + datetime.timedelta(days=3),
+            organizer=self.organizer,
+        )
+        self.client.login(username="regular", password="password123")
+
+    def test_events_first_page(self):
+        """Test que verifica que la primera página respeta el tamaño configurado"""
+        response = self.client.get(reverse("events"))
+
+        self.assertEqual(response.status_code, 200)
+        page = response.context["page"]
+        self.assertEqual([e.id for e in page], [self.event1.id, self.event2.id])
+        self.assertTrue(page.has_next)
+        self.assertFalse(page.has_previous)
+
+    def test_events_next_and_previous_page(self):
+        """Test que verifica la navegación hacia adelante y hacia atrás con los cursores"""
+        first = self.client.get(reverse("events")).context["page"]
+
+        response = self.client.get(reverse("events"), {"cursor": first.next_cursor})
+        second = response.context["page"]
+        self.assertEqual([e.id for e in second], [self.event3.id])
+        self.assertFalse(second.has_next)
+        self.assertTrue(second.has_previous)
+
+        response = self.client.get(reverse("events"), {"cursor": second.previous_cursor})
+        back = response.context["page"]
+        self.assertEqual([e.id for e in back], [self.event1.id, self.event2.id])
+        self.assertFalse(back.has_previous)
+
+    def test_events_page_size_param(self):
+        """Test que verifica que se puede elegir el tamaño de página por parámetro"""
+        response = self.client.get(reverse("events"), {"page_size": "3"})
+
+        self.assertEqual(len(response.context["events"]), 3)
+        self.assertFalse(response.context["page"].has_next)
+
+    def test_events_invalid_cursor(self):
+        """Test que verifica que un cursor inválido muestra la primera página"""
+        response = self.client.get(reverse("events"), {"cursor": "no-es-un-cursor"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["events"][0].id, self.event1.id)
+
+    def test_events_page_without_offset_or_count(self):
+        """Test que verifica que la página no usa OFFSET ni COUNT(*)"""
+        first = self.client.get(reverse("events")).context["page"]
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(reverse("events"), {"cursor": first.next_cursor})
+
+        for query in queries.captured_queries:
+            self.assertNotIn("OFFSET", query["sql"].upper())
+            self.assertNotIn("COUNT(", query["sql"].upper())
+
+
+class EventSearchViewTest(BaseEventTestCase):
+    """Tests para la búsqueda de eventos"""
+
+    def test_event_search_with_login(self):
+        """Test que verifica que la búsqueda devuelve los eventos que coinciden"""
+        self.client.login(username="regular", password="password123")
+
+        response = self.client.get(reverse("event_search"), {"q": "evento 2"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, "app/event_search.html")
+        self.assertEqual(response.context["results"][0].id, self.event2.id)
+
+    def test_event_search_without_query(self):
+        """Test que verifica que sin texto de búsqueda no hay resultados"""
+        self.client.login(username="regular", password="password123")
+
+        response = self.client.get(reverse("event_search"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["results"], [])
+
+    def test_event_search_without_login(self):
+        """Test que verifica que la búsqueda redirige a login si el usuario no está logueado"""
+        response = self.client.get(reverse("event_search"), {"q": "evento"})
+
+        self.assertEqual(response.status_code, 302)
+        self.assertTrue(response.url.startswith("/accounts/login/"))
+
+
+class EventsRowCacheViewTest(BaseEventTestCase):
+    """Tests para la cache de filas del listado de eventos"""
+
+    def test_events_reflects_edit(self):
+        """Test que verifica que el listado muestra el evento editado y no la fila cacheada"""
+        self.client.login(username="organizador", password="password123")
+        self.client.get(reverse("events"))
+
+        self.event1.update("Evento 1 Editado", None, None, None)
+        response = self.client.get(reverse("events"))
+
+        self.assertContains(response, "Evento 1 Editado")
+
+    def test_event_delete_removes_row(self):
+        """Test que verifica que un evento eliminado no sigue en el listado cacheado"""
+        self.client.login(username="organizador", password="password123")
+        self.client.get(reverse("events"))
+
+        self.client.post(reverse("event_delete", args=[self.event1.id]))
+        response = self.client.get(reverse("events"))
+
+        self.assertNotContains(response, f"/events/{self.event1.id}/")
+
+    def test_events_rows_use_own_csrf_token(self):
+        """Test que verifica que cada usuario recibe su propio token CSRF en las filas cacheadas"""
+        self.client.login(username="organizador", password="password123")
+        self.client.get(reverse("events"))
+
+        other = Client()
+        other.login(username="organizador", password="password123")
+        response = other.get(reverse("events"))
+
+        # Dos filas más los formularios de logout y de acciones en lote
+        token = response.context["csrf_token"]
+        self.assertContains(response, f'value="{token}"', count=4)
+
+
+class EventsConditionalGetTest(BaseEventTestCase):
+    """Tests para las respuestas 304 del listado y el detalle de eventos"""
+
+    def setUp(self):
+        super().setUp()
+        self.client.login(username="regular", password="password123")
+        # Primera visita para que el cliente tenga la cookie CSRF
+        self.client.get(reverse("events"))
+
+    def test_events_not_modified_with_etag(self):
+        """Test que verifica que el listado responde 304 si el ETag no cambió"""
+        response = self.client.get(reverse("events"))
+        etag = response["ETag"]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("events"), HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertFalse(response.templates)
+        # Sesión y usuario salen del cache: solo queda el agregado sobre updated_at
+        self.assertEqual(len(queries), 1)
+
+    def test_events_not_modified_with_last_modified(self):
+        """Test que verifica que el listado responde 304 con If-Modified-Since"""
+        response = self.client.get(reverse("events"))
+
+        response = self.client.get(
+            reverse("events"), HTTP_IF_MODIFIED_SINCE=response["Last-Modified"]
+        )
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_events_modified_after_update(self):
+        """Test que verifica que editar un evento invalida el ETag del listado"""
+        etag = self.client.get(reverse("events"))["ETag"]
+
+        self.event1.update("Evento 1 Editado", None, None, None)
+        response = self.client.get(reverse("events"), HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Evento 1 Editado")
+
+    def test_events_modified_after_delete(self):
+        """Test que verifica que eliminar un evento invalida el ETag del listado"""
+        etag = self.client.get(reverse("events"))["ETag"]
+
+        organizer = Client()
+        organizer.login(username="organizador", password="password123")
+        organizer.post(reverse("event_delete", args=[self.event2.id]))
+
+        response = self.client.get(reverse("events"), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_events_modified_after_delete_elsewhere(self):
+        """Test que verifica que un borrado hecho por otro proceso invalida el ETag"""
+        etag = self.client.get(reverse("events"))["ETag"]
+
+        # Otro worker: borra directo en la base y este proceso no se entera por su cache
+        Event.objects.filter(pk=self.event2.id).delete()
+        cache.clear()
+
+        response = self.client.get(reverse("events"), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_events_etag_depends_on_role(self):
+        """Test que verifica que organizadores y usuarios regulares no comparten ETag"""
+        etag = self.client.get(reverse("events"))["ETag"]
+
+        organizer = Client()
+        organizer.login(username="organizador", password="password123")
+        response = organizer.get(reverse("events"), HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_event_detail_not_modified(self):
+        """Test que verifica que el detalle responde 304 hasta que el evento cambia"""
+        url = reverse("event_detail", args=[self.event1.id])
+        etag = self.client.get(url)["ETag"]
+
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        self.event1.update(None, "Nueva descripción", None, None)
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_event_detail_cache_control(self):
+        """Test que verifica que las páginas se marcan como privadas y se revalidan"""
+        response = self.client.get(reverse("event_detail", args=[self.event1.id]))
+
+        self.assertIn("private", response["Cache-Control"])
+        self.assertIn("no-cache", response["Cache-Control"])
+
+
+class MetricsViewTest(BaseEventTestCase):
+    """Tests para el endpoint de métricas"""
+
+    def setUp(self):
+        super().setUp()
+        registry.reset()
+
+    def test_metrics_records_views(self):
+        """Test que verifica que se registran requests, consultas y templates por vista"""
+        self.client.login(username="regular", password="password123")
+        self.client.get(reverse("events"))
+
+        response = self.client.get("/metrics")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["Content-Type"].startswith("text/plain"))
+        content = response.content.decode()
+        self.assertIn(
+            'eventhub_http_requests_total{method="GET",status="200",view="events"} 1', content
+        )
+        self.assertIn('eventhub_db_queries_total{view="events"}', content)
+        self.assertIn('eventhub_template_render_duration_seconds_count{view="events"} 1', content)
+
+    def test_metrics_skips_session_and_auth(self):
+        """Test que verifica que el endpoint no consulta la sesión ni el usuario"""
+        self.client.login(username="regular", password="password123")
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/metrics")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(queries), 0)
+        self.assertNotIn("Set-Cookie", response.headers)
+
+    def test_metrics_groups_unmatched_urls(self):
+        """Test que verifica que las URLs inexistentes se agrupan en una sola serie"""
+        self.client.get("/no-existe/")
+
+        response = self.client.get("/metrics")
+
+        self.assertContains(response, 'view="unmatched"')
+
+    def test_metrics_groups_unknown_methods(self):
+        """Test que verifica que los métodos HTTP no estándar se agrupan en una sola serie"""
+        for method in ("FOO1", "FOO2", "BAR"):
+            self.client.generic(method, reverse("events"))
+
+        response = self.client.get("/metrics")
+
+        self.assertContains(response, 'method="other"', count=1)
+        self.assertNotContains(response, 'method="FOO1"')
+
+    @override_settings(METRICS_ALLOWED_IPS=["10.0.0.1"])
+    def test_metrics_allowed_ips(self):
+        """Test que verifica que se puede restringir el acceso por IP"""
+        response = self.client.get("/metrics")
+
+        self.assertEqual(response.status_code, 403)
+
+    def test_metrics_local_only_by_default(self):
+        """Test que verifica que por defecto el endpoint no se publica fuera de la máquina"""
+        response = self.client.get("/metrics", REMOTE_ADDR="203.0.113.5")
+
+        self.assertEqual(response.status_code, 403)
+
+
+class EventExportViewTest(BaseEventTestCase):
+    """Tests para la exportación de eventos en NDJSON y CSV"""
+
+    def read(self, response):
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        return b"".join(response.streaming_content).decode()
+
+    def test_export_ndjson(self):
+        """Test que verifica que se exporta un evento por línea en NDJSON"""
+        self.client.login(username="organizador", password="password123")
+
+        response = self.client.get(reverse("event_export", args=["ndjson"]))
+
+        self.assertTrue(response["Content-Type"].startswith("application/x-ndjson"))
+        lines = [json.loads(line) for line in self.read(response).splitlines()]
+        self.assertEqual([line["id"] for line in lines], [self.event1.id, self.event2.id])
+        self.assertEqual(lines[0]["organizer"], "organizador")
+        self.assertEqual(lines[0]["scheduled_at"], self.event1.scheduled_at.isoformat())
+
+    def test_export_csv(self):
+        """Test que verifica la exportación en CSV con encabezado"""
+        self.client.login(username="organizador", password="password123")
+
+        response = self.client.get(reverse("event_export", args=["csv"]))
+
+        self.assertIn('filename="eventos.csv"', response["Content-Disposition"])
+        rows = list(csv.reader(io.StringIO(self.read(response))))
+        self.assertEqual(rows[0][:3], ["id", "title", "description"])
+        self.assertEqual(rows[1][1], "Evento 1")
+        self.assertEqual(len(rows), 3)
+
+    def test_export_filters(self):
+        """Test que verifica los filtros por organizador y rango de fechas"""
+        self.client.login(username="organizador", password="password123")
+        day = self.event2.scheduled_at.date().isoformat()
+
+        response = self.client.get(
+            reverse("event_export", args=["ndjson"]), {"from": day, "to": day}
+        )
+        lines = self.read(response).splitlines()
+        self.assertEqual([json.loads(line)["id"] for line in lines], [self.event2.id])
+
+        response = self.client.get(
+            reverse("event_export", args=["ndjson"]), {"organizer": "regular"}
+        )
+        self.assertEqual(self.read(response), "")
+
+    def test_export_invalid_date(self):
+        """Test que verifica que una fecha inválida devuelve 400"""
+        self.client.login(username="organizador", password="password123")
+
+        response = self.client.get(reverse("event_export", args=["csv"]), {"from": "ayer"})
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_export_date_out_of_range(self):
+        """Test que verifica que una fecha en el extremo del rango devuelve 400 y no 500"""
+        self.client.login(username="organizador", password="password123")
+        url = reverse("event_export", args=["csv"])
+
+        self.assertEqual(self.client.get(url, {"to": "9999-12-31"}).status_code, 400)
+        self.assertEqual(self.client.get(url, {"from": "0001-01-01"}).status_code, 400)
+        self.assertEqual(self.client.get(url, {"to": "9999-12-30"}).status_code, 200)
+
+    def test_export_unknown_format(self):
+        """Test que verifica que un formato desconocido devuelve 404"""
+        self.client.login(username="organizador", password="password123")
+
+        response = self.client.get(reverse("event_export", args=["xml"]))
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_export_regular_user(self):
+        """Test que verifica que un usuario regular no puede exportar"""
+        self.client.login(username="regular", password="password123")
+
+        response = self.client.get(reverse("event_export", args=["csv"]))
+
+        self.assertRedirects(response, reverse("events"))
+
+
+class EventFeedViewTest(BaseEventTestCase):
+    """Tests para los feeds iCalendar"""
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    def read(self, response):
+        self.assertEqual(response.status_code, 200)
+        return b"".join(response.streaming_content).decode()
+
+    def test_events_feed(self):
+        """Test que verifica que el feed de próximos eventos no requiere login"""
+        response = self.client.get(reverse("events_feed"))
+
+        self.assertTrue(response["Content-Type"].startswith("text/calendar"))
+        ics = self.read(response)
+        self.assertIn(f"UID:event-{self.event1.id}@eventhub", ics)
+        self.assertIn(f"UID:event-{self.event2.id}@eventhub", ics)
+        self.assertIn(f"URL:http://testserver/events/{self.event1.id}/", ics)
+
+    def test_events_feed_hides_organizer_email(self):
+        """Test que verifica que el feed público muestra el username del organizador sin su email"""
+        ics = self.read(self.client.get(reverse("events_feed"))).replace("\r\n ", "")
+
+        self.assertIn(
+            f'ORGANIZER;CN="{self.organizer.username}":http://testserver'
+            f"{reverse('organizer_feed', args=[self.organizer.username])}",
+            ics,
+        )
+        self.assertNotIn(self.organizer.email, ics)
+        self.assertNotIn("mailto:", ics)
+
+    @override_settings(ALLOWED_HOSTS=["testserver", "otro.example"])
+    def test_events_feed_cached_per_host(self):
+        """Test que verifica que cada host recibe el feed con sus propias URLs"""
+        self.read(self.client.get(reverse("events_feed")))
+
+        ics = self.read(self.client.get(reverse("events_feed"), HTTP_HOST="otro.example"))
+
+        self.assertIn(f"URL:http://otro.example/events/{self.event1.id}/", ics)
+        self.assertNotIn("http://testserver/", ics)
+
+    @override_settings(EVENTS_FEED_CACHE_MAX_SIZE=100)
+    def test_events_feed_too_large_not_cached(self):
+        """Test que verifica que un feed más grande que el límite no se guarda en cache"""
+        first = self.read(self.client.get(reverse("events_feed")))
+
+        with CaptureQueriesContext(connection) as queries:
+            second = self.read(self.client.get(reverse("events_feed")))
+
+        self.assertEqual(first, second)
+        self.assertGreater(len(queries), 1)
+
+    def test_events_feed_excludes_past_events(self):
+        """Test que verifica que el feed solo incluye eventos desde hoy"""
+        past = Event.objects.create(
+            title="Evento pasado",
+            description="Descripción",
+            scheduled_at=timezone.now() - datetime.timedelta(days=3),
+            organizer=self.organizer,
+        )
+
+        ics = self.read(self.client.get(reverse("events_feed")))
+
+        self.assertNotIn(f"UID:event-{past.id}@eventhub", ics)
+
+    def test_events_feed_not_modified(self):
+        """Test que verifica que el feed responde 304 mientras no cambien los eventos"""
+        response = self.client.get(reverse("events_feed"))
+        self.read(response)
+
+        response = self.client.get(reverse("events_feed"), HTTP_IF_NONE_MATCH=response["ETag"])
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_events_feed_cached(self):
+        """Test que verifica que la segunda descarga sale de la cache sin leer las filas"""
+        first = self.read(self.client.get(reverse("events_feed")))
+
+        with CaptureQueriesContext(connection) as queries:
+            second = self.read(self.client.get(reverse("events_feed")))
+
+        self.assertEqual(first, second)
+        # Solo el agregado de la versión
+        self.assertEqual(len(queries), 1)
+
+    def test_events_feed_changes_after_update(self):
+        """Test que verifica que editar un evento genera una nueva versión del feed"""
+        response = self.client.get(reverse("events_feed"))
+        self.read(response)
+
+        self.event1.update("Evento 1 Editado", None, None, None)
+        response = self.client.get(reverse("events_feed"), HTTP_IF_NONE_MATCH=response["ETag"])
+
+        self.assertIn("SUMMARY:Evento 1 Editado", self.read(response))
+
+    def test_organizer_feed(self):
+        """Test que verifica el feed de un organizador"""
+        other = User.objects.create_user(
+            username="otro", email="otro@test.com", password="password123", is_organizer=True
+        )
+        other_event = Event.objects.create(
+            title="Evento de otro",
+            description="Descripción",
+            scheduled_at=timezone.now() + datetime.timedelta(days=1),
+            organizer=other,
+        )
+
+        ics = self.read(self.client.get(reverse("organizer_feed", args=["organizador"])))
+
+        self.assertIn(f"UID:event-{self.event1.id}@eventhub", ics)
+        self.assertNotIn(f"UID:event-{other_event.id}@eventhub", ics)
+
+    def test_organizer_feed_not_found(self):
+        """Test que verifica que el feed de un usuario que no es organizador da 404"""
+        response = self.client.get(reverse("organizer_feed", args=["regular"]))
+
+        self.assertEqual(response.status_code, 404)
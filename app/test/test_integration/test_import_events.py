@@ -0,0 +1,230 @@
+import io
+import json
+import os
+import tempfile
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from app.management.commands.import_events import iter_json_array
+from app.models import Event, User
+
+
+class ImportEventsCommandTest(TestCase):
+    """Tests para el comando import_events"""
+
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username="organizador",
+            email="organizador@test.com",
+            password="password123",
+            is_organizer=True,
+        )
+        self.regular = User.objects.create_user(
+            username="regular",
+            email="regular@test.com",
+            password="password123",
+        )
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def write(self, name, content):
+        path = os.path.join(self.tmpdir.name, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+        return path
+
+    def run_import(self, path, *args):
+        out = io.StringIO()
+        call_command("import_events", path, *args, stdout=out)
+        return out.getvalue()
+
+    def test_import_csv(self):
+        """Test que verifica la importación de un CSV con organizador por username"""
+        path = self.write(
+            "eventos.csv",
+            "title,description,scheduled_at,organizer\n"
+            "Jazz,Noche de jazz,2025-06-20T20:00:00Z,organizador\n"
+            "Rock,Noche de rock,2025-06-21 21:00,organizador\n",
+        )
+
+        output = self.run_import(path)
+
+        self.assertIn("2 eventos importados, 0 rechazados", output)
+        self.assertIn("filas/s", output)
+        rock = Event.objects.get(title="Rock")
+        self.assertEqual(rock.organizer, self.organizer)
+        self.assertIsNotNone(rock.scheduled_at.tzinfo)
+
+    def test_import_csv_with_bom(self):
+        """Test que verifica que se importa un CSV con BOM, como los que guarda Excel"""
+        path = self.write(
+            "eventos.csv",
+            "\ufefftitle,description,scheduled_at,organizer\n"
+            "Jazz,Noche de jazz,2025-06-20T20:00:00Z,organizador\n",
+        )
+
+        output = self.run_import(path)
+
+        self.assertIn("1 eventos importados, 0 rechazados", output)
+
+    def test_import_ndjson_in_batches(self):
+        """Test que verifica que se importa en varios lotes"""
+        lines = [
+            json.dumps(
+                {
+                    "title": f"Evento {i}",
+                    "description": "Descripción",
+                    "scheduled_at": "2025-06-20T20:00:00Z",
+                    "organizer": self.organizer.pk,
+                }
+            )
+            for i in range(7)
+        ]
+        path = self.write("eventos.ndjson", "\n".join(lines))
+
+        self.run_import(path, "--batch-size", "3")
+
+        self.assertEqual(Event.objects.count(), 7)
+
+    def test_import_fixture_json(self):
+        """Test que verifica que se acepta el formato de fixtures de Django"""
+        fixture = [
+            {
+                "model": "app.event",
+                "pk": 1,
+                "fields": {
+                    "title": "Concierto de Jazz",
+                    "description": "Una noche con los mejores músicos de jazz.",
+                    "scheduled_at": "2025-06-20T20:00:00Z",
+                    "organizer": self.organizer.pk,
+                },
+            }
+        ]
+        path = self.write("events.json", json.dumps(fixture))
+
+        self.run_import(path)
+
+        self.assertTrue(Event.objects.filter(title="Concierto de Jazz").exists())
+
+    def test_import_rejected_rows(self):
+        """Test que verifica que las filas inválidas van al archivo de errores"""
+        path = self.write(
+            "eventos.ndjson",
+            "\n".join(
+                [
+                    '{"title": "Válido", "description": "D", "scheduled_at": "2025-06-20T20:00:00Z", "organizer": "organizador"}',
+                    '{"title": "", "description": "D", "scheduled_at": "2025-06-20T20:00:00Z", "organizer": "organizador"}',
+                    '{"title": "Sin fecha", "description": "D", "scheduled_at": "mañana", "organizer": "organizador"}',
+                    '{"title": "No organizador", "description": "D", "scheduled_at": "2025-06-20T20:00:00Z", "organizer": "regular"}',
+                    "no es json",
+                ]
+            ),
+        )
+        errors_path = os.path.join(self.tmpdir.name, "errores.ndjson")
+
+        output = self.run_import(path, "--errors", errors_path)
+
+        self.assertIn("1 eventos importados, 4 rechazados", output)
+        with open(errors_path, encoding="utf-8") as f:
+            errors = [json.loads(line) for line in f]
+        self.assertEqual([e["record"] for e in errors], [2, 3, 4, 5])
+        self.assertIn("title", errors[0]["errors"])
+        self.assertIn("scheduled_at", errors[1]["errors"])
+        self.assertIn("organizer", errors[2]["errors"])
+        self.assertEqual(errors[3]["row"], "no es json")
+
+    def test_import_scheduled_at_not_string(self):
+        """Test que verifica que una fecha que no es texto rechaza la fila sin cortar la importación"""
+        path = self.write(
+            "eventos.ndjson",
+            "\n".join(
+                [
+                    '{"title": "Número", "description": "D", "scheduled_at": 12345, "organizer": "organizador"}',
+                    '{"title": "Objeto", "description": "D", "scheduled_at": {"a": 1}, "organizer": "organizador"}',
+                    '{"title": "Válido", "description": "D", "scheduled_at": "2025-06-20T20:00:00Z", "organizer": "organizador"}',
+                ]
+            ),
+        )
+        errors_path = os.path.join(self.tmpdir.name, "errores.ndjson")
+
+        output = self.run_import(path, "--errors", errors_path)
+
+        self.assertIn("1 eventos importados, 2 rechazados", output)
+        with open(errors_path, encoding="utf-8") as f:
+            errors = [json.loads(line) for line in f]
+        self.assertTrue(all("scheduled_at" in e["errors"] for e in errors))
+
+    def test_import_organizer_out_of_range(self):
+        """Test que verifica que un organizador con dígitos no ASCII o un id enorme solo rechaza su fila"""
+        path = self.write(
+            "eventos.ndjson",
+            "\n".join(
+                [
+                    '{"title": "Superíndice", "description": "D", "scheduled_at": "2025-06-20T20:00:00Z", "organizer": "²"}',
+                    '{"title": "Id enorme", "description": "D", "scheduled_at": "2025-06-20T20:00:00Z", "organizer": "99999999999999999999999"}',
+                    f'{{"title": "Por id", "description": "D", "scheduled_at": "2025-06-20T20:00:00Z", "organizer": {self.organizer.pk}}}',
+                ]
+            ),
+        )
+        errors_path = os.path.join(self.tmpdir.name, "errores.ndjson")
+
+        output = self.run_import(path, "--errors", errors_path)
+
+        self.assertIn("1 eventos importados, 2 rechazados", output)
+        with open(errors_path, encoding="utf-8") as f:
+            errors = [json.loads(line) for line in f]
+        self.assertTrue(all("organizer" in e["errors"] for e in errors))
+
+    def test_import_scheduled_at_out_of_range(self):
+        """Test que verifica que una fecha que no se puede pasar a UTC rechaza la fila sin cortar la importación"""
+        path = self.write(
+            "eventos.ndjson",
+            "\n".join(
+                [
+                    '{"title": "Fin de los tiempos", "description": "D", "scheduled_at": "9999-12-31T23:59:00-05:00", "organizer": "organizador"}',
+                    '{"title": "Válido", "description": "D", "scheduled_at": "2025-06-20T20:00:00Z", "organizer": "organizador"}',
+                ]
+            ),
+        )
+        errors_path = os.path.join(self.tmpdir.name, "errores.ndjson")
+
+        output = self.run_import(path, "--errors", errors_path)
+
+        self.assertIn("1 eventos importados, 1 rechazados", output)
+        with open(errors_path, encoding="utf-8") as f:
+            errors = [json.loads(line) for line in f]
+        self.assertIn("scheduled_at", errors[0]["errors"])
+
+    def test_import_missing_file(self):
+        """Test que verifica que un archivo inexistente es un error del comando"""
+        errors_path = os.path.join(self.tmpdir.name, "errores.ndjson")
+
+        with self.assertRaisesMessage(CommandError, "No se pudo abrir el archivo"):
+            self.run_import(
+                os.path.join(self.tmpdir.name, "no-existe.csv"), "--errors", errors_path
+            )
+
+        self.assertFalse(os.path.exists(errors_path))
+
+    def test_import_unknown_format(self):
+        """Test que verifica que un formato desconocido es un error del comando"""
+        path = self.write("eventos.xml", "<eventos/>")
+
+        with self.assertRaises(CommandError):
+            self.run_import(path)
+
+
+class IterJsonArrayTest(TestCase):
+    def test_iter_json_array_small_chunks(self):
+        """Test que verifica que el array se lee bien aunque los objetos queden partidos"""
+        data = json.dumps([{"title": "a" * 50, "n": i} for i in range(20)])
+
+        items = list(iter_json_array(io.StringIO(data), chunk_size=7))
+
+        self.assertEqual([item["n"] for item in items], list(range(20)))
+
+    def test_iter_json_array_not_array(self):
+        """Test que verifica que un JSON que no es array es un error"""
+        with self.assertRaises(CommandError):
+            list(iter_json_array(io.StringIO('{"title": "a"}')))
@@ -0,0 +1,185 @@
+import datetime
+
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import Client, RequestFactory, TestCase, override_settings
+from django.urls import ResolverMatch, reverse
+from django.utils import timezone
+
+from app.middleware import QueryBudgetMiddleware
+from app.models import Event, User
+from app.query_budget import QueryBudgetExceeded, normalize_sql, query_budget
+from app.sessions import local_sessions
+from app.test.test_integration.base import QueryBudgetTestMixin
+
+
+class QueryBudgetViewsTest(QueryBudgetTestMixin, TestCase):
+    """Tests que verifican que las vistas respetan su presupuesto de consultas"""
+
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username="organizador",
+            email="organizador@test.com",
+            password="password123",
+            is_organizer=True,
+        )
+        # Suficientes eventos para que un N+1 supere el máximo de repeticiones
+        self.events = [
+            Event.objects.create(
+                title=f"Evento {i}",
+                description=f"Descripción del evento {i}",
+                scheduled_at=timezone.now() + datetime.timedelta(days=i),
+                organizer=self.organizer,
+            )
+            for i in range(10)
+        ]
+        self.client = Client()
+        self.client.login(username="organizador", password="password123")
+
+    def test_events_within_budget(self):
+        """Test que verifica el presupuesto del listado de eventos"""
+        response = self.assertWithinQueryBudget("get", reverse("events"))
+        self.assertEqual(response.status_code, 200)
+
+    def test_event_detail_within_budget(self):
+        """Test que verifica que el detalle trae el organizador sin otra consulta"""
+        response = self.assertWithinQueryBudget(
+            "get", reverse("event_detail", args=[self.events[0].id])
+        )
+        self.assertContains(response, "organizador")
+
+    def test_event_form_within_budget(self):
+        """Test que verifica el presupuesto del formulario de eventos"""
+        self.assertWithinQueryBudget("get", reverse("event_edit", args=[self.events[0].id]))
+        self.assertWithinQueryBudget(
+            "post",
+            reverse("event_form"),
+            {
+                "title": "Nuevo Evento",
+                "description": "Descripción",
+                "date": "2025-05-01",
+                "time": "14:30",
+            },
+        )
+
+    def test_event_delete_within_budget(self):
+        """Test que verifica el presupuesto de la eliminación de eventos"""
+        self.assertWithinQueryBudget("post", reverse("event_delete", args=[self.events[0].id]))
+
+    def test_login_within_budget(self):
+        """Test que verifica el presupuesto del login"""
+        self.client = Client()
+        self.assertWithinQueryBudget(
+            "post", reverse("login"), {"username": "organizador", "password": "password123"}
+        )
+
+    def test_register_logged_in_within_budget(self):
+        """Test que verifica el presupuesto de un registro con otra sesión abierta"""
+        # Peor caso: la sesión no está en el cache y login() tiene que rotarla
+        cache.clear()
+        local_sessions.clear()
+
+        response = self.assertWithinQueryBudget(
+            "post",
+            reverse("register"),
+            {
+                "email": "nuevo@test.com",
+                "username": "nuevo",
+                "password": "password123",
+                "password-confirm": "password123",
+            },
+        )
+
+        self.assertRedirects(response, reverse("events"), fetch_redirect_response=False)
+        self.assertEqual(
+            self.client.session["_auth_user_id"], str(User.objects.get(username="nuevo").pk)
+        )
+
+    def test_login_other_user_with_rehash_within_budget(self):
+        """Test que verifica el presupuesto de un login que rehashea y cambia de usuario"""
+        with self.settings(PASSWORD_HASHER_ITERATIONS=1000):
+            other = User.objects.create_user(username="otro", password="password123")
+        cache.clear()
+        local_sessions.clear()
+
+        with self.settings(PASSWORD_HASHER_ITERATIONS=2000):
+            response = self.assertWithinQueryBudget(
+                "post", reverse("login"), {"username": "otro", "password": "password123"}
+            )
+
+        self.assertRedirects(response, reverse("events"), fetch_redirect_response=False)
+        self.assertEqual(self.client.session["_auth_user_id"], str(other.pk))
+        other.refresh_from_db()
+        self.assertTrue(other.password.startswith("pbkdf2_sha256$2000$"))
+
+
+class QueryBudgetMiddlewareTest(TestCase):
+    """Tests para el middleware de presupuesto de consultas"""
+
+    def setUp(self):
+        organizers = [
+            User(username=f"organizador{i}", email=f"organizador{i}@test.com", is_organizer=True)
+            for i in range(5)
+        ]
+        User.objects.bulk_create(organizers)
+        for organizer in User.objects.all():
+            Event.objects.create(
+                title="Evento",
+                description="Descripción",
+                scheduled_at=timezone.now(),
+                organizer=organizer,
+            )
+        self.request = RequestFactory().get("/events/")
+
+    def render_organizers(self, request):
+        # Simula un template que accede a event.organizer en cada fila
+        names = [event.organizer.username for event in Event.objects.all()]
+        return HttpResponse(", ".join(names))
+
+    @override_settings(QUERY_BUDGET_MODE="raise")
+    def test_middleware_raises_on_n_plus_one(self):
+        """Test que verifica que el middleware detecta una consulta repetida por fila"""
+        middleware = QueryBudgetMiddleware(self.render_organizers)
+
+        with self.assertRaisesMessage(QueryBudgetExceeded, "posible N+1"):
+            middleware(self.request)
+
+    @override_settings(QUERY_BUDGET_MODE="raise")
+    def test_middleware_raises_over_budget(self):
+        """Test que verifica que el middleware falla si la vista supera su presupuesto"""
+        view = query_budget(0)(lambda request: HttpResponse(Event.objects.count()))
+        self.request.resolver_match = ResolverMatch(view, (), {}, url_name="test")
+        middleware = QueryBudgetMiddleware(view)
+
+        with self.assertRaisesMessage(QueryBudgetExceeded, "el máximo es 0"):
+            middleware(self.request)
+
+    @override_settings(QUERY_BUDGET_MODE="log")
+    def test_middleware_logs_in_log_mode(self):
+        """Test que verifica que en modo log solo se registra un warning"""
+        middleware = QueryBudgetMiddleware(self.render_organizers)
+
+        with self.assertLogs("app.query_budget", "WARNING"):
+            response = middleware(self.request)
+
+        self.assertEqual(response.status_code, 200)
+
+    @override_settings(QUERY_BUDGET_MODE="raise")
+    def test_middleware_select_related_passes(self):
+        """Test que verifica que con select_related no se detecta N+1"""
+
+        def view(request):
+            events = Event.objects.select_related("organizer")
+            return HttpResponse(", ".join(event.organizer.username for event in events))
+
+        response = QueryBudgetMiddleware(view)(self.request)
+        self.assertEqual(response.status_code, 200)
+
+
+class QueryCounterTest(TestCase):
+    def test_normalize_sql_in_params(self):
+        """Test que verifica que los IN con distinta cantidad de parámetros se normalizan igual"""
+        self.assertEqual(
+            normalize_sql("SELECT 1 WHERE id IN (%s, %s, %s)"),
+            normalize_sql("SELECT 1 WHERE id IN (%s)"),
+        )
@@ -0,0 +1,133 @@
+import datetime
+
+from django.db import connection
+from django.db.models import Max
+from django.test import TestCase
+from django.utils import timezone
+
+from app.calendar import day_counts
+from app.models import Event, User
+from app.pagination import encode_cursor, paginate_events
+
+
+class QueryPlanTestCase(TestCase):
+    """
+    Corre EXPLAIN QUERY PLAN sobre las consultas que ejecutan las vistas y falla
+    si SQLite recorre la tabla completa o arma un B-tree temporal para ordenar.
+    """
+
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username="organizador",
+            email="organizador@test.com",
+            password="password123",
+            is_organizer=True,
+        )
+        for i in range(20):
+            Event.objects.create(
+                title=f"Evento {i}",
+                description="Descripción",
+                scheduled_at=timezone.now() + datetime.timedelta(days=i),
+                organizer=self.organizer,
+            )
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+    def capture_queries(self, func):
+        queries = []
+
+        def wrapper(execute, sql, params, many, context):
+            queries.append((sql, params))
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(wrapper):
+            func()
+
+        return queries
+
+    def explain(self, sql, params):
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+            return [row[-1] for row in cursor.fetchall()]
+
+    def assertIndexedPlan(self, func):
+        queries = self.capture_queries(func)
+        self.assertTrue(queries)
+
+        for sql, params in queries:
+            plan = self.explain(sql, params)
+            for step in plan:
+                self.assertFalse(
+                    step.startswith("SCAN") and "USING" not in step,
+                    f"Full table scan en {sql!r}: {plan}",
+                )
+                self.assertNotIn("TEMP B-TREE", step, f"Orden temporal en {sql!r}: {plan}")
+
+
+class EventQueryPlanTest(QueryPlanTestCase):
+    def test_events_first_page_plan(self):
+        """Test que verifica que la primera página del listado usa el índice"""
+        self.assertIndexedPlan(lambda: paginate_events(Event.objects.all(), None, 10))
+
+    def test_events_next_page_plan(self):
+        """Test que verifica que la página siguiente usa el índice"""
+        event = Event.objects.order_by("scheduled_at", "id")[5]
+        cursor = encode_cursor("n", event.scheduled_at, event.id)
+
+        self.assertIndexedPlan(lambda: paginate_events(Event.objects.all(), cursor, 10))
+
+    def test_events_previous_page_plan(self):
+        """Test que verifica que la página anterior usa el índice"""
+        event = Event.objects.order_by("scheduled_at", "id")[15]
+        cursor = encode_cursor("p", event.scheduled_at, event.id)
+
+        self.assertIndexedPlan(lambda: paginate_events(Event.objects.all(), cursor, 10))
+
+    def test_organizer_events_plan(self):
+        """Test que verifica que los eventos de un organizador usan el índice compuesto"""
+        self.assertIndexedPlan(
+            lambda: list(
+                Event.objects.filter(organizer=self.organizer).order_by("scheduled_at")[:10]
+            )
+        )
+
+    def test_last_updated_plan(self):
+        """Test que verifica que la última modificación se resuelve con el índice"""
+        self.assertIndexedPlan(lambda: Event.objects.aggregate(Max("updated_at")))
+
+    def test_event_detail_plan(self):
+        """Test que verifica que el detalle busca por clave primaria"""
+        event = Event.objects.first()
+        self.assertIndexedPlan(lambda: Event.objects.get(pk=event.pk))
+
+    def test_calendar_day_counts_plan(self):
+        """Test que verifica que los conteos del calendario recorren solo el rango del índice"""
+        month = timezone.localdate().replace(day=1)
+        queries = self.capture_queries(
+            lambda: day_counts(month, month + datetime.timedelta(days=42))
+        )
+
+        self.assertEqual(len(queries), 1)
+        plan = self.explain(*queries[0])
+        # El GROUP BY por día usa un B-tree temporal, pero solo con las filas del rango
+        self.assertEqual(
+            plan[0],
+            "SEARCH app_event USING COVERING INDEX event_scheduled_at_id_idx "
+            "(scheduled_at>? AND scheduled_at<?)",
+        )
+
+
+class UserQueryPlanTest(QueryPlanTestCase):
+    def setUp(self):
+        User.objects.bulk_create(
+            User(username=f"usuario{i}", email=f"usuario{i}@test.com") for i in range(50)
+        )
+        super().setUp()
+
+    def test_validate_new_user_plan(self):
+        """Test que verifica que la validación de email y username usa los índices únicos"""
+        self.assertIndexedPlan(
+            lambda: User.validate_new_user(
+                "Organizador@Test.com", "organizador", "password123", "password123"
+            )
+        )
@@ -0,0 +1,120 @@
+import datetime
+import io
+import tempfile
+from pathlib import Path
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test import TransactionTestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from app.models import Event, User
+from app.routers import PRIMARY_COOKIE
+from app.sessions import local_sessions
+
+
+@override_settings(DATABASE_REPLICAS=["replica"], REPLICA_STICKY_SECONDS=10)
+class ReplicaReadsTest(TransactionTestCase):
+    """
+    La réplica es un archivo SQLite aparte que solo se actualiza al correr
+    replicate_sqlite, así se ve qué lee cada request.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        # El alias se agrega acá y no en settings: el runner solo crea la base de test de default
+        cls.directory = tempfile.TemporaryDirectory()
+        connections.settings["replica"] = {
+            **connections.settings[DEFAULT_DB_ALIAS],
+            "NAME": str(Path(cls.directory.name) / "replica.sqlite3"),
+        }
+        cls.databases = {DEFAULT_DB_ALIAS, "replica"}
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        connections["replica"].close()
+        del connections["replica"]
+        del connections.settings["replica"]
+        cls.directory.cleanup()
+
+    def setUp(self):
+        cache.clear()
+        local_sessions.clear()
+
+        self.organizer = User.objects.create_user(
+            username="organizador", password="password123", is_organizer=True
+        )
+        self.replicate()
+        self.client.force_login(self.organizer)
+
+    def replicate(self):
+        call_command("replicate_sqlite", verbosity=0, stdout=io.StringIO())
+
+    def create_event(self, title):
+        return Event.objects.create(
+            title=title,
+            description="Descripción",
+            scheduled_at=timezone.now() + datetime.timedelta(days=1),
+            organizer=self.organizer,
+        )
+
+    def test_get_reads_from_replica(self):
+        """Test que verifica que el listado lee de la réplica hasta que se replica"""
+        self.create_event("Evento sin replicar")
+
+        self.assertNotContains(self.client.get(reverse("events")), "Evento sin replicar")
+
+        self.replicate()
+        self.assertContains(self.client.get(reverse("events")), "Evento sin replicar")
+
+    def test_cached_user_read_from_primary(self):
+        """Test que verifica que el usuario cacheado no sale de una réplica atrasada"""
+        self.client.get(reverse("events"))
+
+        # Se le quita el rol en la primaria; la réplica sigue con la fila vieja
+        self.organizer.is_organizer = False
+        self.organizer.save()
+
+        response = self.client.get(reverse("events"))
+        self.assertFalse(response.context["user"].is_organizer)
+        self.assertFalse(self.client.get(reverse("events")).context["user"].is_organizer)
+
+    def test_read_your_writes_after_post(self):
+        """Test que verifica que después de crear un evento el organizador lo ve sin replicar"""
+        response = self.client.post(
+            reverse("event_form"),
+            {
+                "title": "Evento nuevo",
+                "description": "Descripción",
+                "date": "2030-01-01",
+                "time": "20:00",
+            },
+        )
+        self.assertIn(PRIMARY_COOKIE, response.cookies)
+
+        self.assertContains(self.client.get(reverse("events")), "Evento nuevo")
+
+        # Vencida la ventana vuelve a leer de la réplica, que todavía no lo tiene
+        del self.client.cookies[PRIMARY_COOKIE]
+        self.assertNotContains(self.client.get(reverse("events")), "Evento nuevo")
+
+    def test_register_sticks_to_primary(self):
+        """Test que verifica que un usuario recién registrado navega aunque la réplica no lo tenga"""
+        self.client.logout()
+
+        response = self.client.post(
+            reverse("register"),
+            {
+                "email": "nuevo@test.com",
+                "username": "nuevo",
+                "password": "password123",
+                "password-confirm": "password123",
+            },
+        )
+
+        self.assertRedirects(response, reverse("events"))
+        self.assertEqual(self.client.get(reverse("events")).status_code, 200)
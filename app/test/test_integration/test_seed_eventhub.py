@@ -0,0 +1,124 @@
+import datetime
+import io
+from unittest import mock
+
+from django.core.management import CommandError, call_command
+from django.db.models import Count
+from django.test import TestCase
+
+from app.models import Event, User
+from app.search import search_events
+
+
+class SeedEventhubCommandTest(TestCase):
+    """Tests para el comando seed_eventhub"""
+
+    def seed(self, *args, start_date="2025-06-01"):
+        out = io.StringIO()
+        if start_date:
+            args = ("--start-date", start_date, *args)
+        call_command(
+            "seed_eventhub",
+            "--users",
+            "50",
+            "--events",
+            "300",
+            "--batch-size",
+            "64",
+            *args,
+            stdout=out,
+        )
+        return out.getvalue()
+
+    def snapshot(self):
+        return list(
+            Event.objects.order_by("id").values_list(
+                "title", "description", "scheduled_at", "organizer__username"
+            )
+        )
+
+    def test_seed_creates_users_and_events(self):
+        """Test que verifica la cantidad de usuarios, organizadores y eventos generados"""
+        output = self.seed("--organizer-ratio", "0.2")
+
+        self.assertIn("50 usuarios (10 organizadores) y 300 eventos", output)
+        self.assertEqual(User.objects.filter(username__startswith="seed_").count(), 50)
+        self.assertEqual(User.objects.filter(is_organizer=True).count(), 10)
+        self.assertEqual(Event.objects.count(), 300)
+        self.assertFalse(Event.objects.filter(organizer__is_organizer=False).exists())
+
+        user = User.objects.get(username="seed_user1")
+        self.assertTrue(user.check_password("password123"))
+
+    def test_seed_is_deterministic(self):
+        """Test que verifica que la misma semilla genera los mismos datos"""
+        self.seed()
+        first = self.snapshot()
+
+        self.seed("--clear")
+        self.assertEqual(self.snapshot(), first)
+
+        self.seed("--clear", "--seed", "7")
+        self.assertNotEqual(self.snapshot(), first)
+
+    def test_seed_default_start_date_is_fixed(self):
+        """Test que verifica que sin --start-date los datos no dependen del día en que se corre"""
+        with mock.patch("django.utils.timezone.localdate", return_value=datetime.date(2025, 1, 1)):
+            self.seed(start_date=None)
+        first = self.snapshot()
+
+        with mock.patch("django.utils.timezone.localdate", return_value=datetime.date(2030, 1, 1)):
+            self.seed("--clear", start_date=None)
+        self.assertEqual(self.snapshot(), first)
+
+    def test_seed_negative_events(self):
+        """Test que verifica el mensaje de error para una cantidad de eventos negativa"""
+        with self.assertRaisesMessage(CommandError, "--events"):
+            self.seed("--events", "-1")
+
+    def test_seed_distribution(self):
+        """Test que verifica el rango de fechas y el reparto desparejo entre organizadores"""
+        self.seed()
+
+        start = datetime.datetime(2025, 6, 1, tzinfo=datetime.timezone.utc)
+        self.assertFalse(
+            Event.objects.filter(scheduled_at__lt=start - datetime.timedelta(days=181)).exists()
+        )
+        self.assertFalse(
+            Event.objects.filter(scheduled_at__gt=start + datetime.timedelta(days=367)).exists()
+        )
+
+        counts = list(
+            Event.objects.values("organizer")
+            .annotate(total=Count("id"))
+            .order_by("-total")
+            .values_list("total", flat=True)
+        )
+        self.assertGreater(counts[0], counts[-1])
+
+    def test_seed_requires_clear(self):
+        """Test que verifica que no se duplican datos generados sin --clear"""
+        self.seed()
+
+        with self.assertRaises(CommandError):
+            self.seed()
+
+        self.assertEqual(Event.objects.count(), 300)
+
+    def test_seeded_events_are_searchable(self):
+        """Test que verifica que el índice de búsqueda se reconstruye después de la carga"""
+        self.seed()
+
+        results = search_events("concierto")
+        self.assertTrue(results)
+        self.assertTrue(all("Concierto" in event.title for event in results))
+
+        # El trigger de INSERT vuelve a estar activo para los eventos nuevos
+        organizer = User.objects.filter(is_organizer=True).first()
+        Event.objects.create(
+            title="Zarzuela única",
+            description="Descripción",
+            scheduled_at=datetime.datetime(2025, 7, 1, tzinfo=datetime.timezone.utc),
+            organizer=organizer,
+        )
+        self.assertEqual([e.title for e in search_events("zarzuela")], ["Zarzuela única"])
@@ -1,7 +1,13 @@
-from django.test import Client, TestCase
+import time
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import Client, TestCase, override_settings
 from django.urls import reverse
 
+from app.metrics import registry
 from app.models import User
+from app.throttle import clear_local_blocks
 
 
 class RegisterViewBaseTest(TestCase):
@@ -75,6 +81,22 @@ class RegisterViewValidationTest(RegisterViewBaseTest):
         # Verificar que no se creó un nuevo usuario
         self.assertEqual(User.objects.count(), 1)  # Solo existe el usuario creado en setUp
 
+    def test_register_concurrent_duplicate_email(self):
+        """Test que verifica que un registro que gana la carrera de validación devuelve el error"""
+        data = self.valid_user_data.copy()
+        data["email"] = "EXISTENTE@example.com"
+
+        # Simula otro request que creó el usuario entre la validación y el INSERT
+        with mock.patch.object(User, "validate_new_user", return_value={}):
+            response = self.client.post(self.register_url, data)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.context["errors"], {"email": "Ya existe un usuario con este email"}
+        )
+        self.assertEqual(User.objects.count(), 1)
+        self.assertNotIn("_auth_user_id", self.client.session)
+
     def test_register_duplicate_username(self):
         """Test que verifica que no se puede registrar con un nombre de usuario existente"""
         data = self.valid_user_data.copy()
@@ -145,6 +167,9 @@ class LoginViewBaseTest(TestCase):
         )
         # Datos de login válidos
         self.valid_credentials = {"username": "usuario_test", "password": "password123"}
+        # Los intentos de login de otros tests no cuentan para el throttling
+        cache.clear()
+        clear_local_blocks()
 
 
 class LoginViewLoadTest(LoginViewBaseTest):
@@ -171,6 +196,24 @@ class LoginViewSuccessTest(LoginViewBaseTest):
         self.assertEqual(int(self.client.session["_auth_user_id"]), self.test_user.pk)
 
 
+class LoginViewRehashTest(LoginViewBaseTest):
+    """Tests para la actualización del hash de la contraseña en el login"""
+
+    def test_login_rehashes_password(self):
+        """Test que verifica que el login vuelve a hashear con las iteraciones nuevas"""
+        with self.settings(PASSWORD_HASHER_ITERATIONS=1000):
+            self.test_user.set_password("password123")
+            self.test_user.save()
+
+        with self.settings(PASSWORD_HASHER_ITERATIONS=2000):
+            response = self.client.post(self.login_url, self.valid_credentials)
+
+        self.assertRedirects(response, reverse("events"))
+        self.test_user.refresh_from_db()
+        self.assertTrue(self.test_user.password.startswith("pbkdf2_sha256$2000$"))
+        self.assertTrue(self.test_user.check_password("password123"))
+
+
 class LoginViewFailureTest(LoginViewBaseTest):
     """Tests para fallos en el login"""
 
@@ -225,3 +268,62 @@ class LoginViewFailureTest(LoginViewBaseTest):
 
         # Verificar que el usuario no está autenticado
         self.assertNotIn("_auth_user_id", self.client.session)
+
+
+@override_settings(LOGIN_THROTTLE_RATES={"ip": (4, 60), "username": (2, 60)})
+class LoginViewThrottleTest(LoginViewBaseTest):
+    """Tests para el límite de intentos de login"""
+
+    def setUp(self):
+        super().setUp()
+        registry.reset()
+        self.invalid_credentials = {"username": "usuario_test", "password": "password_incorrecto"}
+
+    def test_login_throttled_by_username(self):
+        """Test que verifica que se rechazan los intentos de más de un mismo username"""
+        # Con el reloj quieto la espera no depende de cuánto tarde el hash de las contraseñas
+        with mock.patch("app.throttle.time.time", return_value=time.time()):
+            for _ in range(2):
+                response = self.client.post(self.login_url, self.invalid_credentials)
+                self.assertEqual(response.status_code, 200)
+
+            # Ni siquiera la contraseña correcta pasa mientras el bucket está vacío
+            response = self.client.post(self.login_url, self.valid_credentials)
+
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response["Retry-After"], "60")
+        self.assertEqual(
+            response.context["error"], "Demasiados intentos, probá de nuevo en 60 segundos"
+        )
+        self.assertNotIn("_auth_user_id", self.client.session)
+
+        counters, _ = registry.collect()
+        self.assertEqual(counters[("eventhub_login_throttled_total", (("scope", "username"),))], 1)
+
+    def test_login_throttled_by_ip(self):
+        """Test que verifica que se rechazan los intentos de más de una misma IP"""
+        for i in range(4):
+            response = self.client.post(
+                self.login_url, {"username": f"usuario{i}", "password": "password123"}
+            )
+            self.assertEqual(response.status_code, 200)
+
+        response = self.client.post(self.login_url, self.valid_credentials)
+        self.assertEqual(response.status_code, 429)
+
+        # Desde otra IP el mismo username todavía puede entrar
+        response = self.client.post(self.login_url, self.valid_credentials, REMOTE_ADDR="10.0.0.2")
+        self.assertRedirects(response, reverse("events"))
+
+        counters, _ = registry.collect()
+        self.assertEqual(counters[("eventhub_login_throttled_total", (("scope", "ip"),))], 1)
+
+    def test_successful_login_resets_username(self):
+        """Test que verifica que un login correcto devuelve los intentos del username"""
+        self.client.post(self.login_url, self.invalid_credentials)
+        self.client.post(self.login_url, self.valid_credentials)
+        self.client.logout()
+
+        for _ in range(2):
+            response = self.client.post(self.login_url, self.invalid_credentials)
+            self.assertEqual(response.status_code, 200)
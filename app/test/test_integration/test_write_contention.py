@@ -0,0 +1,128 @@
+import sqlite3
+import tempfile
+import threading
+from pathlib import Path
+
+from django.db import DEFAULT_DB_ALIAS, connection, connections
+from django.test import Client, TransactionTestCase, override_settings
+from django.urls import reverse
+
+from app.metrics import registry
+from app.models import Event, User
+from app.sqlite import DEFAULT_SQLITE_PRAGMAS
+
+WORKERS = 4
+ITERATIONS = 15
+
+
+# Sin espera de SQLite: cada choque entre escrituras pasa por los reintentos
+@override_settings(
+    SQLITE_PRAGMAS={**DEFAULT_SQLITE_PRAGMAS, "busy_timeout": 0},
+    DB_WRITE_RETRY_DEADLINE=30,
+)
+class WriteContentionTest(TransactionTestCase):
+    """
+    Varios organizadores crean, editan y borran eventos a la vez. Corre sobre
+    una copia en disco de la base de test: la base en memoria compartida usa
+    locks por tabla, que no se parecen a los de un despliegue real.
+    """
+
+    def setUp(self):
+        registry.reset()
+        self.organizers = [
+            User.objects.create_user(
+                username=f"organizador{i}", password="password123", is_organizer=True
+            )
+            for i in range(WORKERS)
+        ]
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = Path(directory.name) / "db.sqlite3"
+
+        target = sqlite3.connect(path)
+        try:
+            connection.connection.backup(target)
+            # journal_mode queda en el archivo: se cambia antes de que haya otras conexiones
+            target.execute("PRAGMA journal_mode = WAL")
+        finally:
+            target.close()
+
+        # Las conexiones nuevas (las de los threads) abren la copia
+        settings_dict = connections.settings[DEFAULT_DB_ALIAS]
+        original = settings_dict["NAME"]
+        settings_dict["NAME"] = str(path)
+        self.addCleanup(settings_dict.__setitem__, "NAME", original)
+
+    def in_thread(self, target, *args):
+        errors = []
+
+        def run():
+            try:
+                target(*args)
+            except BaseException as e:
+                errors.append(repr(e))
+                self.barrier.abort()
+            finally:
+                connections.close_all()
+
+        return threading.Thread(target=run), errors
+
+    def hammer(self, organizer, statuses):
+        client = Client()
+        # force_login guarda la sesión fuera de write_transaction: uno por vez
+        with self.login_lock:
+            client.force_login(organizer)
+        self.barrier.wait()
+
+        for i in range(ITERATIONS):
+            title = f"{organizer.username} evento {i}"
+            data = {
+                "title": title,
+                "description": "Descripción",
+                "date": "2025-09-01",
+                "time": "20:00",
+            }
+
+            statuses.append(client.post(reverse("event_form"), data).status_code)
+            id = Event.objects.values_list("id", flat=True).get(title=title)
+
+            data["title"] = f"{title} editado"
+            statuses.append(client.post(reverse("event_edit", args=[id]), data).status_code)
+
+            if i % 2:
+                statuses.append(client.post(reverse("event_delete", args=[id])).status_code)
+
+    def test_concurrent_writes(self):
+        """Test que verifica que con escrituras concurrentes no hay 500 ni escrituras perdidas"""
+        self.barrier = threading.Barrier(WORKERS)
+        self.login_lock = threading.Lock()
+        statuses = []
+        workers = [
+            self.in_thread(self.hammer, organizer, statuses) for organizer in self.organizers
+        ]
+
+        for thread, _ in workers:
+            thread.start()
+        for thread, _ in workers:
+            thread.join()
+
+        self.assertEqual([error for _, errors in workers for error in errors], [])
+        self.assertEqual(set(statuses), {302})
+
+        titles = []
+        reader, errors = self.in_thread(
+            lambda: titles.extend(Event.objects.values_list("title", flat=True))
+        )
+        reader.start()
+        reader.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(
+            sorted(titles),
+            sorted(
+                f"{organizer.username} evento {i} editado"
+                for organizer in self.organizers
+                for i in range(0, ITERATIONS, 2)
+            ),
+        )
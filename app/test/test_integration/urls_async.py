@@ -0,0 +1,12 @@
+from django.urls import path
+
+from app import async_views
+from app.urls import urlpatterns as app_urlpatterns
+
+# Mismas rutas que app.urls pero con las vistas async, como en el despliegue ASGI
+urlpatterns = [
+    path("", async_views.home, name="home"),
+    path("events/", async_views.events, name="events"),
+    path("events/<int:id>/", async_views.event_detail, name="event_detail"),
+    *app_urlpatterns,
+]
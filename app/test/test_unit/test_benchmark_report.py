@@ -0,0 +1,45 @@
+from django.test import SimpleTestCase
+
+from app.test.test_benchmark.report import find_regressions, percentile, summarize
+
+
+class BenchmarkReportTest(SimpleTestCase):
+    def setUp(self):
+        self.baseline = summarize([0.010] * 20, [3] * 20, 100_000)
+
+    def test_percentile_interpolates(self):
+        """Test que verifica el cálculo de percentiles con interpolación lineal"""
+        values = [4, 1, 3, 2]
+
+        self.assertEqual(percentile(values, 0), 1)
+        self.assertEqual(percentile(values, 50), 2.5)
+        self.assertEqual(percentile(values, 100), 4)
+        self.assertIsNone(percentile([], 95))
+
+    def test_summarize(self):
+        """Test que verifica el resumen de un escenario en milisegundos"""
+        result = summarize([0.001, 0.002, 0.003], [2, 4, 3], 2048)
+
+        self.assertEqual(result["requests"], 3)
+        self.assertAlmostEqual(result["latency_ms"]["p50"], 2.0)
+        self.assertAlmostEqual(result["latency_ms"]["max"], 3.0)
+        self.assertEqual(result["queries_per_request"], 4)
+        self.assertEqual(result["peak_memory_bytes"], 2048)
+
+    def test_no_regressions_within_threshold(self):
+        """Test que verifica que variaciones dentro del umbral no fallan"""
+        result = summarize([0.012] * 20, [3] * 20, 110_000)
+
+        self.assertEqual(find_regressions(result, self.baseline, 0.25), [])
+        self.assertEqual(find_regressions(result, None, 0.25), [])
+
+    def test_regressions(self):
+        """Test que verifica que se detectan más latencia, consultas y memoria"""
+        result = summarize([0.020] * 20, [4] * 20, 200_000)
+
+        regressions = find_regressions(result, self.baseline, 0.25)
+
+        self.assertEqual(len(regressions), 3)
+        self.assertIn("p95", regressions[0])
+        self.assertIn("consultas", regressions[1])
+        self.assertIn("memoria", regressions[2])
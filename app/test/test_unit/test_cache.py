@@ -0,0 +1,155 @@
+import datetime
+
+from django.core.cache import cache, caches
+from django.template import Context, Template
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from app.cache import event_row_cache_key, get_events_version
+from app.models import Event, EventsVersion, User
+
+ROW_TEMPLATE = Template(
+    "{% load event_cache %}"
+    "{% cache_event_row event user_is_organizer %}"
+    "{{ event.title }}|{% csrf_token %}"
+    "{% endcache_event_row %}"
+)
+
+
+class EventsVersionTest(TestCase):
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username="organizador_test",
+            email="organizador@example.com",
+            password="password123",
+            is_organizer=True,
+        )
+
+    def test_writes_bump_version(self):
+        """Test que verifica que altas, ediciones y borrados mueven la versión en la base"""
+        version, _ = EventsVersion.current()
+
+        Event.new("Evento", "Descripción", timezone.now(), self.organizer)
+        self.assertEqual(EventsVersion.current()[0], version + 1)
+
+        Event.objects.get(title="Evento").update("Otro título", None, None, None)
+        self.assertEqual(EventsVersion.current()[0], version + 2)
+
+        # También un borrado que no pasa por los métodos del modelo
+        Event.objects.all().delete()
+        self.assertEqual(EventsVersion.current()[0], version + 3)
+
+    @override_settings(EVENTS_VERSION_DEFER_MIN_ROWS=2)
+    def test_bulk_writes_bump_version_once(self):
+        """Test que verifica que las escrituras masivas mueven la versión una sola vez"""
+        items = [
+            {
+                "title": f"Evento {i}",
+                "description": "Descripción",
+                "scheduled_at": timezone.now(),
+                "organizer": self.organizer,
+            }
+            for i in range(5)
+        ]
+        version, _ = EventsVersion.current()
+
+        events, _ = Event.new_many(items)
+        self.assertEqual(EventsVersion.current()[0], version + 1)
+
+        Event.reschedule_many(self.organizer, datetime.timedelta(days=1))
+        self.assertEqual(EventsVersion.current()[0], version + 2)
+
+        Event.delete_many(self.organizer, [event.id for event in events])
+        self.assertEqual(EventsVersion.current()[0], version + 3)
+
+        # Debajo del mínimo, y para las escrituras de a una, siguen los triggers
+        Event.new("Evento", "Descripción", timezone.now(), self.organizer)
+        self.assertEqual(EventsVersion.current()[0], version + 4)
+
+    def test_version_shared_between_processes(self):
+        """Test que verifica que la versión no depende del cache local del proceso"""
+        before = get_events_version()
+
+        Event.new("Evento", "Descripción", timezone.now(), self.organizer)
+        cache.clear()
+
+        self.assertNotEqual(get_events_version(), before)
+
+    def test_version_survives_flush(self):
+        """Test que verifica que la fila de versión se recrea si se borró"""
+        EventsVersion.objects.all().delete()
+        self.assertEqual(EventsVersion.current(), (0, None))
+
+        Event.new("Evento", "Descripción", timezone.now(), self.organizer)
+        self.assertEqual(EventsVersion.current()[0], 1)
+
+
+class EventRowCacheTagTest(TestCase):
+    def setUp(self):
+        self.row_cache = caches["event_rows"]
+        self.row_cache.clear()
+        organizer = User.objects.create_user(
+            username="organizador_test",
+            email="organizador@example.com",
+            password="password123",
+            is_organizer=True,
+        )
+        self.event = Event.objects.create(
+            title="Evento",
+            description="Descripción",
+            scheduled_at=timezone.now() + datetime.timedelta(days=1),
+            organizer=organizer,
+        )
+
+    def render(self, csrf_token="token-1"):
+        return ROW_TEMPLATE.render(
+            Context(
+                {
+                    "event": self.event,
+                    "user_is_organizer": True,
+                    "csrf_token": csrf_token,
+                }
+            )
+        )
+
+    def test_row_is_cached(self):
+        """Test que verifica que la fila se sirve desde cache sin volver a renderizar"""
+        self.render()
+        key = event_row_cache_key(self.event, True)
+        self.assertIsNotNone(self.row_cache.get(key))
+
+        # Cambiar el título sin tocar updated_at: se sigue sirviendo la versión cacheada
+        self.event.title = "Cambiado"
+        self.assertTrue(self.render().startswith("Evento|"))
+
+    def test_row_outside_default_cache(self):
+        """Test que verifica que las filas no ocupan lugar en el cache de sesiones y throttling"""
+        cache.clear()
+        self.render()
+
+        self.assertIsNone(cache.get(event_row_cache_key(self.event, True)))
+        self.assertEqual(len(cache._cache), 0)
+
+    def test_row_csrf_token_not_cached(self):
+        """Test que verifica que el token CSRF de cada request no queda en cache"""
+        first = self.render(csrf_token="token-1")
+        second = self.render(csrf_token="token-2")
+
+        self.assertIn('value="token-1"', first)
+        self.assertIn('value="token-2"', second)
+
+    def test_row_invalidated_by_updated_at(self):
+        """Test que verifica que una fila modificada nunca se sirve desde cache"""
+        self.render()
+
+        self.event.update("Cambiado", None, None, None)
+        self.assertTrue(self.render().startswith("Cambiado|"))
+
+    def test_row_survives_other_writes(self):
+        """Test que verifica que escribir otro evento no invalida las filas que no cambiaron"""
+        self.render()
+        key = event_row_cache_key(self.event, True)
+
+        Event.new("Otro evento", "Descripción", timezone.now(), self.event.organizer)
+
+        self.assertIsNotNone(self.row_cache.get(key))
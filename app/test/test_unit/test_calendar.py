@@ -0,0 +1,121 @@
+import datetime
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from app.calendar import (
+    InvalidCalendarDate,
+    day_events,
+    month_grid,
+    parse_day,
+    parse_month,
+    shift_month,
+)
+from app.models import Event, User
+from app.routers import replica_reads
+
+
+class CalendarDatesTest(TestCase):
+    def test_parse_month(self):
+        """Test que verifica el mes pedido, el actual por defecto y los valores inválidos"""
+        self.assertEqual(parse_month("2025-02"), datetime.date(2025, 2, 1))
+        self.assertEqual(parse_month(None), timezone.localdate().replace(day=1))
+
+        with self.assertRaises(InvalidCalendarDate):
+            parse_month("2025-13")
+
+    def test_shift_month(self):
+        """Test que verifica el mes anterior y el siguiente al cambiar de año"""
+        self.assertEqual(shift_month(datetime.date(2025, 1, 1), -1), datetime.date(2024, 12, 1))
+        self.assertEqual(shift_month(datetime.date(2025, 12, 1), 1), datetime.date(2026, 1, 1))
+
+    def test_calendar_range_edges(self):
+        """Test que verifica que los meses y días en los extremos de datetime se rechazan"""
+        for value in ("0001-01", "9999-12"):
+            with self.assertRaises(InvalidCalendarDate):
+                parse_month(value)
+        for value in ("0001-01-01", "9999-12-31"):
+            with self.assertRaises(InvalidCalendarDate):
+                parse_day(value)
+
+        self.assertEqual(parse_day("9999-12-30"), datetime.date(9999, 12, 30))
+        self.assertIsNone(shift_month(parse_month("0001-02"), -1))
+        self.assertIsNone(shift_month(parse_month("9999-11"), 1))
+        self.assertIsNone(shift_month(datetime.date(9999, 12, 1), 1))
+
+
+@override_settings(TIME_ZONE="America/Argentina/Buenos_Aires")
+class MonthGridTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.organizer = User.objects.create_user(
+            username="organizador_test",
+            email="organizador@example.com",
+            password="password123",
+            is_organizer=True,
+        )
+        self.month = datetime.date(2025, 6, 1)
+
+    def create_event(self, title, year, month, day, hour):
+        return Event.objects.create(
+            title=title,
+            description="Descripción",
+            scheduled_at=timezone.make_aware(datetime.datetime(year, month, day, hour)),
+            organizer=self.organizer,
+        )
+
+    def counts(self, weeks):
+        return {day: count for week in weeks for day, count, _ in week if count}
+
+    def test_counts_per_local_day(self):
+        """Test que verifica los conteos por día en la zona horaria local con una consulta"""
+        self.create_event("Tarde", 2025, 6, 10, 18)
+        # 23:30 en Buenos Aires ya es el día siguiente en UTC
+        self.create_event("Noche", 2025, 6, 10, 23)
+        self.create_event("Otro día", 2025, 6, 20, 12)
+        self.create_event("Otro mes", 2025, 8, 1, 12)
+
+        with self.assertNumQueries(2):
+            weeks = month_grid(self.month)
+
+        self.assertEqual(
+            self.counts(weeks), {datetime.date(2025, 6, 10): 2, datetime.date(2025, 6, 20): 1}
+        )
+        self.assertEqual(weeks[0][0], (datetime.date(2025, 5, 26), 0, False))
+        self.assertTrue(all(len(week) == 7 for week in weeks))
+
+    def test_grid_cached_per_version(self):
+        """Test que verifica que la grilla se sirve del cache hasta que cambian los eventos"""
+        self.create_event("Tarde", 2025, 6, 10, 18)
+        month_grid(self.month)
+
+        # Solo la lectura de la versión
+        with self.assertNumQueries(1):
+            month_grid(self.month)
+
+        self.create_event("Nuevo", 2025, 6, 11, 18)
+
+        with self.assertNumQueries(2):
+            weeks = month_grid(self.month)
+        self.assertEqual(self.counts(weeks)[datetime.date(2025, 6, 11)], 1)
+
+    @override_settings(DATABASE_REPLICAS=["replica_inexistente"])
+    def test_grid_reads_primary(self):
+        """Test que verifica que la grilla que se guarda en cache se cuenta en la primaria"""
+        self.create_event("Tarde", 2025, 6, 10, 18)
+
+        with replica_reads():
+            weeks = month_grid(self.month)
+
+        self.assertEqual(self.counts(weeks), {datetime.date(2025, 6, 10): 1})
+
+    def test_day_events(self):
+        """Test que verifica los eventos de un día en orden y con límite"""
+        self.create_event("Segundo", 2025, 6, 10, 20)
+        self.create_event("Primero", 2025, 6, 10, 9)
+        self.create_event("Otro día", 2025, 6, 11, 9)
+
+        day = datetime.date(2025, 6, 10)
+        self.assertEqual([event.title for event in day_events(day, 10)], ["Primero", "Segundo"])
+        self.assertEqual(len(day_events(day, 1)), 1)
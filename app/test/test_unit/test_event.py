@@ -1,9 +1,12 @@
 import datetime
 
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
 from app.models import Event, User
+from app.signals import events_changed
 
 
 class EventModelTest(TestCase):
@@ -140,3 +143,275 @@ class EventModelTest(TestCase):
         self.assertEqual(updated_event.title, original_title)
         self.assertEqual(updated_event.description, new_description)
         self.assertEqual(updated_event.scheduled_at, original_scheduled_at)
+
+
+class EventChangeTrackingTest(TestCase):
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username="organizador_test",
+            email="organizador@example.com",
+            password="password123",
+            is_organizer=True,
+        )
+        self.other_organizer = User.objects.create_user(
+            username="otro_organizador",
+            email="otro@example.com",
+            password="password123",
+            is_organizer=True,
+        )
+        created = Event.objects.create(
+            title="Evento de prueba",
+            description="Descripción del evento de prueba",
+            scheduled_at=timezone.now() + datetime.timedelta(days=1),
+            organizer=self.organizer,
+        )
+        self.event = Event.objects.get(pk=created.pk)
+
+    def test_changed_fields(self):
+        """Test que verifica que se detectan solo los campos modificados"""
+        self.assertEqual(self.event.changed_fields(), [])
+
+        self.event.title = "Otro título"
+        self.event.organizer = self.other_organizer
+
+        self.assertEqual(self.event.changed_fields(), ["title", "organizer"])
+
+        self.event.save()
+        self.assertEqual(self.event.changed_fields(), [])
+
+    def test_update_without_changes_skips_write(self):
+        """Test que verifica que si nada cambió no se escribe en la base"""
+        updated_at = self.event.updated_at
+
+        with self.assertNumQueries(0):
+            saved = self.event.update(self.event.title, None, self.event.scheduled_at)
+
+        self.assertFalse(saved)
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.updated_at, updated_at)
+
+    def test_update_writes_changed_columns(self):
+        """Test que verifica que el UPDATE incluye solo las columnas modificadas"""
+        with CaptureQueriesContext(connection) as context:
+            saved = self.event.update(None, "Nueva descripción", None)
+
+        self.assertTrue(saved)
+        updates = [q["sql"] for q in context.captured_queries if q["sql"].startswith("UPDATE")]
+        self.assertEqual(len(updates), 1)
+        self.assertIn('"description"', updates[0])
+        self.assertIn('"updated_at"', updates[0])
+        self.assertNotIn('"title"', updates[0])
+        self.assertNotIn('"organizer_id"', updates[0])
+
+    def test_update_keeps_organizer(self):
+        """Test que verifica que editar no reemplaza al organizador"""
+        self.event.update("Título nuevo", None, None)
+
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.organizer, self.organizer)
+
+    def test_update_by_id_single_query(self):
+        """Test que verifica la edición con un solo UPDATE sin leer la fila"""
+        scheduled_at = timezone.now() + datetime.timedelta(days=5)
+
+        with self.assertNumQueries(1):
+            found = Event.update_by_id(self.event.id, "Título nuevo", "", scheduled_at)
+
+        self.assertTrue(found)
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.title, "Título nuevo")
+        self.assertEqual(self.event.description, "Descripción del evento de prueba")
+        self.assertEqual(self.event.scheduled_at, scheduled_at)
+        self.assertEqual(self.event.organizer, self.organizer)
+
+    def test_update_by_id_without_changes(self):
+        """Test que verifica que la edición sin cambios no modifica updated_at"""
+        updated_at = self.event.updated_at
+
+        found = Event.update_by_id(
+            self.event.id, self.event.title, self.event.description, self.event.scheduled_at
+        )
+
+        self.assertTrue(found)
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.updated_at, updated_at)
+
+    def test_update_by_id_missing_event(self):
+        """Test que verifica que editar un evento inexistente devuelve False"""
+        self.assertFalse(Event.update_by_id(self.event.id + 100, "Título", "Descripción", None))
+
+
+class EventNewManyTest(TestCase):
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username="organizador_test",
+            email="organizador@example.com",
+            password="password123",
+            is_organizer=True,
+        )
+        self.signals = []
+
+        def receiver(sender, **kwargs):
+            self.signals.append(kwargs)
+
+        events_changed.connect(receiver)
+        self.addCleanup(events_changed.disconnect, receiver)
+
+    def item(self, i, **overrides):
+        item = {
+            "title": f"Evento {i}",
+            "description": f"Descripción {i}",
+            "scheduled_at": timezone.now() + datetime.timedelta(days=i),
+            "organizer": self.organizer,
+        }
+        item.update(overrides)
+        return item
+
+    def test_new_many_creates_with_ids(self):
+        """Test que verifica que se crean todos los eventos en un INSERT y con id asignado"""
+        with self.assertNumQueries(1):
+            events, errors = Event.new_many([self.item(i) for i in range(50)])
+
+        self.assertEqual(errors, {})
+        self.assertEqual(len(events), 50)
+        self.assertTrue(all(event.pk for event in events))
+        self.assertEqual(
+            set(Event.objects.values_list("id", flat=True)), {event.pk for event in events}
+        )
+        self.assertEqual(events[0].changed_fields(), [])
+
+    def test_new_many_errors_by_position(self):
+        """Test que verifica que los inválidos se reportan por posición y el resto se crea"""
+        items = [
+            self.item(0),
+            self.item(1, title=""),
+            self.item(2),
+            self.item(3, description="", scheduled_at=None, organizer=None),
+        ]
+
+        events, errors = Event.new_many(items)
+
+        self.assertEqual([event.title for event in events], ["Evento 0", "Evento 2"])
+        self.assertEqual(errors[1], {"title": "Por favor ingrese un titulo"})
+        self.assertEqual(set(errors[3]), {"description", "scheduled_at", "organizer"})
+        self.assertEqual(Event.objects.count(), 2)
+
+    def test_new_many_single_signal(self):
+        """Test que verifica que se manda una sola señal para todo el lote"""
+        events, _ = Event.new_many([self.item(i) for i in range(10)])
+
+        self.assertEqual(len(self.signals), 1)
+        self.assertEqual(self.signals[0]["action"], "created")
+        self.assertEqual(self.signals[0]["events"], events)
+
+    def test_new_many_all_invalid(self):
+        """Test que verifica que sin eventos válidos no se escribe ni se avisa"""
+        with self.assertNumQueries(0):
+            events, errors = Event.new_many([self.item(0, title="")])
+
+        self.assertEqual(events, [])
+        self.assertEqual(list(errors), [0])
+        self.assertEqual(self.signals, [])
+
+
+class EventBulkActionsTest(TestCase):
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username="organizador_test",
+            email="organizador@example.com",
+            password="password123",
+            is_organizer=True,
+        )
+        self.other = User.objects.create_user(
+            username="otro_organizador",
+            email="otro@example.com",
+            password="password123",
+            is_organizer=True,
+        )
+        self.start = timezone.now().replace(microsecond=0) + datetime.timedelta(days=1)
+        self.events = [
+            Event.objects.create(
+                title=f"Evento {i}",
+                description="Descripción",
+                scheduled_at=self.start + datetime.timedelta(days=i),
+                organizer=self.organizer,
+            )
+            for i in range(3)
+        ]
+        self.foreign = Event.objects.create(
+            title="Evento ajeno",
+            description="Descripción",
+            scheduled_at=self.start,
+            organizer=self.other,
+        )
+        self.signals = []
+
+        def receiver(sender, **kwargs):
+            self.signals.append(kwargs)
+
+        events_changed.connect(receiver)
+        self.addCleanup(events_changed.disconnect, receiver)
+
+    def test_delete_many_single_statement(self):
+        """Test que verifica que se borra con un solo DELETE que filtra por organizador"""
+        ids = [self.events[0].pk, self.events[1].pk, self.foreign.pk]
+
+        with CaptureQueriesContext(connection) as queries:
+            deleted = Event.delete_many(self.organizer, ids)
+
+        self.assertEqual(deleted, 2)
+        self.assertEqual(len(queries), 1)
+        self.assertTrue(queries[0]["sql"].startswith("DELETE"))
+        self.assertIn("organizer_id", queries[0]["sql"])
+        self.assertEqual(
+            set(Event.objects.values_list("id", flat=True)), {self.events[2].pk, self.foreign.pk}
+        )
+        self.assertEqual(self.signals[0]["action"], "deleted")
+        self.assertEqual(self.signals[0]["count"], 2)
+
+    def test_delete_many_foreign_events(self):
+        """Test que verifica que no se borran eventos de otro organizador ni se avisa"""
+        deleted = Event.delete_many(self.organizer, [self.foreign.pk])
+
+        self.assertEqual(deleted, 0)
+        self.assertTrue(Event.objects.filter(pk=self.foreign.pk).exists())
+        self.assertEqual(self.signals, [])
+
+    def test_reschedule_many_by_ids(self):
+        """Test que verifica que se mueven las fechas con un solo UPDATE relativo"""
+        delta = datetime.timedelta(days=2, hours=3)
+
+        with CaptureQueriesContext(connection) as queries:
+            updated = Event.reschedule_many(
+                self.organizer, delta, ids=[self.events[0].pk, self.foreign.pk]
+            )
+
+        self.assertEqual(updated, 1)
+        self.assertEqual(len(queries), 1)
+        self.assertTrue(queries[0]["sql"].startswith("UPDATE"))
+        self.events[0].refresh_from_db()
+        self.foreign.refresh_from_db()
+        self.assertEqual(self.events[0].scheduled_at, self.start + delta)
+        self.assertEqual(self.foreign.scheduled_at, self.start)
+        self.assertEqual(self.signals[0]["action"], "rescheduled")
+
+    def test_reschedule_many_by_range(self):
+        """Test que verifica que el rango incluye el inicio y excluye el final"""
+        delta = datetime.timedelta(days=-1)
+
+        updated = Event.reschedule_many(
+            self.organizer,
+            delta,
+            start=self.start + datetime.timedelta(days=1),
+            end=self.start + datetime.timedelta(days=2),
+        )
+
+        self.assertEqual(updated, 1)
+        self.assertEqual(
+            list(
+                Event.objects.filter(organizer=self.organizer).values_list(
+                    "scheduled_at", flat=True
+                )
+            ),
+            [self.start, self.start, self.start + datetime.timedelta(days=2)],
+        )
@@ -0,0 +1,56 @@
+import datetime
+
+from django.test import SimpleTestCase
+
+from app.feeds import escape_text, fold, format_datetime, ics_lines
+
+
+class IcsFormatTest(SimpleTestCase):
+    def test_escape_text(self):
+        """Test que verifica el escapado de texto de RFC 5545"""
+        self.assertEqual(escape_text("a;b,c\\d\ne"), "a\\;b\\,c\\\\d\\ne")
+
+    def test_fold_long_lines(self):
+        """Test que verifica que las líneas largas se cortan en 75 octetos"""
+        folded = fold("DESCRIPTION:" + "á" * 100)
+
+        lines = folded.split("\r\n")[:-1]
+        self.assertGreater(len(lines), 1)
+        for line in lines:
+            self.assertLessEqual(len(line.encode()), 75)
+        self.assertEqual(
+            "".join(line.removeprefix(" ") for line in lines), "DESCRIPTION:" + "á" * 100
+        )
+
+    def test_format_datetime_utc(self):
+        """Test que verifica que las fechas se escriben en UTC"""
+        value = datetime.datetime(
+            2025, 6, 20, 20, 0, tzinfo=datetime.timezone(datetime.timedelta(hours=-3))
+        )
+
+        self.assertEqual(format_datetime(value), "20250620T230000Z")
+
+    def test_ics_lines(self):
+        """Test que verifica la estructura del calendario con un evento"""
+        when = datetime.datetime(2025, 6, 20, 20, 0, tzinfo=datetime.timezone.utc)
+        rows = [(1, "Jazz", "Noche, con música", when, when, "organizador")]
+
+        ics = "".join(
+            ics_lines(
+                rows,
+                "EventHub",
+                lambda id: f"http://testserver/events/{id}/",
+                lambda username: f"http://testserver/events/organizer/{username}/feed.ics",
+            )
+        )
+
+        self.assertTrue(ics.startswith("BEGIN:VCALENDAR\r\n"))
+        self.assertTrue(ics.endswith("END:VCALENDAR\r\n"))
+        self.assertIn("UID:event-1@eventhub\r\n", ics)
+        self.assertIn("DTSTART:20250620T200000Z\r\n", ics)
+        self.assertIn("DESCRIPTION:Noche\\, con música\r\n", ics)
+        self.assertIn(
+            'ORGANIZER;CN="organizador":'
+            "http://testserver/events/organizer/organizador/feed.ics\r\n",
+            ics.replace("\r\n ", ""),
+        )
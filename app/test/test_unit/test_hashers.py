@@ -0,0 +1,50 @@
+import io
+
+from django.contrib.auth.hashers import get_hasher, make_password
+from django.core.management import call_command
+from django.test import SimpleTestCase, override_settings
+
+from app.management.commands.calibrate_password_hasher import recommend_iterations
+
+
+class ConfigurableHasherTest(SimpleTestCase):
+    @override_settings(PASSWORD_HASHER_ITERATIONS=1000)
+    def test_iterations_from_settings(self):
+        """Test que verifica que el hasher usa las iteraciones configuradas"""
+        encoded = make_password("password123")
+
+        self.assertTrue(encoded.startswith("pbkdf2_sha256$1000$"))
+        self.assertFalse(get_hasher("default").must_update(encoded))
+
+        with self.settings(PASSWORD_HASHER_ITERATIONS=2000):
+            self.assertTrue(get_hasher("default").must_update(encoded))
+
+
+class CalibratePasswordHasherTest(SimpleTestCase):
+    def test_recommend_iterations(self):
+        """Test que verifica el redondeo y el mínimo de las iteraciones recomendadas"""
+        # 100 ns por iteración -> 1.000.000 de iteraciones en 100 ms
+        self.assertEqual(recommend_iterations(1e-7, 100, 600_000), 1_000_000)
+        self.assertEqual(recommend_iterations(1.23e-7, 100, 600_000), 810_000)
+        self.assertEqual(recommend_iterations(1e-6, 100, 600_000), 600_000)
+
+    @override_settings(PASSWORD_HASHER_ITERATIONS=1000)
+    def test_command_prints_recommendation(self):
+        """Test que verifica que el comando mide, recomienda y muestra la variable a exportar"""
+        out = io.StringIO()
+
+        call_command(
+            "calibrate_password_hasher",
+            "--target-ms",
+            "1",
+            "--samples",
+            "1",
+            "--min-iterations",
+            "10000",
+            stdout=out,
+        )
+
+        self.assertIn("pbkdf2_sha256: 1000 iteraciones", out.getvalue())
+        self.assertRegex(
+            out.getvalue(), r"(?m)^export EVENTHUB_PASSWORD_HASHER_ITERATIONS=\d+0000$"
+        )
@@ -0,0 +1,127 @@
+import gc
+import threading
+
+from django.test import SimpleTestCase
+
+from app.metrics import MetricsRegistry, RequestObservation
+
+
+class MetricsRegistryTest(SimpleTestCase):
+    def setUp(self):
+        self.registry = MetricsRegistry(buckets=(0.1, 1.0))
+
+    def test_counter_render(self):
+        """Test que verifica el formato de texto de Prometheus para los contadores"""
+        self.registry.inc(
+            "eventhub_http_requests_total", {"view": "events", "method": "GET", "status": 200}
+        )
+        self.registry.inc(
+            "eventhub_http_requests_total", {"view": "events", "method": "GET", "status": 200}
+        )
+
+        output = self.registry.render()
+
+        self.assertIn("# TYPE eventhub_http_requests_total counter", output)
+        self.assertIn(
+            'eventhub_http_requests_total{method="GET",status="200",view="events"} 2', output
+        )
+
+    def test_histogram_render(self):
+        """Test que verifica que los buckets del histograma son acumulativos"""
+        for value in (0.05, 0.1, 0.5, 3.0):
+            self.registry.observe("eventhub_http_request_duration_seconds", {"view": "home"}, value)
+
+        output = self.registry.render()
+
+        name = "eventhub_http_request_duration_seconds"
+        self.assertIn(f'{name}_bucket{{view="home",le="0.1"}} 2', output)
+        self.assertIn(f'{name}_bucket{{view="home",le="1.0"}} 3', output)
+        self.assertIn(f'{name}_bucket{{view="home",le="+Inf"}} 4', output)
+        self.assertIn(f'{name}_sum{{view="home"}} 3.65', output)
+        self.assertIn(f'{name}_count{{view="home"}} 4', output)
+
+    def test_label_escaping(self):
+        """Test que verifica que los valores de las etiquetas se escapan"""
+        self.registry.inc("eventhub_db_queries_total", {"view": 'a"b\\c'})
+
+        self.assertIn('eventhub_db_queries_total{view="a\\"b\\\\c"} 1', self.registry.render())
+
+    def test_concurrent_threads(self):
+        """Test que verifica que no se pierden incrementos con varios threads"""
+
+        def work():
+            for _ in range(1000):
+                self.registry.inc("eventhub_db_queries_total", {"view": "events"})
+                self.registry.observe(
+                    "eventhub_http_request_duration_seconds", {"view": "events"}, 0.01
+                )
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        counters, histograms = self.registry.collect()
+        self.assertEqual(counters[("eventhub_db_queries_total", (("view", "events"),))], 8000)
+        histogram = histograms[("eventhub_http_request_duration_seconds", (("view", "events"),))]
+        self.assertEqual(histogram[-1], 8000)
+
+    def test_finished_threads_fold_into_base(self):
+        """Test que verifica que los shards de threads terminados no se acumulan"""
+
+        def work():
+            self.registry.inc("eventhub_db_queries_total", {"view": "events"})
+
+        for _ in range(50):
+            thread = threading.Thread(target=work)
+            thread.start()
+            thread.join()
+        gc.collect()
+
+        self.assertEqual(len(self.registry._shards), 0)
+        counters, _ = self.registry.collect()
+        self.assertEqual(counters[("eventhub_db_queries_total", (("view", "events"),))], 50)
+
+    def test_finished_thread_retires_its_own_shard(self):
+        """Test que verifica que un thread que termina no retira el shard de otro con igual contenido"""
+        key = ("eventhub_db_queries_total", (("view", "events"),))
+        second_registered = threading.Event()
+        first_done = threading.Event()
+
+        # El shard del segundo thread queda antes en la lista y con el mismo contenido
+        def first():
+            second_registered.wait()
+            self.registry.inc(key[0], {"view": "events"})
+
+        def second():
+            self.registry.inc(key[0], {"view": "events"})
+            second_registered.set()
+            first_done.wait()
+            self.registry.inc(key[0], {"view": "events"}, 10)
+
+        threads = [threading.Thread(target=first), threading.Thread(target=second)]
+        for thread in threads:
+            thread.start()
+        threads[0].join()
+        gc.collect()
+        first_done.set()
+        threads[1].join()
+        gc.collect()
+
+        self.assertEqual(len(self.registry._shards), 0)
+        counters, _ = self.registry.collect()
+        self.assertEqual(counters[key], 12)
+
+    def test_record_request(self):
+        """Test que verifica que un request registra consultas y tiempo de templates"""
+        observation = RequestObservation()
+        observation.queries = 3
+        observation.query_time = 0.002
+        observation.render_times = [0.01]
+
+        self.registry.record_request("events", "GET", 200, 0.05, observation)
+        output = self.registry.render()
+
+        self.assertIn('eventhub_db_queries_total{view="events"} 3', output)
+        self.assertIn('eventhub_template_render_duration_seconds_count{view="events"} 1', output)
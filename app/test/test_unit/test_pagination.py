@@ -0,0 +1,67 @@
+import datetime
+
+from django.test import TestCase
+from django.utils import timezone
+
+from app.models import Event, User
+from app.pagination import InvalidCursor, decode_cursor, encode_cursor, paginate_events
+
+
+class CursorTest(TestCase):
+    def test_cursor_roundtrip(self):
+        """Test que verifica que un cursor se decodifica en los mismos valores"""
+        scheduled_at = timezone.now()
+        cursor = encode_cursor("n", scheduled_at, 42)
+
+        self.assertEqual(decode_cursor(cursor), ("n", scheduled_at, 42))
+
+    def test_cursor_invalid(self):
+        """Test que verifica que un cursor mal formado lanza InvalidCursor"""
+        with self.assertRaises(InvalidCursor):
+            decode_cursor("no-es-un-cursor")
+
+        with self.assertRaises(InvalidCursor):
+            decode_cursor(encode_cursor("x", timezone.now(), 1))
+
+
+class PaginateEventsTest(TestCase):
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username="organizador_test",
+            email="organizador@example.com",
+            password="password123",
+            is_organizer=True,
+        )
+        # Todos los eventos a la misma hora para que el desempate sea por id
+        scheduled_at = timezone.now() + datetime.timedelta(days=1)
+        self.events = [
+            Event.objects.create(
+                title=f"Evento {i}",
+                description="Descripción",
+                scheduled_at=scheduled_at,
+                organizer=self.organizer,
+            )
+            for i in range(5)
+        ]
+
+    def test_paginate_same_scheduled_at(self):
+        """Test que verifica que los eventos con la misma fecha no se repiten ni se pierden"""
+        seen = []
+        cursor = None
+
+        while True:
+            page = paginate_events(Event.objects.all(), cursor, 2)
+            seen.extend(e.id for e in page)
+            if not page.has_next:
+                break
+            cursor = page.next_cursor
+
+        self.assertEqual(seen, [e.id for e in self.events])
+
+    def test_paginate_empty(self):
+        """Test que verifica la paginación sin eventos"""
+        page = paginate_events(Event.objects.none(), None, 2)
+
+        self.assertEqual(len(page), 0)
+        self.assertFalse(page.has_next)
+        self.assertFalse(page.has_previous)
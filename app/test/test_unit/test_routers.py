@@ -0,0 +1,86 @@
+import time
+
+from django.contrib.sessions.models import Session
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from app.middleware import ReplicaRoutingMiddleware
+from app.models import Event, User
+from app.routers import (
+    PRIMARY_COOKIE,
+    ReplicaRouter,
+    read_from_replicas,
+    replica_reads,
+    sticks_to_primary,
+)
+
+
+@override_settings(DATABASE_REPLICAS=["replica"], REPLICA_STICKY_SECONDS=10)
+class ReplicaRouterTest(SimpleTestCase):
+    def setUp(self):
+        self.router = ReplicaRouter()
+
+    def test_reads_from_replica_when_allowed(self):
+        """Test que verifica que Event y User se leen de la réplica solo si el request lo permite"""
+        with replica_reads():
+            self.assertEqual(self.router.db_for_read(Event), "replica")
+            self.assertEqual(self.router.db_for_read(User), "replica")
+            self.assertIsNone(self.router.db_for_read(Session))
+
+        self.assertEqual(self.router.db_for_read(Event), "default")
+
+    def test_writes_to_primary(self):
+        """Test que verifica que las escrituras y migraciones van a la primaria"""
+        with replica_reads():
+            self.assertEqual(self.router.db_for_write(Event), "default")
+
+        self.assertFalse(self.router.allow_migrate("replica", "app"))
+        self.assertIsNone(self.router.allow_migrate("default", "app"))
+
+    @override_settings(DATABASE_REPLICAS=[])
+    def test_without_replicas(self):
+        """Test que verifica que sin réplicas el router no decide nada"""
+        with replica_reads():
+            self.assertIsNone(self.router.db_for_read(Event))
+
+
+@override_settings(DATABASE_REPLICAS=["replica"], REPLICA_STICKY_SECONDS=10)
+class ReplicaRoutingMiddlewareTest(SimpleTestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.seen = []
+
+        def view(request):
+            self.seen.append(read_from_replicas.get())
+            return HttpResponse()
+
+        self.middleware = ReplicaRoutingMiddleware(view)
+
+    def test_get_reads_from_replicas(self):
+        """Test que verifica que un GET lee de las réplicas y no deja cookie"""
+        response = self.middleware(self.factory.get("/events/"))
+
+        self.assertEqual(self.seen, [True])
+        self.assertNotIn(PRIMARY_COOKIE, response.cookies)
+        self.assertFalse(read_from_replicas.get())
+
+    def test_post_sticks_to_primary(self):
+        """Test que verifica que después de un POST se lee de la primaria durante la ventana"""
+        response = self.middleware(self.factory.post("/events/create/"))
+        self.assertEqual(self.seen, [False])
+        self.assertEqual(response.cookies[PRIMARY_COOKIE]["max-age"], 10)
+
+        request = self.factory.get("/events/")
+        request.COOKIES[PRIMARY_COOKIE] = response.cookies[PRIMARY_COOKIE].value
+        self.middleware(request)
+        self.assertEqual(self.seen, [False, False])
+        self.assertFalse(sticks_to_primary(request, now=time.time() + 11))
+
+    def test_invalid_cookie(self):
+        """Test que verifica que una cookie inválida no rompe el request"""
+        request = self.factory.get("/events/")
+        request.COOKIES[PRIMARY_COOKIE] = "no-es-un-numero"
+
+        self.middleware(request)
+
+        self.assertEqual(self.seen, [True])
@@ -0,0 +1,82 @@
+import datetime
+
+from django.test import TestCase
+from django.utils import timezone
+
+from app.models import Event, User
+from app.search import build_match_query, search_events
+
+
+class BuildMatchQueryTest(TestCase):
+    def test_build_match_query(self):
+        """Test que verifica que las palabras se citan y la última admite prefijo"""
+        self.assertEqual(build_match_query("jazz noche"), '"jazz" "noche"*')
+
+    def test_build_match_query_strips_operators(self):
+        """Test que verifica que los operadores de FTS5 no llegan a la consulta"""
+        self.assertEqual(build_match_query('jazz OR "rock" -(pop)'), '"jazz" "OR" "rock" "pop"*')
+
+    def test_build_match_query_empty(self):
+        """Test que verifica que una búsqueda sin palabras no genera consulta"""
+        self.assertIsNone(build_match_query("  ¿? "))
+
+
+class SearchEventsTest(TestCase):
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username="organizador_test",
+            email="organizador@example.com",
+            password="password123",
+            is_organizer=True,
+        )
+        self.scheduled_at = timezone.now() + datetime.timedelta(days=1)
+
+    def test_search_after_new(self):
+        """Test que verifica que un evento creado con Event.new se puede buscar"""
+        Event.new("Concierto de Jazz", "Una noche con músicos", self.scheduled_at, self.organizer)
+
+        results = search_events("jazz")
+
+        self.assertEqual([e.title for e in results], ["Concierto de Jazz"])
+        self.assertIn("<mark>Jazz</mark>", results[0].title_highlight)
+
+    def test_search_ignores_accents(self):
+        """Test que verifica que la búsqueda no distingue acentos"""
+        Event.new("Festival", "Una noche con músicos", self.scheduled_at, self.organizer)
+
+        self.assertEqual(len(search_events("musicos")), 1)
+
+    def test_search_after_update(self):
+        """Test que verifica que el índice se actualiza al editar un evento"""
+        Event.new("Concierto de Jazz", "Una noche", self.scheduled_at, self.organizer)
+        event = Event.objects.get(title="Concierto de Jazz")
+
+        event.update("Concierto de Rock", None, None, None)
+
+        self.assertEqual(search_events("jazz"), [])
+        self.assertEqual([e.id for e in search_events("rock")], [event.id])
+
+    def test_search_after_delete(self):
+        """Test que verifica que un evento eliminado deja de aparecer"""
+        Event.new("Concierto de Jazz", "Una noche", self.scheduled_at, self.organizer)
+        Event.objects.get(title="Concierto de Jazz").delete()
+
+        self.assertEqual(search_events("jazz"), [])
+
+    def test_search_ranks_title_first(self):
+        """Test que verifica que una coincidencia en el título rankea más alto"""
+        Event.new("Feria", "Habrá jazz en vivo", self.scheduled_at, self.organizer)
+        Event.new("Jazz al aire libre", "Música en el parque", self.scheduled_at, self.organizer)
+
+        results = search_events("jazz")
+
+        self.assertEqual([e.title for e in results], ["Jazz al aire libre", "Feria"])
+
+    def test_search_escapes_html(self):
+        """Test que verifica que el contenido del evento se escapa en los resaltados"""
+        Event.new("<b>Jazz</b>", "<script>jazz</script>", self.scheduled_at, self.organizer)
+
+        result = search_events("jazz")[0]
+
+        self.assertNotIn("<script>", result.description_snippet)
+        self.assertIn("&lt;b&gt;<mark>Jazz</mark>", result.title_highlight)
@@ -0,0 +1,113 @@
+import time
+from unittest import mock
+
+from django.contrib.sessions.models import Session
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+
+from app import cache as cache_module
+from app.cache import LocalLRUCache
+from app.sessions import SessionStore, local_sessions
+
+
+class LocalLRUCacheTest(SimpleTestCase):
+    def test_evicts_least_recently_used(self):
+        """Test que verifica que se descarta la entrada usada hace más tiempo"""
+        lru = LocalLRUCache(maxsize=2, timeout=60)
+        lru.set("a", 1)
+        lru.set("b", 2)
+        lru.get("a")
+        lru.set("c", 3)
+
+        self.assertEqual(lru.get("a"), 1)
+        self.assertIsNone(lru.get("b"))
+        self.assertEqual(lru.get("c"), 3)
+
+    def test_entries_expire(self):
+        """Test que verifica que las entradas vencen después del timeout"""
+        lru = LocalLRUCache(maxsize=10, timeout=5)
+
+        with mock.patch.object(cache_module.time, "monotonic", return_value=100):
+            lru.set("a", 1)
+        with mock.patch.object(cache_module.time, "monotonic", return_value=104):
+            self.assertEqual(lru.get("a"), 1)
+        with mock.patch.object(cache_module.time, "monotonic", return_value=106):
+            self.assertIsNone(lru.get("a"))
+
+        self.assertEqual(len(lru), 0)
+
+
+class SessionStoreTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        local_sessions.clear()
+
+    def test_load_from_local_cache(self):
+        """Test que verifica que una sesión guardada se lee sin base ni cache compartido"""
+        session = SessionStore()
+        session["user"] = 1
+        session.save()
+
+        with self.assertNumQueries(0), mock.patch.object(cache, "get", side_effect=AssertionError):
+            self.assertEqual(SessionStore(session.session_key)["user"], 1)
+
+    def test_load_from_database(self):
+        """Test que verifica que sin cache la sesión se recupera de la base"""
+        session = SessionStore()
+        session["user"] = 1
+        session.save()
+        cache.clear()
+        local_sessions.clear()
+
+        self.assertEqual(SessionStore(session.session_key)["user"], 1)
+        self.assertEqual(len(local_sessions), 1)
+
+    def test_unsaved_changes_do_not_leak(self):
+        """Test que verifica que los cambios sin guardar no llegan a otros requests"""
+        session = SessionStore()
+        session["user"] = 1
+        session.save()
+
+        loaded = SessionStore(session.session_key)
+        loaded["user"] = 2
+
+        self.assertEqual(SessionStore(session.session_key)["user"], 1)
+
+    def test_delete_clears_local_cache(self):
+        """Test que verifica que borrar la sesión la saca del LRU"""
+        session = SessionStore()
+        session["user"] = 1
+        session.save()
+        session_key = session.session_key
+
+        session.flush()
+
+        self.assertEqual(len(local_sessions), 0)
+        self.assertFalse(SessionStore().exists(session_key))
+        self.assertEqual(dict(SessionStore(session_key).items()), {})
+
+    def test_logout_in_other_process(self):
+        """Test que verifica que un logout en otro proceso se nota al vencer el LRU local"""
+        session = SessionStore()
+        session["user"] = 1
+        session.save()
+        session_key = session.session_key
+
+        # Otro proceso borra la fila; este solo se entera al vencer sus copias locales
+        Session.objects.filter(session_key=session_key).delete()
+        local_sessions.clear()
+
+        later = time.time() + local_sessions.timeout + 1
+        with mock.patch("django.core.cache.backends.locmem.time.time", return_value=later):
+            self.assertEqual(SessionStore(session_key).load(), {})
+
+    def test_shared_cache_keeps_session_age(self):
+        """Test que verifica que con un cache que no es por proceso se usa la edad de la sesión"""
+        session = SessionStore()
+        session._cache = mock.MagicMock()
+        session["user"] = 1
+        session.save()
+
+        session._cache.set.assert_called_with(
+            session.cache_key, {"user": 1}, session.get_expiry_age()
+        )
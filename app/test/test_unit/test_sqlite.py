@@ -0,0 +1,119 @@
+import tempfile
+from pathlib import Path
+
+from django.db import OperationalError, connection, connections, transaction
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from app.metrics import registry
+from app.models import User
+from app.sqlite import DEFAULT_SQLITE_PRAGMAS, write_transaction
+
+
+class SqlitePragmasTest(TestCase):
+    # Abre su propia conexión a un archivo temporal; TestCase habilita el acceso a la base
+    def open(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+
+        settings_dict = {
+            **connections["default"].settings_dict,
+            "NAME": str(Path(directory.name) / "db.sqlite3"),
+        }
+        wrapper = type(connections["default"])(settings_dict, alias="pragmas")
+        wrapper.ensure_connection()
+        self.addCleanup(wrapper.close)
+
+        return wrapper.connection
+
+    def pragma(self, raw, name):
+        return raw.execute(f"PRAGMA {name}").fetchone()[0]
+
+    def test_default_profile(self):
+        """Test que verifica que cada conexión nueva queda en WAL con el perfil de producción"""
+        raw = self.open()
+
+        self.assertEqual(self.pragma(raw, "journal_mode"), "wal")
+        self.assertEqual(self.pragma(raw, "synchronous"), 1)
+        self.assertEqual(self.pragma(raw, "temp_store"), 2)
+        self.assertEqual(self.pragma(raw, "busy_timeout"), DEFAULT_SQLITE_PRAGMAS["busy_timeout"])
+        self.assertEqual(self.pragma(raw, "cache_size"), DEFAULT_SQLITE_PRAGMAS["cache_size"])
+        self.assertEqual(self.pragma(raw, "mmap_size"), DEFAULT_SQLITE_PRAGMAS["mmap_size"])
+
+    @override_settings(SQLITE_PRAGMAS={"journal_mode": "DELETE", "synchronous": "FULL"})
+    def test_configurable_profile(self):
+        """Test que verifica que SQLITE_PRAGMAS reemplaza el perfil"""
+        raw = self.open()
+
+        self.assertEqual(self.pragma(raw, "journal_mode"), "delete")
+        self.assertEqual(self.pragma(raw, "synchronous"), 2)
+
+
+@override_settings(DB_WRITE_RETRY_BASE_DELAY=0, DB_WRITE_RETRY_DEADLINE=10)
+class WriteTransactionTest(TransactionTestCase):
+    def setUp(self):
+        registry.reset()
+        self.calls = 0
+
+    def locked_twice(self):
+        self.calls += 1
+        if self.calls <= 2:
+            raise OperationalError("database is locked")
+        return "ok"
+
+    def test_begin_immediate(self):
+        """Test que verifica que la transacción arranca tomando el lock de escritura"""
+        with CaptureQueriesContext(connection) as queries:
+            write_transaction(User.objects.create, username="nuevo")
+
+        self.assertEqual(queries[0]["sql"], "BEGIN IMMEDIATE")
+        self.assertTrue(User.objects.filter(username="nuevo").exists())
+        self.assertIsNone(connection.transaction_mode)
+
+    def test_retries_locked_database(self):
+        """Test que verifica que se reintenta mientras la base está bloqueada y se cuenta"""
+        self.assertEqual(write_transaction(self.locked_twice), "ok")
+
+        self.assertEqual(self.calls, 3)
+        counters, _ = registry.collect()
+        self.assertEqual(
+            counters[("eventhub_db_write_retries_total", (("operation", "locked_twice"),))], 2
+        )
+
+    @override_settings(DB_WRITE_RETRY_DEADLINE=0)
+    def test_deadline(self):
+        """Test que verifica que pasado el plazo el error llega al que llamó"""
+        with self.assertRaisesMessage(OperationalError, "database is locked"):
+            write_transaction(self.locked_twice)
+
+        self.assertEqual(self.calls, 1)
+
+    def test_other_errors_not_retried(self):
+        """Test que verifica que los errores que no son de bloqueo no se reintentan"""
+
+        def broken():
+            self.calls += 1
+            raise OperationalError("no such table: app_missing")
+
+        with self.assertRaises(OperationalError):
+            write_transaction(broken)
+
+        self.assertEqual(self.calls, 1)
+
+    def test_rollback_before_retry(self):
+        """Test que verifica que cada intento fallido deshace lo que escribió"""
+
+        def create_then_lock():
+            User.objects.create(username=f"intento{self.calls}")
+            return self.locked_twice()
+
+        write_transaction(create_then_lock)
+
+        self.assertEqual(list(User.objects.values_list("username", flat=True)), ["intento2"])
+
+    def test_nested_without_retries(self):
+        """Test que verifica que dentro de otra transacción no se reintenta"""
+        with transaction.atomic(), self.assertRaises(OperationalError):
+            write_transaction(self.locked_twice)
+
+        self.assertEqual(self.calls, 1)
@@ -0,0 +1,104 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from app import throttle
+from app.metrics import registry
+
+
+class TokenBucketTest(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        throttle.clear_local_blocks()
+        self.now = 1000.0
+        patcher = mock.patch.object(throttle.time, "time", lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_bucket_allows_capacity(self):
+        """Test que verifica que el bucket permite ráfagas hasta su capacidad"""
+        for _ in range(3):
+            self.assertEqual(throttle.consume("bucket", 3, 10), 0)
+
+        self.assertEqual(throttle.consume("bucket", 3, 10), 10)
+
+    def test_bucket_refills(self):
+        """Test que verifica que el bucket recupera un token por intervalo"""
+        for _ in range(2):
+            throttle.consume("bucket", 2, 10)
+
+        self.now += 4
+        self.assertEqual(throttle.consume("bucket", 2, 10), 6)
+
+        self.now += 6
+        self.assertEqual(throttle.consume("bucket", 2, 10), 0)
+        self.assertGreater(throttle.consume("bucket", 2, 10), 0)
+
+    def test_rejection_skips_cache(self):
+        """Test que verifica que un bucket vacío se rechaza sin consultar el cache"""
+        throttle.consume("bucket", 1, 10)
+        throttle.consume("bucket", 1, 10)
+
+        with mock.patch.object(throttle.cache, "get", side_effect=AssertionError):
+            self.assertEqual(throttle.consume("bucket", 1, 10), 10)
+
+    def test_buckets_shared_through_cache(self):
+        """Test que verifica que el estado vive en el cache y no solo en el proceso"""
+        throttle.consume("bucket", 1, 10)
+        throttle.clear_local_blocks()
+
+        self.assertEqual(throttle.consume("bucket", 1, 10), 10)
+
+    @override_settings(LOGIN_THROTTLE_RATES={"ip": (10, 1), "username": (1, 60)})
+    def test_throttle_login_counts_scope(self):
+        """Test que verifica que los rechazos se cuentan en las métricas por alcance"""
+        registry.reset()
+        request = RequestFactory().post("/accounts/login/")
+
+        self.assertEqual(throttle.throttle_login(request, "Usuario"), 0)
+        self.assertEqual(throttle.throttle_login(request, "usuario"), 60)
+
+        counters, _ = registry.collect()
+        self.assertEqual(counters[("eventhub_login_throttled_total", (("scope", "username"),))], 1)
+
+        throttle.reset_login_throttle(request, "usuario")
+        self.assertEqual(throttle.throttle_login(request, "usuario"), 0)
+
+    def test_login_keys_hash_username(self):
+        """Test que verifica que la clave del username tiene largo fijo y no lleva espacios"""
+        request = RequestFactory().post("/accounts/login/")
+        username = "Un usuario\tcon espacios " + "x" * 300
+
+        keys = {scope: key for scope, key, _, _ in throttle.login_throttle_keys(request, username)}
+
+        self.assertNotIn(" ", keys["username"])
+        self.assertLess(len(keys["username"]), 100)
+        # Mayúsculas y minúsculas comparten bucket
+        upper = {s: k for s, k, _, _ in throttle.login_throttle_keys(request, username.upper())}
+        self.assertEqual(keys["username"], upper["username"])
+
+    def test_client_ip_without_proxies(self):
+        """Test que verifica que sin proxies de confianza se ignora X-Forwarded-For"""
+        request = RequestFactory().post(
+            "/accounts/login/", REMOTE_ADDR="10.0.0.1", HTTP_X_FORWARDED_FOR="1.2.3.4"
+        )
+
+        self.assertEqual(throttle.client_ip(request), "10.0.0.1")
+
+    @override_settings(TRUSTED_PROXY_COUNT=1)
+    def test_client_ip_behind_proxy(self):
+        """Test que verifica que detrás de un proxy se usa la IP que agregó y no la inventada"""
+        request = RequestFactory().post(
+            "/accounts/login/",
+            REMOTE_ADDR="10.0.0.1",
+            HTTP_X_FORWARDED_FOR="6.6.6.6, 203.0.113.7",
+        )
+        other = RequestFactory().post(
+            "/accounts/login/", REMOTE_ADDR="10.0.0.1", HTTP_X_FORWARDED_FOR="198.51.100.2"
+        )
+
+        self.assertEqual(throttle.client_ip(request), "203.0.113.7")
+        keys = {s: k for s, k, _, _ in throttle.login_throttle_keys(request, "u")}
+        other_keys = {s: k for s, k, _, _ in throttle.login_throttle_keys(other, "u")}
+        self.assertNotEqual(keys["ip"], other_keys["ip"])
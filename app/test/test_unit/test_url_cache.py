@@ -0,0 +1,69 @@
+from unittest import mock
+
+from django.template import RequestContext, Template
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from django.urls import reverse, set_script_prefix
+
+from app import url_cache
+from app.url_cache import cached_reverse, clear_reverse_cache
+
+
+class CachedReverseTest(SimpleTestCase):
+    def setUp(self):
+        clear_reverse_cache()
+
+    def test_same_result_as_reverse(self):
+        """Test que verifica que el resultado coincide con reverse()"""
+        for name in ("event_detail", "event_edit", "event_delete"):
+            for event_id in (1, 42, 123456):
+                self.assertEqual(cached_reverse(name, [event_id]), reverse(name, args=[event_id]))
+
+        self.assertEqual(cached_reverse("events"), reverse("events"))
+        self.assertEqual(
+            cached_reverse("event_export", ["csv"]), reverse("event_export", args=["csv"])
+        )
+        self.assertEqual(
+            cached_reverse("organizer_feed", ["ana maría"]),
+            reverse("organizer_feed", args=["ana maría"]),
+        )
+
+    def test_pattern_reversed_once(self):
+        """Test que verifica que el patrón se resuelve una sola vez para todos los IDs"""
+        with mock.patch.object(url_cache, "reverse", wraps=reverse) as wrapped:
+            paths = [cached_reverse("event_detail", [i]) for i in range(500)]
+
+        self.assertEqual(wrapped.call_count, 1)
+        self.assertEqual(paths[7], "/events/7/")
+
+    @override_settings(ROOT_URLCONF="app.test.test_integration.urls_async")
+    def test_keyed_by_urlconf(self):
+        """Test que verifica que cada urlconf tiene su propia entrada"""
+        with mock.patch.object(url_cache, "reverse", wraps=reverse) as wrapped:
+            cached_reverse("events")
+
+        self.assertEqual(wrapped.call_count, 1)
+
+    def test_script_prefix(self):
+        """Test que verifica que se respeta el prefijo del despliegue"""
+        set_script_prefix("/eventhub/")
+        self.addCleanup(set_script_prefix, "/")
+
+        self.assertEqual(cached_reverse("event_detail", [3]), "/eventhub/events/3/")
+
+
+class NavbarLinkTest(SimpleTestCase):
+    template = Template("{% load navbar_link %}{% navbar_link 'events' 'Eventos' %}")
+
+    def render(self, path):
+        return self.template.render(RequestContext(RequestFactory().get(path)))
+
+    def test_active_link(self):
+        """Test que verifica el link activo de la barra de navegación"""
+        self.assertEqual(
+            self.render("/events/"),
+            "<a href='/events/' class='nav-link active' aria-current=\"page\">Eventos</a>",
+        )
+
+    def test_inactive_link(self):
+        """Test que verifica el link inactivo de la barra de navegación"""
+        self.assertEqual(self.render("/"), "<a href='/events/' class='nav-link' >Eventos</a>")
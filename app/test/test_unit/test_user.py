@@ -1,6 +1,11 @@
+import importlib
+from types import SimpleNamespace
+
+from django.apps import apps
+from django.db import IntegrityError, connection, transaction
 from django.test import TestCase
 
-from app.models import User
+from app.models import EMAIL_UNIQUE_CONSTRAINT, User
 
 
 class UserModelTest(TestCase):
@@ -123,3 +128,72 @@ class UserModelTest(TestCase):
         self.assertIn("email", errors)
         self.assertIn("username", errors)
         self.assertIn("password", errors)
+
+    def test_duplicate_email_case_insensitive(self):
+        """Test que valida que el email duplicado se detecta sin distinguir mayúsculas"""
+        errors = User.validate_new_user(
+            email="EXISTENTE@Example.com",
+            username="otro_usuario",
+            password="password123",
+            password_confirm="password123",
+        )
+        self.assertEqual(errors, {"email": "Ya existe un usuario con este email"})
+
+    def test_validation_single_query(self):
+        """Test que valida que email y username se verifican en una sola consulta"""
+        with self.assertNumQueries(1):
+            User.validate_new_user(
+                email="nuevo@example.com",
+                username="nuevo_usuario",
+                password="password123",
+                password_confirm="password123",
+            )
+
+    def test_email_unique_constraint(self):
+        """Test que valida que la base rechaza emails repetidos aunque cambien las mayúsculas"""
+        with self.assertRaises(IntegrityError) as context, transaction.atomic():
+            User.objects.create_user(
+                username="otro_usuario", email="Existente@EXAMPLE.com", password="password123"
+            )
+
+        self.assertEqual(
+            User.integrity_errors(context.exception),
+            {"email": "Ya existe un usuario con este email"},
+        )
+
+    def test_username_integrity_error(self):
+        """Test que valida que un username repetido se traduce al error del campo"""
+        with self.assertRaises(IntegrityError) as context, transaction.atomic():
+            User.objects.create_user(
+                username="usuario_existente", email="otro@example.com", password="password123"
+            )
+
+        self.assertEqual(
+            User.integrity_errors(context.exception),
+            {"username": "Ya existe un usuario con este nombre de usuario"},
+        )
+
+    def test_integrity_error_other_constraint(self):
+        """Test que valida que otra violación que menciona username no se confunde con el UNIQUE"""
+        error = IntegrityError("NOT NULL constraint failed: app_user.username")
+
+        self.assertIsNone(User.integrity_errors(error))
+
+    def test_migration_reports_duplicate_emails(self):
+        """Test que valida que la migración del UNIQUE lista los emails repetidos antes de fallar"""
+        migration = importlib.import_module("app.migrations.0006_user_email_ci_unique")
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP INDEX {EMAIL_UNIQUE_CONSTRAINT}")
+        User.objects.create_user(
+            username="duplicado", email="EXISTENTE@example.com", password="password123"
+        )
+
+        with self.assertRaisesMessage(RuntimeError, "existente@example.com: usuario_existente"):
+            migration.check_duplicate_emails(apps, SimpleNamespace(connection=connection))
+
+    def test_users_without_email(self):
+        """Test que valida que varios usuarios pueden no tener email"""
+        User.objects.create_user(username="sin_email_1", password="password123")
+        User.objects.create_user(username="sin_email_2", password="password123")
+
+        self.assertEqual(User.objects.filter(email="").count(), 2)
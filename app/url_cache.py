@@ -0,0 +1,59 @@
+import functools
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.urls import get_script_prefix, get_urlconf, reverse
+
+# Se pasa a reverse() en lugar de cada ID para obtener el patrón una sola vez.
+# Es un entero válido para el convertidor <int:...> que no aparece en las rutas.
+PLACEHOLDER_BASE = 7304578320000
+
+
+@functools.lru_cache(maxsize=512)
+def _reverse_parts(urlconf, prefix, url_name, nargs):
+    placeholders = [str(PLACEHOLDER_BASE + i) for i in range(nargs)]
+    path = reverse(url_name, urlconf=urlconf, args=placeholders)
+
+    parts = []
+    for placeholder in placeholders:
+        before, path = path.split(placeholder, 1)
+        parts.append(before)
+    parts.append(path)
+
+    return tuple(parts)
+
+
+@functools.lru_cache(maxsize=512)
+def _reverse_exact(urlconf, prefix, url_name, args):
+    return reverse(url_name, urlconf=urlconf, args=args)
+
+
+def cached_reverse(url_name, args=()):
+    """
+    reverse() memoizado por (urlconf, url_name, args). Con argumentos enteros,
+    como los IDs de evento, el patrón se resuelve una vez y después solo se
+    sustituye cada ID, sin recorrer el resolver por fila.
+    """
+    urlconf = get_urlconf() or settings.ROOT_URLCONF
+    prefix = get_script_prefix()
+
+    if not all(type(arg) is int for arg in args):
+        return _reverse_exact(urlconf, prefix, url_name, tuple(args))
+
+    parts = _reverse_parts(urlconf, prefix, url_name, len(args))
+    if not args:
+        return parts[0]
+
+    path = [parts[0]]
+    for arg, part in zip(args, parts[1:]):
+        path.append(str(arg))
+        path.append(part)
+    return "".join(path)
+
+
+def clear_reverse_cache(**kwargs):
+    _reverse_parts.cache_clear()
+    _reverse_exact.cache_clear()
+
+
+setting_changed.connect(clear_reverse_cache)
@@ -1,16 +1,28 @@
+from django.conf import settings
 from django.contrib.auth.views import LogoutView
 from django.urls import path
 
-from . import views
+from . import async_views, views
+
+# En el despliegue ASGI las vistas de solo lectura usan sus versiones async
+read_views = async_views if settings.ASYNC_VIEWS else views
 
 urlpatterns = [
-    path("", views.home, name="home"),
+    path("", read_views.home, name="home"),
     path("accounts/register/", views.register, name="register"),
     path("accounts/logout/", LogoutView.as_view(), name="logout"),
     path("accounts/login/", views.login_view, name="login"),
-    path("events/", views.events, name="events"),
+    path("events/", read_views.events, name="events"),
+    path("events/export/<str:format>/", views.event_export, name="event_export"),
+    path("events/feed.ics", views.events_feed, name="events_feed"),
+    path("events/organizer/<str:username>/feed.ics", views.organizer_feed, name="organizer_feed"),
+    path("events/search/", views.event_search, name="event_search"),
+    path("events/calendar/", views.events_calendar, name="events_calendar"),
+    path("events/calendar/<str:day>/", views.events_calendar_day, name="events_calendar_day"),
+    path("events/bulk/delete/", views.event_bulk_delete, name="event_bulk_delete"),
+    path("events/bulk/reschedule/", views.event_bulk_reschedule, name="event_bulk_reschedule"),
     path("events/create/", views.event_form, name="event_form"),
     path("events/<int:id>/edit/", views.event_form, name="event_edit"),
-    path("events/<int:id>/", views.event_detail, name="event_detail"),
+    path("events/<int:id>/", read_views.event_detail, name="event_detail"),
     path("events/<int:id>/delete/", views.event_delete, name="event_delete"),
 ]
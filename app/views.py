@@ -1,12 +1,52 @@
 import datetime
+import math
+
+from django.conf import settings
 from django.contrib.auth import authenticate, login
 from django.contrib.auth.decorators import login_required
+from django.db import IntegrityError
+from django.http import Http404, HttpResponseBadRequest, StreamingHttpResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.utils import timezone
-
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition
+
+from .bulk import InvalidBulkAction, parse_delta, parse_ids, parse_range
+from .calendar import (
+    InvalidCalendarDate,
+    day_events,
+    month_grid,
+    parse_day,
+    parse_month,
+    shift_month,
+)
+from .conditional import (
+    event_detail_etag,
+    event_detail_last_modified,
+    events_etag,
+    events_last_modified,
+)
+from .export import EXPORT_FORMATS, InvalidExportFilter, export_queryset, export_rows
+from .feeds import (
+    feed_chunks,
+    organizer_feed_etag,
+    organizer_feed_last_modified,
+    organizer_queryset,
+    upcoming_feed_etag,
+    upcoming_feed_last_modified,
+    upcoming_queryset,
+)
 from .models import Event, User
+from .pagination import InvalidCursor, get_page_size, paginate_events
+from .query_budget import query_budget
+from .search import search_events
+from .sqlite import write_transaction
+from .throttle import reset_login_throttle, throttle_login
 
 
+# Peor caso con otra sesión abierta y fuera del cache: validación, INSERT del usuario,
+# lectura de la sesión y el flush de login() (SELECT, DELETE, last_login, EXISTS, INSERT)
+@query_budget(8)
 def register(request):
     if request.method == "POST":
         email = request.POST.get("email")
@@ -17,6 +57,22 @@ def register(request):
 
         errors = User.validate_new_user(email, username, password, password_confirm)
 
+        if len(errors) == 0:
+            user = User(
+                email=User.objects.normalize_email(email),
+                username=User.normalize_username(username),
+                is_organizer=is_organizer,
+            )
+            # El hash se calcula antes de tomar el lock de escritura
+            user.set_password(password)
+            try:
+                write_transaction(user.save, savepoint=True)
+            except IntegrityError as e:
+                # Otro registro con el mismo email o username ganó la carrera
+                errors = User.integrity_errors(e)
+                if errors is None:
+                    raise
+
         if len(errors) > 0:
             return render(
                 request,
@@ -27,20 +83,34 @@ def register(request):
                 },
             )
         else:
-            user = User.objects.create_user(
-                email=email, username=username, password=password, is_organizer=is_organizer
-            )
-            login(request, user)
+            # Hay más de un backend configurado: el usuario nuevo entra con el cacheado
+            write_transaction(login, request, user, backend=settings.AUTHENTICATION_BACKENDS[0])
             return redirect("events")
 
     return render(request, "accounts/register.html", {})
 
 
+# Peor caso: el usuario, el UPDATE que vuelve a hashear la contraseña
+# (PASSWORD_HASHER_ITERATIONS) y, con otra sesión abierta fuera del cache, su lectura
+# y el flush de login() (SELECT, DELETE, last_login, EXISTS, INSERT)
+@query_budget(8)
 def login_view(request):
     if request.method == "POST":
         username = request.POST.get("username")
         password = request.POST.get("password")
 
+        # Antes de authenticate: un intento rechazado no llega a calcular el hash
+        wait = math.ceil(throttle_login(request, username))
+        if wait:
+            response = render(
+                request,
+                "accounts/login.html",
+                {"error": f"Demasiados intentos, probá de nuevo en {wait} segundos"},
+                status=429,
+            )
+            response["Retry-After"] = str(wait)
+            return response
+
         user = authenticate(request, username=username, password=password)
 
         if user is None:
@@ -48,32 +118,154 @@ def login_view(request):
                 request, "accounts/login.html", {"error": "Usuario o contraseña incorrectos"}
             )
 
-        login(request, user)
+        reset_login_throttle(request, username)
+        write_transaction(login, request, user)
         return redirect("events")
 
     return render(request, "accounts/login.html")
 
 
+@query_budget(2)
 def home(request):
     return render(request, "home.html")
 
 
+@query_budget(4)
 @login_required
+@cache_control(private=True, no_cache=True)
+@condition(etag_func=events_etag, last_modified_func=events_last_modified)
 def events(request):
-    events = Event.objects.all().order_by("scheduled_at")
+    page_size = get_page_size(request.GET.get("page_size"))
+
+    try:
+        page = paginate_events(Event.objects.all(), request.GET.get("cursor"), page_size)
+    except InvalidCursor:
+        page = paginate_events(Event.objects.all(), None, page_size)
+
     return render(
         request,
         "app/events.html",
-        {"events": events, "user_is_organizer": request.user.is_organizer},
+        {
+            "events": page.items,
+            "page": page,
+            "page_size": page_size,
+            "user_is_organizer": request.user.is_organizer,
+        },
+    )
+
+
+@query_budget(3)
+@login_required
+def event_search(request):
+    query = request.GET.get("q", "").strip()
+    results = search_events(query) if query else []
+
+    return render(
+        request,
+        "app/event_search.html",
+        {"query": query, "results": results},
     )
 
 
+@query_budget(3)
 @login_required
+def events_calendar(request):
+    try:
+        month = parse_month(request.GET.get("month"))
+    except InvalidCalendarDate as e:
+        return HttpResponseBadRequest(str(e))
+
+    return render(
+        request,
+        "app/events_calendar.html",
+        {
+            "month": month,
+            "weeks": month_grid(month),
+            "previous_month": shift_month(month, -1),
+            "next_month": shift_month(month, 1),
+        },
+    )
+
+
+@query_budget(3)
+@login_required
+def events_calendar_day(request, day):
+    try:
+        day = parse_day(day)
+    except InvalidCalendarDate as e:
+        return HttpResponseBadRequest(str(e))
+
+    limit = getattr(settings, "EVENTS_CALENDAR_DAY_LIMIT", 50)
+    # Uno más para saber si quedaron eventos sin mostrar
+    events = day_events(day, limit + 1)
+
+    return render(
+        request,
+        "app/events_calendar_day.html",
+        {"day": day, "events": events[:limit], "has_more": len(events) > limit},
+    )
+
+
+@query_budget(4)
+@login_required
+@cache_control(private=True, no_cache=True)
+@condition(etag_func=event_detail_etag, last_modified_func=event_detail_last_modified)
 def event_detail(request, id):
-    event = get_object_or_404(Event, pk=id)
+    event = get_object_or_404(Event.objects.select_related("organizer"), pk=id)
     return render(request, "app/event_detail.html", {"event": event})
 
 
+@query_budget(2)
+@login_required
+def event_export(request, format):
+    if not request.user.is_organizer:
+        return redirect("events")
+
+    if format not in EXPORT_FORMATS:
+        raise Http404("Formato de exportación desconocido")
+
+    try:
+        queryset = export_queryset(
+            organizer=request.GET.get("organizer"),
+            date_from=request.GET.get("from"),
+            date_to=request.GET.get("to"),
+        )
+    except InvalidExportFilter as e:
+        return HttpResponseBadRequest(str(e))
+
+    serialize, content_type = EXPORT_FORMATS[format]
+    response = StreamingHttpResponse(serialize(export_rows(queryset)), content_type=content_type)
+    response["Content-Disposition"] = f'attachment; filename="eventos.{format}"'
+
+    return response
+
+
+@query_budget(1)
+@cache_control(public=True, no_cache=True)
+@condition(etag_func=upcoming_feed_etag, last_modified_func=upcoming_feed_last_modified)
+def events_feed(request):
+    version, _ = request._feed_version
+    return StreamingHttpResponse(
+        feed_chunks(request, "EventHub", upcoming_queryset(), version),
+        content_type="text/calendar; charset=utf-8",
+    )
+
+
+@query_budget(2)
+@cache_control(public=True, no_cache=True)
+@condition(etag_func=organizer_feed_etag, last_modified_func=organizer_feed_last_modified)
+def organizer_feed(request, username):
+    if not User.objects.filter(username=username, is_organizer=True).exists():
+        raise Http404("No existe el organizador")
+
+    version, _ = request._feed_version
+    return StreamingHttpResponse(
+        feed_chunks(request, f"EventHub - {username}", organizer_queryset(username), version),
+        content_type="text/calendar; charset=utf-8",
+    )
+
+
+@query_budget(4)
 @login_required
 def event_delete(request, id):
     user = request.user
@@ -82,12 +274,55 @@ def event_delete(request, id):
 
     if request.method == "POST":
         event = get_object_or_404(Event, pk=id)
-        event.delete()
+        write_transaction(event.delete)
+        return redirect("events")
+
+    return redirect("events")
+
+
+@query_budget(3)
+@login_required
+def event_bulk_delete(request):
+    user = request.user
+    if not user.is_organizer or request.method != "POST":
         return redirect("events")
 
+    try:
+        ids = parse_ids(request.POST.getlist("ids"))
+    except InvalidBulkAction as e:
+        return HttpResponseBadRequest(str(e))
+
+    if ids:
+        Event.delete_many(user, ids)
+
     return redirect("events")
 
 
+# Por rango cuenta los eventos para decidir si suspende los triggers de EventsVersion
+@query_budget(4)
+@login_required
+def event_bulk_reschedule(request):
+    user = request.user
+    if not user.is_organizer or request.method != "POST":
+        return redirect("events")
+
+    try:
+        ids = parse_ids(request.POST.getlist("ids"))
+        delta = parse_delta(request.POST)
+        start, end = parse_range(request.POST)
+    except InvalidBulkAction as e:
+        return HttpResponseBadRequest(str(e))
+
+    # Sin ids ni rango se moverían todos los eventos del organizador
+    if not ids and start is None and end is None:
+        return HttpResponseBadRequest("Seleccionar eventos o indicar un rango de fechas")
+
+    Event.reschedule_many(user, delta, ids=ids or None, start=start, end=end)
+
+    return redirect("events")
+
+
+@query_budget(4)
 @login_required
 def event_form(request, id=None):
     user = request.user
@@ -110,9 +345,8 @@ def event_form(request, id=None):
 
         if id is None:
             Event.new(title, description, scheduled_at, request.user)
-        else:
-            event = get_object_or_404(Event, pk=id)
-            event.update(title, description, scheduled_at, request.user)
+        elif not Event.update_by_id(id, title, description, scheduled_at):
+            raise Http404("No existe el evento")
 
         return redirect("events")
 
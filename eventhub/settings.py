@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.0/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -41,7 +42,10 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "app.middleware.MetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "app.middleware.QueryBudgetMiddleware",
+    "app.middleware.ReplicaRoutingMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -54,7 +58,7 @@ ROOT_URLCONF = "eventhub.urls"
 
 TEMPLATES = [
     {
-        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        "BACKEND": "app.metrics.InstrumentedDjangoTemplates",
         "DIRS": [],
         "APP_DIRS": True,
         "OPTIONS": {
@@ -70,6 +74,9 @@ TEMPLATES = [
 
 WSGI_APPLICATION = "eventhub.wsgi.application"
 
+# Vistas async para home, events y event_detail. asgi.py lo activa por defecto.
+ASYNC_VIEWS = os.environ.get("EVENTHUB_ASYNC_VIEWS") == "1"
+
 
 # Database
 # https://docs.djangoproject.com/en/5.0/ref/settings/#databases
@@ -78,7 +85,62 @@ DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": BASE_DIR / "db.sqlite3",
+        # Conexiones persistentes: cada request no vuelve a abrir el archivo ni a
+        # aplicar los PRAGMA. CONN_HEALTH_CHECKS descarta las que quedaron rotas.
+        "CONN_MAX_AGE": int(os.environ.get("EVENTHUB_CONN_MAX_AGE", 600)),
+        "CONN_HEALTH_CHECKS": True,
+    }
+}
+
+# Réplica de lectura: con EVENTHUB_REPLICA_DB los GET leen Event y User de esa
+# base (app/routers.py). En local es una copia de db.sqlite3 que actualiza
+# `python manage.py replicate_sqlite`.
+if os.environ.get("EVENTHUB_REPLICA_DB"):
+    DATABASES["replica"] = {
+        **DATABASES["default"],
+        "NAME": os.environ["EVENTHUB_REPLICA_DB"],
+        "TEST": {"MIRROR": "default"},
     }
+
+DATABASE_REPLICAS = [alias for alias in DATABASES if alias != "default"]
+
+DATABASE_ROUTERS = ["app.routers.ReplicaRouter"]
+
+# Segundos que un navegador lee de la primaria después de escribir
+REPLICA_STICKY_SECONDS = 10
+
+# Cada conexión nueva de SQLite aplica DEFAULT_SQLITE_PRAGMAS (app/sqlite.py): WAL,
+# synchronous=NORMAL, mmap, cache, busy_timeout y temp_store en memoria. Definir
+# SQLITE_PRAGMAS acá reemplaza ese perfil completo.
+
+# Escrituras con BEGIN IMMEDIATE (app/sqlite.py): si la base sigue bloqueada
+# después de busy_timeout se reintentan con backoff exponencial con jitter,
+# entre 0 y BASE * 2^intento segundos con tope MAX, hasta DEADLINE segundos.
+DB_WRITE_RETRY_DEADLINE = 10
+
+DB_WRITE_RETRY_BASE_DELAY = 0.005
+
+DB_WRITE_RETRY_MAX_DELAY = 0.5
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.0/topics/cache/
+
+# Cache por proceso. Lo que se invalida al escribir (usuario y sesiones) se guarda
+# pocos segundos; con varios procesos conviene un backend compartido (memcached, redis).
+# Al llenarse, LocMemCache descarta un tercio de las entradas: las filas renderizadas
+# del listado van en un cache aparte para no desalojar sesiones, usuarios ni los
+# buckets del throttling de login.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "OPTIONS": {"MAX_ENTRIES": 20000},
+    },
+    "event_rows": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "event_rows",
+        "OPTIONS": {"MAX_ENTRIES": 10000},
+    },
 }
 
 
@@ -100,6 +162,46 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+PASSWORD_HASHERS = [
+    "app.hashers.PBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.Argon2PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+]
+
+# Iteraciones de PBKDF2. Se calibran para cada máquina con
+# `python manage.py calibrate_password_hasher`; al cambiarlas, cada contraseña se
+# vuelve a hashear en el próximo login del usuario.
+PASSWORD_HASHER_ITERATIONS = int(os.environ.get("EVENTHUB_PASSWORD_HASHER_ITERATIONS", 1_000_000))
+
+# Duración buscada por la calibración para un hash, en milisegundos
+PASSWORD_HASHER_TARGET_MS = 100
+
+# El usuario de cada request se lee del cache; se invalida al guardar la fila.
+# ModelBackend queda después para las sesiones iniciadas antes de usar el backend
+# cacheado, que guardan su ruta: sin él esos usuarios quedarían deslogueados.
+AUTHENTICATION_BACKENDS = [
+    "app.backends.CachedModelBackend",
+    "django.contrib.auth.backends.ModelBackend",
+]
+
+# invalidate_cached_user borra la entrada solo del cache del proceso que guardó la
+# fila: con LocMemCache los demás procesos ven un cambio de rol, is_active o
+# contraseña recién al vencer. Por eso dura lo mismo que el LRU de sesiones; con
+# un cache compartido en CACHES se puede subir.
+AUTH_USER_CACHE_TIMEOUT = 5
+
+# Sesiones en base de datos con cache compartido y un LRU en memoria por proceso.
+# Un cambio de sesión hecho en otro proceso se ve después de SESSION_LOCAL_CACHE_TIMEOUT
+# segundos. Con LocMemCache, que es por proceso, la copia en CACHES tampoco dura más
+# que eso; con un cache compartido dura lo que la sesión y el logout llega a todos.
+SESSION_ENGINE = "app.sessions"
+
+SESSION_LOCAL_CACHE_SIZE = 10000
+
+SESSION_LOCAL_CACHE_TIMEOUT = 5
+
 
 STATIC_URL = "/static/"
 
@@ -134,3 +236,71 @@ LOGIN_REDIRECT_URL = "/events/"
 LOGIN_URL = "/accounts/login/"
 
 LOGOUT_REDIRECT_URL = "/accounts/login/"
+
+# Paginación del listado de eventos
+EVENTS_PAGE_SIZE = 20
+
+EVENTS_MAX_PAGE_SIZE = 100
+
+# Máximo de eventos que se pueden seleccionar en una acción en lote
+EVENTS_BULK_MAX_IDS = 1000
+
+# Máximo de días (en cualquier dirección) que se puede mover un lote de eventos
+EVENTS_BULK_MAX_DELTA_DAYS = 3650
+
+# Presupuesto de consultas por vista: "raise" lanza una excepción, "log" solo
+# registra un warning y "off" desactiva el conteo. Las vistas declaran su máximo
+# con @query_budget; QUERY_BUDGETS lo define por nombre de URL para las demás.
+QUERY_BUDGET_MODE = "raise" if DEBUG else "log"
+
+QUERY_BUDGET_MAX_REPEATS = 3
+
+QUERY_BUDGETS = {
+    "logout": 3,
+}
+
+# Métricas en formato Prometheus. Por defecto solo desde la misma máquina; agregar
+# la IP del scraper o usar METRICS_ALLOWED_IPS = None para permitir cualquier origen.
+METRICS_PATH = "/metrics"
+
+METRICS_ALLOWED_IPS = ["127.0.0.1", "::1"]
+
+METRICS_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Filas que se leen por vez al exportar eventos
+EVENTS_EXPORT_CHUNK_SIZE = 2000
+
+# Segundos que se guarda en cache cada versión generada de los feeds iCalendar
+EVENTS_FEED_CACHE_TIMEOUT = 60 * 60
+
+# Tamaño máximo (en caracteres) de un feed que se guarda en cache; los más grandes
+# se generan en cada descarga para no acumularlos en memoria
+EVENTS_FEED_CACHE_MAX_SIZE = 1024 * 1024
+
+# Segundos que se guarda en cache cada fila renderizada del listado de eventos
+EVENTS_ROW_CACHE_TIMEOUT = 60 * 60
+
+# Desde cuántas filas una escritura masiva de eventos suspende los triggers de
+# EventsVersion y mueve la versión una sola vez al final
+EVENTS_VERSION_DEFER_MIN_ROWS = 100
+
+# Cache de CACHES donde se guardan las filas renderizadas del listado de eventos
+EVENTS_ROW_CACHE_ALIAS = "event_rows"
+
+# Segundos que se guarda en cache la grilla de cada mes del calendario, por versión de eventos
+EVENTS_CALENDAR_CACHE_TIMEOUT = 60 * 60
+
+# Máximo de eventos que se muestran al abrir un día del calendario
+EVENTS_CALENDAR_DAY_LIMIT = 50
+
+# Token buckets de intentos de login como (capacidad, segundos por token): por IP
+# se permiten ráfagas de 30 y uno cada 2 segundos; por username, 5 y uno por minuto.
+# Los buckets viven en CACHES, que es LocMemCache por proceso: con N workers cada
+# cliente tiene en la práctica N veces estos límites hasta usar un cache compartido.
+LOGIN_THROTTLE_RATES = {"ip": (30, 2), "username": (5, 60)}
+
+# Proxies de confianza delante de la app (balanceador, nginx). Con 0 la IP del cliente
+# es REMOTE_ADDR; con N se toma de X-Forwarded-For la IP que agregó el proxy más
+# externo, así los clientes detrás del balanceador no comparten un solo bucket.
+# Solo subirlo si los proxies reescriben o agregan X-Forwarded-For.
+TRUSTED_PROXY_COUNT = int(os.environ.get("EVENTHUB_TRUSTED_PROXY_COUNT", 0))